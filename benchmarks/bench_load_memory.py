@@ -0,0 +1,76 @@
+"""
+Benchmark de la mémoire de pointe au chargement des tournois.
+
+Compare, avec tracemalloc, le chargement complet (document JSON entier décodé puis tournois construits)
+et le chargement en flux de TournamentRepository, qui décode et construit les tournois un par un en
+libérant chaque dictionnaire dès que son tournoi est construit. La comparaison est faite en mode complet
+et en mode paresseux, celui de l'application et de la ligne de commande, où chaque tournoi ne conserve
+que son propre dictionnaire ; le registre des joueurs est construit comme au démarrage de l'application.
+
+Usage :
+    python benchmarks/bench_load_memory.py [--tournaments 300 --players 32 --rounds 7]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+
+
+def load_full(path, lazy):
+    repository = TournamentRepository(path, lazy=lazy)
+    data = repository.load_data()
+    repository.get_player_store()
+    return repository.build_tournaments(data["tournaments"], data.get("players"))
+
+
+def load_streamed(path, lazy):
+    repository = TournamentRepository(path, lazy=lazy)
+    repository.get_player_store()
+    return repository.get_tournaments()
+
+
+def measure(function, path, lazy):
+    """
+    Retourne le temps d'exécution et la mémoire de pointe (en octets) d'un chargement.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tournaments = function(path, lazy)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tournaments
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la mémoire de pointe au chargement.")
+    parser.add_argument("--tournaments", type=int, default=300)
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = write_dataset(Path(tmp_dir) / "tournaments.json", args.tournaments, args.players, args.rounds)
+        print(f"Jeu de données : {path.stat().st_size / 1e6:.1f} Mo")
+
+        for lazy, mode in ((False, "mode complet"), (True, "mode paresseux")):
+            full_time, full_peak = measure(load_full, path, lazy)
+            streamed_time, streamed_peak = measure(load_streamed, path, lazy)
+            print(f"{mode} - document entier : {full_time:.2f} s, pointe {full_peak / 1e6:.1f} Mo")
+            print(f"{mode} - lecture en flux : {streamed_time:.2f} s, pointe {streamed_peak / 1e6:.1f} Mo "
+                  f"({1 - streamed_peak / full_peak:.0%} de moins)")
+
+
+if __name__ == "__main__":
+    main()
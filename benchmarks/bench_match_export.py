@@ -0,0 +1,54 @@
+"""
+Benchmark de l'exportation des résultats des matchs (CSV, JSON Lines et Parquet).
+
+Pour des archives comptant de plus en plus de tours, et donc de matchs, exporte tous les matchs en lisant
+les tournois un par un (TournamentRepository.iter_tournaments) et mesure, avec tracemalloc, la mémoire de
+pointe de l'exportation. Seuls le registre des joueurs et le tournoi en cours sont en mémoire : la pointe
+dépend du nombre de joueurs inscrits, mais pas du nombre de matchs exportés.
+
+Usage :
+    python benchmarks/bench_match_export.py [--tournaments 200 --players 32 --rounds 7 14 28]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from controllers import match_export  # noqa: E402
+from controllers.export_manager import ExportManager  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'exportation des résultats des matchs.")
+    parser.add_argument("--tournaments", type=int, default=200)
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[7, 14, 28])
+    args = parser.parse_args()
+
+    formats = [name for name in match_export.MATCH_SINKS if name != "parquet" or match_export.pyarrow is not None]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_manager = ExportManager(Path(tmp_dir) / "exports")
+        for rounds in args.rounds:
+            path = write_dataset(Path(tmp_dir) / f"tournaments_{rounds}.json", args.tournaments, args.players, rounds)
+            for export_format in formats:
+                gc.collect()
+                tracemalloc.start()
+                start = time.perf_counter()
+                summary = export_manager.export_matches(TournamentRepository(path).iter_tournaments(), export_format)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{rounds} tours, {export_format:8}: {summary['matches']} matchs, "
+                      f"{summary['matches'] / elapsed:.0f} matchs/s, pointe {peak / 1e6:.1f} Mo")
+
+
+if __name__ == "__main__":
+    main()
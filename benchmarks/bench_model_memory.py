@@ -0,0 +1,66 @@
+"""
+Benchmark de la mémoire occupée par les objets du modèle.
+
+Charge un jeu de données synthétique, construit tous les tournois puis mesure, avec tracemalloc, la
+mémoire qu'ils conservent une fois les dictionnaires décodés libérés. Affiche le nombre d'octets par
+match (mémoire totale conservée rapportée au nombre de matchs), la taille d'un objet de chaque classe,
+dictionnaire d'attributs compris, et le nombre d'objets score distincts.
+
+Usage :
+    python benchmarks/bench_model_memory.py [--tournaments 300 --players 32 --rounds 7]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+
+
+def object_size(obj):
+    """
+    Retourne la taille d'un objet et de son éventuel dictionnaire d'attributs, sans les objets référencés.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la mémoire des objets du modèle.")
+    parser.add_argument("--tournaments", type=int, default=300)
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = write_dataset(Path(tmp_dir) / "tournaments.json", args.tournaments, args.players, args.rounds)
+        gc.collect()
+        tracemalloc.start()
+        tournaments = TournamentRepository(path).get_tournaments()
+        for tournament in tournaments:
+            tournament.hydrate()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    rounds = [round for tournament in tournaments for round in tournament.rounds]
+    matches = [match for round in rounds for match in round.matches]
+    players = [player for tournament in tournaments for player in tournament.players]
+    print(f"{len(tournaments)} tournois, {len(players)} joueurs, {len(rounds)} tours, {len(matches)} matchs")
+    print(f"Mémoire conservée : {retained / 1e6:.1f} Mo, soit {retained / len(matches):.0f} octets par match")
+    print(f"Match : {object_size(matches[0])} octets, {len({id(match.score) for match in matches})} scores distincts")
+    print(f"Joueur : {object_size(players[0])} octets")
+    print(f"Tour : {object_size(rounds[0])} octets")
+    print(f"Tournoi : {object_size(tournaments[0])} octets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark du moteur d'appariement au système suisse.
+
+Simule des tournois complets (résultats tirés au sort) et mesure le temps d'appariement de chaque
+tour, ainsi que le nombre de revanches produites.
+
+Usage :
+    python benchmarks/bench_pairing.py [--players 500 1000 2000 --rounds 11]
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from controllers.swiss_pairing import SwissPairing  # noqa: E402
+from models.match import Match  # noqa: E402
+from models.player import Player  # noqa: E402
+from models.round import Round  # noqa: E402
+from models.tournament import Tournament  # noqa: E402
+
+
+def simulate(n_players, n_rounds, seed=0):
+    """
+    Simule un tournoi et retourne les temps d'appariement de chaque tour et le nombre de revanches.
+    """
+    rng = random.Random(seed)
+    tournament = Tournament(name="Benchmark", location="Paris", start_date=datetime.date(2024, 1, 1),
+                            end_date=datetime.date(2024, 1, 3), description="", number_of_rounds=n_rounds)
+    for index in range(n_players):
+        tournament.add_player(Player(first_name="Joueur", last_name=str(index),
+                                     birth_date=datetime.date(1990, 1, 1), chess_id=f"BM{index:05d}"))
+
+    engine = SwissPairing(rng=rng)
+    timings = []
+    seen = set()
+    rematches = 0
+    for r_index in range(n_rounds):
+        start = time.perf_counter()
+        pairs, bye = engine.pair(tournament)
+        timings.append(time.perf_counter() - start)
+
+        round = Round(name=f"Round {r_index + 1}", bye=bye)
+        if bye is not None:
+            bye.score += 1
+        for match_id, players in enumerate(pairs, start=1):
+            key = frozenset(p.chess_id for p in players)
+            rematches += key in seen
+            seen.add(key)
+            match = Match(id=match_id, players=players, score=rng.choice([(1, 0), (0, 1), (0.5, 0.5)]))
+            match.update_player_scores()
+            round.add_match(match)
+        tournament.add_round(round)
+    return timings, rematches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'appariement suisse.")
+    parser.add_argument("--players", type=int, nargs="+", default=[500, 1000, 2000])
+    parser.add_argument("--rounds", type=int, default=11)
+    args = parser.parse_args()
+
+    for n_players in args.players:
+        timings, rematches = simulate(n_players, args.rounds)
+        print(f"{n_players} joueurs x {args.rounds} tours : max {max(timings) * 1000:.1f} ms, "
+              f"moyenne {sum(timings) / len(timings) * 1000:.1f} ms par tour, revanches : {rematches}")
+
+
+if __name__ == "__main__":
+    main()
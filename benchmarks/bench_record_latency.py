@@ -0,0 +1,68 @@
+"""
+Benchmark de la latence d'enregistrement d'un résultat de match.
+
+Compare l'écriture synchrone du journal (une ligne synchronisée sur le disque par résultat) et
+l'écriture différée de WriteBehindStore, où enregistrer un résultat ne fait que le mettre en attente ;
+le fil d'écriture regroupe ensuite les résultats reçus dans un seul événement.
+
+Usage :
+    python benchmarks/bench_record_latency.py [--tournaments 20 --players 32 --rounds 7]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from controllers.tournament_manager import TournamentManager  # noqa: E402
+from storage.journal_store import JournalStore  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+from storage.write_behind import DEFAULT_FLUSH_INTERVAL  # noqa: E402
+
+
+def record_round(path, flush_interval):
+    """
+    Rejoue le premier tour de chaque tournoi et retourne la latence moyenne d'un résultat (en secondes),
+    ainsi que la durée totale, écriture finale comprise.
+    """
+    repository = TournamentRepository(path, flush_interval=flush_interval)
+    manager = TournamentManager(path, repository)
+    manager.load_tournaments_from_file()
+    for tournament in manager.tournaments:
+        tournament.current_round = 0
+        tournament.rounds = []
+
+    durations = []
+    start = time.perf_counter()
+    for tournament in manager.tournaments:
+        round = manager.start_round(tournament)
+        for match in round.matches:
+            match.score = (1.0, 0.0)
+            before = time.perf_counter()
+            manager.record_match_result(tournament, round, match)
+            durations.append(time.perf_counter() - before)
+    repository.store.close()
+    return sum(durations) / len(durations), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la latence d'enregistrement d'un résultat.")
+    parser.add_argument("--tournaments", type=int, default=20)
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, flush_interval in (("Écriture synchrone", None), ("Écriture différée", DEFAULT_FLUSH_INTERVAL)):
+            path = write_dataset(Path(tmp_dir) / "tournaments.json", args.tournaments, args.players, args.rounds)
+            JournalStore(path).journal_path.unlink(missing_ok=True)
+            latency, total = record_round(path, flush_interval)
+            print(f"{label} : {latency * 1e6:.1f} µs par résultat, {total:.2f} s au total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de la recherche des joueurs (PlayerSearchIndex).
+
+Génère un registre de joueurs aux noms variés, construit l'index de recherche puis mesure la latence
+des recherches par préfixe, par prénom et nom partiels, par début de chess_id et avec une faute de
+frappe, ainsi que le coût d'un ajout incrémental.
+
+Usage :
+    python benchmarks/bench_search.py [--players 200000 --queries 2000 --limit 10]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import FIRST_NAMES  # noqa: E402
+from storage.search_index import PlayerSearchIndex  # noqa: E402
+
+SYLLABLES = ["ba", "ber", "bou", "cha", "che", "da", "du", "fa", "fon", "ga", "gui", "la", "le", "lou", "ma",
+             "mar", "mo", "na", "ne", "pa", "pe", "ra", "ro", "sa", "si", "ta", "tin", "vau", "vi", "zo"]
+
+
+def generate_players(count, rng):
+    players = []
+    for index in range(count):
+        last_name = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+        players.append({
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": last_name,
+            "birth_date": "2000-01-01",
+            "chess_id": "".join(rng.choices(string.ascii_uppercase, k=2)) + f"{index:05d}"[-5:],
+        })
+    return players
+
+
+def with_typo(word, rng):
+    index = rng.randrange(len(word))
+    return word[:index] + rng.choice(string.ascii_lowercase) + word[index + 1:]
+
+
+def measure(index, queries, limit):
+    """
+    Retourne la latence moyenne et le 99e centile (en secondes) d'une série de recherches.
+    """
+    durations = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, limit)
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return sum(durations) / len(durations), durations[int(len(durations) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la recherche des joueurs.")
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    players = generate_players(args.players, rng)
+    start = time.perf_counter()
+    index = PlayerSearchIndex(players)
+    print(f"Construction de l'index ({args.players} joueurs) : {time.perf_counter() - start:.2f} s")
+
+    sample = rng.sample(players, args.queries)
+    series = {
+        "Préfixe du nom (3 lettres)": [p["last_name"][:3] for p in sample],
+        "Prénom et début du nom": [f"{p['first_name']} {p['last_name'][:4]}" for p in sample],
+        "Début de chess_id": [p["chess_id"][:5] for p in sample],
+        "Nom avec une faute de frappe": [with_typo(p["last_name"].lower(), rng) for p in sample],
+    }
+    for label, queries in series.items():
+        mean, p99 = measure(index, queries, args.limit)
+        print(f"{label} : {mean * 1e6:.0f} µs en moyenne, {p99 * 1e6:.0f} µs au 99e centile")
+
+    new_players = generate_players(1000, random.Random(1))
+    start = time.perf_counter()
+    for p_data in new_players:
+        index.add(dict(p_data, chess_id="ZZ" + p_data["chess_id"][2:]))
+    print(f"Ajout incrémental : {(time.perf_counter() - start) / len(new_players) * 1e6:.0f} µs par joueur")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark du démarrage de l'application.
+
+Mesure le temps jusqu'au premier menu (construction d'ApplicationController et liste des noms des
+tournois) sur un jeu de données synthétique, ainsi que le nombre de lectures du fichier et d'objets
+Tournament construits. Le chargement complet des tournois et l'ancien chemin de démarrage, qui lisait
+et reconstruisait les tournois deux fois, sont mesurés à titre de comparaison.
+
+Usage :
+    python benchmarks/bench_startup.py [--tournaments 900 --players 32 --rounds 7]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from controllers.application_controller import ApplicationController  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage de l'application.")
+    parser.add_argument("--tournaments", type=int, default=900)
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = write_dataset(Path(tmp_dir) / "tournaments.json", args.tournaments, args.players, args.rounds)
+        print(f"Jeu de données : {path.stat().st_size / 1e6:.1f} Mo")
+
+        start = time.perf_counter()
+        app = ApplicationController(path)
+        app.report_manager.get_tournament_names()
+        first_menu = time.perf_counter() - start
+        print(f"Premier menu (chargement paresseux) : {first_menu:.2f} s, "
+              f"lectures : {app.repository.parse_count}, tournois construits : {app.repository.build_count}")
+
+        start = time.perf_counter()
+        TournamentRepository(path).get_tournaments()
+        eager = time.perf_counter() - start
+        print(f"Chargement complet (une lecture) : {eager:.2f} s")
+
+        start = time.perf_counter()
+        for _ in range(2):
+            TournamentRepository(path).get_tournaments()
+        legacy = time.perf_counter() - start
+        print(f"Ancien démarrage (deux lectures) : {legacy:.2f} s, "
+              f"rapport : {legacy / eager:.2f}x (complet), {legacy / first_menu:.2f}x (paresseux)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Suite de benchmarks des chemins principaux de l'application.
+
+Pour chaque échelle (tournois x joueurs x tours), un jeu de données synthétique est généré à partir
+d'une graine, puis sont mesurés : le chargement des tournois, leur sauvegarde, l'appariement d'un
+tour, le chargement des joueurs par ReportManager, chaque rapport d'affichage et les exports texte et
+HTML. Chaque mesure est le meilleur temps sur plusieurs répétitions.
+
+Les résultats sont écrits dans un fichier JSON. Avec --baseline, ils sont comparés à un fichier de
+résultats de référence et les régressions sont signalées (code de retour 1).
+
+Usage :
+    python benchmarks/bench_suite.py --output resultats.json
+    python benchmarks/bench_suite.py --scales 100x32x7 --baseline reference.json --threshold 0.25
+    python benchmarks/bench_suite.py --results resultats.json --baseline reference.json
+"""
+
+import argparse
+import datetime
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dataset_generator import write_dataset  # noqa: E402
+from controllers.export_manager import ExportManager  # noqa: E402
+from controllers.report_manager import ReportManager  # noqa: E402
+from controllers.tournament_manager import TournamentManager  # noqa: E402
+from controllers.user_manager import UserManager  # noqa: E402
+from models.round import Round  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+from views import report_view, tournament_view  # noqa: E402
+
+DEFAULT_SCALES = ["20x8x4", "100x32x7", "200x64x9"]
+
+# En dessous de cet écart absolu (en secondes), une différence est considérée comme du bruit.
+NOISE_FLOOR = 0.002
+
+
+def parse_scale(text):
+    """
+    Convertit une échelle "TxPxR" en triplet (tournois, joueurs, tours).
+    """
+    n_tournaments, n_players, n_rounds = (int(value) for value in text.lower().split("x"))
+    return n_tournaments, n_players, n_rounds
+
+
+def best_of(repeat, function, setup=None):
+    """
+    Retourne le meilleur temps d'exécution de function sur repeat répétitions.
+
+    La fonction setup, si elle est fournie, est appelée avant chaque répétition, hors chronométrage.
+    """
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_scale(scale, repeat, work_dir):
+    """
+    Exécute tous les benchmarks pour une échelle donnée.
+
+    Returns:
+        dict: Le meilleur temps (en secondes) de chaque benchmark.
+    """
+    path = write_dataset(work_dir / f"{scale}.json", *parse_scale(scale))
+    results = {}
+
+    manager = TournamentManager(path)
+
+    def fresh_repository():
+        manager.repository = TournamentRepository(path)
+        manager.store = manager.repository.store
+
+    results["tournament_manager.load_tournaments_from_file"] = best_of(
+        repeat, manager.load_tournaments_from_file, fresh_repository)
+    results["tournament_manager.save_tournaments"] = best_of(repeat, manager.save_tournaments)
+
+    tournaments = manager.get_all_tournaments()
+    results["tournament_manager.generate_matches"] = best_of(
+        repeat, lambda: [manager.generate_matches(t, Round(name="Benchmark")) for t in tournaments])
+
+    report_manager = ReportManager(manager, UserManager(path), work_dir / "rapports")
+
+    def load_players():
+        report_manager.user_manager = UserManager(path, manager.repository.get_player_store())
+        report_manager.load_data()
+        report_manager.user_manager.get_all_players()
+
+    results["report_manager.load_data"] = best_of(repeat, load_players)
+    players = report_manager.user_manager.get_all_players()
+
+    reports = {
+        "report_view.display_all_players_alphabetically":
+            lambda: report_view.display_all_players_alphabetically(players),
+        "report_view.display_all_tournaments": lambda: report_view.display_all_tournaments(tournaments),
+    }
+    for view in (report_view, tournament_view):
+        for name in ("display_tournament_details", "display_tournament_players_alphabetically",
+                     "display_tournament_rounds_and_matches", "display_final_scores"):
+            function = getattr(view, name, None)
+            if function is not None:
+                reports[f"{view.__name__.split('.')[-1]}.{name}"] = _for_each(function, tournaments)
+
+    export_manager = ExportManager(work_dir / "rapports")
+    exports = {
+        "export_manager.export_report.all_players": lambda: export_manager.export_report(
+            "all_players.txt", report_view.render_all_players_alphabetically(players)),
+        "export_manager.export_report_html.all_players": lambda: export_manager.export_report_html(
+            "all_players.html", report_view.render_all_players_alphabetically(players)),
+        "export_manager.export_report.rounds": lambda: [export_manager.export_report(
+            f"rounds_{t.name}.txt", report_view.render_tournament_rounds_and_matches(t)) for t in tournaments],
+        "export_manager.export_report_html.rounds": lambda: [export_manager.export_report_html(
+            f"rounds_{t.name}.html", report_view.render_tournament_rounds_and_matches(t)) for t in tournaments],
+    }
+    with redirect_stdout(io.StringIO()):
+        for name, function in {**reports, **exports}.items():
+            results[name] = best_of(repeat, function)
+    return results
+
+
+def _for_each(function, tournaments):
+    return lambda: [function(tournament) for tournament in tournaments]
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare des résultats à une référence et affiche un tableau des écarts.
+
+    Une mesure est une régression si elle est plus lente que la référence de plus de threshold (en
+    proportion) et d'au moins NOISE_FLOOR secondes.
+
+    Returns:
+        list: Les régressions, sous la forme "échelle benchmark".
+    """
+    regressions = []
+    for scale, benchmarks in results.items():
+        for name, seconds in benchmarks.items():
+            reference = baseline.get(scale, {}).get(name)
+            if reference is None:
+                continue
+            ratio = seconds / reference if reference else float("inf")
+            regressed = ratio > 1 + threshold and seconds - reference > NOISE_FLOOR
+            flag = "RÉGRESSION" if regressed else ""
+            print(f"{scale:>12} {name:<60} {reference * 1000:10.2f} ms {seconds * 1000:10.2f} ms {ratio:6.2f}x {flag}")
+            if regressed:
+                regressions.append(f"{scale} {name}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de l'application.")
+    parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES, help="Échelles TxPxR à mesurer.")
+    parser.add_argument("--repeat", type=int, default=3, help="Nombre de répétitions de chaque mesure.")
+    parser.add_argument("--output", help="Fichier JSON où écrire les résultats.")
+    parser.add_argument("--results", help="Fichier de résultats existant à comparer, au lieu de mesurer.")
+    parser.add_argument("--baseline", help="Fichier de résultats de référence.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Ralentissement toléré (0.25 = 25 %%).")
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results, "r", encoding="utf-8") as file:
+            report = json.load(file)
+    else:
+        report = {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": {}
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for scale in args.scales:
+                report["results"][scale] = run_scale(scale, args.repeat, Path(tmp_dir))
+                for name, seconds in report["results"][scale].items():
+                    print(f"{scale:>12} {name:<60} {seconds * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+        print(f"Résultats écrits dans {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(report["results"], baseline["results"], args.threshold)
+        if regressions:
+            print(f"{len(regressions)} régression(s) :\n" + "\n".join(regressions))
+            sys.exit(1)
+        print("Aucune régression.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Générateur de jeux de données synthétiques pour les benchmarks.
+
+Ce module produit, à partir d'une graine, des données de tournois au format du fichier
+tournaments.json : un registre de joueurs indexé par chess_id et des tournois dont les tours et
+les matchs référencent les joueurs par leur chess_id.
+"""
+
+import argparse
+import datetime
+import json
+import random
+import string
+from pathlib import Path
+
+FIRST_NAMES = ["Jean", "Marie", "Pierre", "Sophie", "Lucas", "Emma", "Hugo", "Chloe", "Louis", "Lea",
+               "Nora", "Omar", "Quincy", "Jane", "John", "Ines", "Paul", "Sarah", "Jules", "Alice"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy",
+              "Moreau", "Simon", "Laurent", "Michel", "Garcia", "David", "Bertrand", "Roux", "Khan", "Ali", "Doe"]
+
+
+def generate_dataset(n_tournaments, n_players, n_rounds, seed=0):
+    """
+    Génère un jeu de données de tournois terminés.
+
+    Args:
+        n_tournaments (int): Le nombre de tournois.
+        n_players (int): Le nombre de joueurs par tournoi (arrondi au nombre pair inférieur).
+        n_rounds (int): Le nombre de tours par tournoi.
+        seed (int): La graine du générateur aléatoire.
+
+    Returns:
+        dict: Les données, sous la forme {"players": {...}, "tournaments": [...]}.
+    """
+    rng = random.Random(seed)
+    n_players -= n_players % 2
+    registry = {}
+    tournaments = []
+    for t_index in range(n_tournaments):
+        start = datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(9000))
+        roster = []
+        for _ in range(n_players):
+            chess_id = _new_chess_id(rng, registry)
+            registry[chess_id] = {
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "birth_date": (datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randrange(20000))).isoformat(),
+                "chess_id": chess_id
+            }
+            roster.append(chess_id)
+
+        scores = dict.fromkeys(roster, 0.0)
+        rounds = []
+        for r_index in range(n_rounds):
+            rng.shuffle(roster)
+            matches = []
+            for m_index in range(0, n_players, 2):
+                score = rng.choice([(1, 0), (0, 1), (0.5, 0.5)])
+                scores[roster[m_index]] += score[0]
+                scores[roster[m_index + 1]] += score[1]
+                matches.append({"id": m_index // 2 + 1, "players": [roster[m_index], roster[m_index + 1]],
+                                "score": list(score)})
+            round_start = datetime.datetime.combine(start, datetime.time(9)) + datetime.timedelta(hours=3 * r_index)
+            rounds.append({
+                "name": f"Round {r_index + 1}",
+                "matches": matches,
+                "start_time": round_start.isoformat(),
+                "end_time": (round_start + datetime.timedelta(hours=2)).isoformat()
+            })
+
+        tournaments.append({
+            "name": f"Tournoi {t_index + 1}",
+            "location": rng.choice(["Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux"]),
+            "start_date": start.isoformat(),
+            "end_date": (start + datetime.timedelta(days=2)).isoformat(),
+            "description": "Tournoi synthétique",
+            "number_of_rounds": n_rounds,
+            "current_round": n_rounds,
+            "players": [{"chess_id": chess_id, "score": scores[chess_id]} for chess_id in roster],
+            "rounds": rounds
+        })
+    return {"players": registry, "tournaments": tournaments}
+
+
+def write_dataset(path, n_tournaments, n_players, n_rounds, seed=0):
+    """
+    Génère un jeu de données et l'écrit au format de tournaments.json.
+
+    Args:
+        path (str): Le chemin du fichier à écrire.
+        n_tournaments (int): Le nombre de tournois.
+        n_players (int): Le nombre de joueurs par tournoi.
+        n_rounds (int): Le nombre de tours par tournoi.
+        seed (int): La graine du générateur aléatoire.
+
+    Returns:
+        Path: Le chemin du fichier écrit.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as file:
+        json.dump(generate_dataset(n_tournaments, n_players, n_rounds, seed), file, indent=4, ensure_ascii=False)
+    return path
+
+
+def _new_chess_id(rng, registry):
+    while True:
+        chess_id = "".join(rng.choices(string.ascii_uppercase, k=2)) + "".join(rng.choices(string.digits, k=5))
+        if chess_id not in registry:
+            return chess_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère un fichier de tournois synthétique.")
+    parser.add_argument("path")
+    parser.add_argument("--tournaments", type=int, default=100)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    path = write_dataset(args.path, args.tournaments, args.players, args.rounds, args.seed)
+    print(f"{path} : {path.stat().st_size / 1e6:.1f} Mo")
+
+
+if __name__ == "__main__":
+    main()
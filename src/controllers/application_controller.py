@@ -1,12 +1,13 @@
 from pathlib import Path
-import json
 from datetime import datetime
+from storage.tournament_repository import TournamentRepository
+from storage.write_behind import DEFAULT_FLUSH_INTERVAL
 from controllers.tournament_manager import TournamentManager
 from controllers.user_manager import UserManager
 from controllers.report_manager import ReportManager
 from views.menu_view import display_welcome, display_main_menu, display_tournament_selection, display_report_menu
 from views.tournament_view import get_tournament_data
-from views.player_view import get_player_data
+from views.player_view import get_player_data, get_roster_size, get_player_query, choose_player
 
 
 class ApplicationController:
@@ -14,7 +15,8 @@ class ApplicationController:
     Contrôleur principal pour l'application de gestion de tournois d'échecs.
 
     Attributes:
-        file_path (Path): Le chemin vers le fichier JSON contenant les données.
+        file_path (Path): Le chemin vers le fichier de données (JSON ou base SQLite).
+        repository (TournamentRepository): Le dépôt des tournois, partagé par tous les gestionnaires.
         user_manager (UserManager): Le gestionnaire des utilisateurs.
         tournament_manager (TournamentManager): Le gestionnaire des tournois.
         report_manager (ReportManager): Le gestionnaire des rapports.
@@ -28,21 +30,19 @@ class ApplicationController:
             filepath (str): Le chemin vers le fichier JSON contenant les données.
         """
         self.file_path = Path(filepath)
-        self.user_manager = UserManager(filepath)
-        self.tournament_manager = TournamentManager(filepath)
+        self.repository = TournamentRepository(self.file_path, lazy=True, flush_interval=DEFAULT_FLUSH_INTERVAL)
+        self.user_manager = UserManager(filepath, self.repository.get_player_store())
+        self.tournament_manager = TournamentManager(filepath, self.repository)
         self.report_manager = ReportManager(self.tournament_manager, self.user_manager)
 
     def load_data(self):
         """
-        Charge les données depuis le fichier JSON spécifié.
+        Retourne les données brutes du dépôt partagé, lues une seule fois.
 
         Returns:
             dict: Les données chargées.
         """
-        if self.file_path.exists():
-            with self.file_path.open('r', encoding='utf-8') as file:
-                return json.load(file)
-        return {}
+        return self.repository.load_data()
 
     def start(self):
         """
@@ -77,6 +77,7 @@ class ApplicationController:
             elif choice == '3':
                 self.reset_tournament()
             elif choice == '4':
+                self.tournament_manager.flush()
                 print("Merci d'avoir utilisé le logiciel de tournoi d'échecs ! À bientôt !")
                 break  # Quitter l'application
             else:
@@ -108,6 +109,9 @@ class ApplicationController:
     def create_new_tournament(self):
         """
         Crée un nouveau tournoi en demandant les détails du tournoi et des joueurs à l'utilisateur.
+
+        Chaque joueur est choisi parmi les joueurs inscrits (par chess_id ou par nom) ou saisi comme
+        nouveau joueur.
         """
         tournament_data = get_tournament_data()
         if isinstance(tournament_data['start_date'], datetime):
@@ -115,12 +119,28 @@ class ApplicationController:
         if isinstance(tournament_data['end_date'], datetime):
             tournament_data['end_date'] = tournament_data['end_date'].strftime("%Y-%m-%d")
 
+        roster_size = get_roster_size()
         players = []
-        for i in range(1, 9):  # Ajoutez des joueurs au tournoi
-            player_data = get_player_data(i)
-            if isinstance(player_data['birth_date'], datetime):
-                player_data['birth_date'] = player_data['birth_date'].strftime("%Y-%m-%d")
-            player_data['chess_id'] = self.user_manager.generate_unique_chess_id()
+        selected = set()
+        while len(players) < roster_size:  # Ajoutez des joueurs au tournoi
+            number = len(players) + 1
+            query = get_player_query(number)
+            if not query:
+                player_data = get_player_data(number)
+                if isinstance(player_data['birth_date'], datetime):
+                    player_data['birth_date'] = player_data['birth_date'].strftime("%Y-%m-%d")
+                player_data['chess_id'] = self.user_manager.generate_unique_chess_id()
+            else:
+                candidates = [p for p in self.user_manager.find_players(query) if p.chess_id not in selected]
+                if not candidates:
+                    print("\033[31mAucun joueur inscrit disponible ne correspond à cette recherche.\033[0m")
+                    continue
+                player = candidates[0] if len(candidates) == 1 else choose_player(candidates)
+                if player is None:
+                    continue
+                print(f"Joueur {number} : {player.first_name} {player.last_name} ({player.chess_id})")
+                player_data = {'chess_id': player.chess_id}
+            selected.add(player_data['chess_id'])
             players.append(player_data)
         tournament_data['players'] = players
 
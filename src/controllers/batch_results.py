@@ -0,0 +1,47 @@
+"""
+Module pour la lecture des lots de résultats de matchs.
+
+Ce module contient la fonction read_result_rows qui lit un lot de résultats saisis hors de
+l'application (fichier CSV ou JSON) afin de l'appliquer avec TournamentManager.apply_results.
+"""
+
+import csv
+from pathlib import Path
+from storage import codec
+
+RESULT_FIELDS = ("tournament", "round", "match", "result")
+
+
+def read_result_rows(path):
+    """
+    Lit un lot de résultats de matchs.
+
+    Le fichier CSV doit avoir l'en-tête tournament,round,match,result (séparateur virgule ou
+    point-virgule). Le fichier JSON contient une liste d'objets ayant ces clés, éventuellement sous
+    la clé "results".
+
+    Args:
+        path (str): Le chemin du fichier CSV ou JSON.
+
+    Returns:
+        list: La liste des lignes, sous forme de dictionnaires.
+
+    Raises:
+        ValueError: Si une colonne obligatoire est absente.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        rows = codec.load(path)
+        if isinstance(rows, dict):
+            rows = rows.get("results", [])
+    else:
+        with path.open("r", encoding="utf-8", newline="") as file:
+            sample = file.readline()
+            file.seek(0)
+            delimiter = ";" if sample.count(";") > sample.count(",") else ","
+            rows = list(csv.DictReader(file, delimiter=delimiter))
+
+    missing = [name for name in RESULT_FIELDS if rows and name not in rows[0]]
+    if missing:
+        raise ValueError(f"Missing columns in {path}: {', '.join(missing)}")
+    return rows
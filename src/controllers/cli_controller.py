@@ -0,0 +1,342 @@
+"""
+Module pour la ligne de commande non interactive.
+
+Ce module contient la classe CommandLineController qui expose les opérations courantes (création
+d'un tournoi, appariement du tour suivant, saisie des résultats, rapports, exportation et
+réinitialisation) sous forme de sous-commandes, sans passer par les menus interactifs. Il permet
+d'automatiser l'application et de mesurer ses opérations sur de gros jeux de données.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from storage import codec
+from storage.tournament_repository import TournamentRepository
+from storage.write_behind import DEFAULT_FLUSH_INTERVAL
+from controllers.tournament_manager import TournamentManager
+from controllers.user_manager import UserManager
+from controllers.report_manager import ReportManager, REPORTS
+from controllers.export_manager import ExportManager
+from controllers.match_export import MATCH_SINKS
+from controllers.batch_results import read_result_rows
+from controllers.player_import import read_player_rows
+from views.report_sinks import TerminalSink
+
+EXPORT_FORMATS = {"txt": ("txt",), "html": ("html",), "both": ("txt", "html")}
+
+
+class CommandLineController:
+    """
+    Contrôleur des sous-commandes non interactives.
+
+    Attributes:
+        file_path (Path): Le chemin vers le fichier de données (JSON ou base SQLite).
+        repository (TournamentRepository): Le dépôt des tournois, partagé par tous les gestionnaires.
+        user_manager (UserManager): Le gestionnaire des utilisateurs.
+        tournament_manager (TournamentManager): Le gestionnaire des tournois.
+        report_manager (ReportManager): Le gestionnaire des rapports.
+    """
+
+    def __init__(self, filepath, export_dir='src/rapports', sequential_ids=False):
+        """
+        Initialise la classe CommandLineController.
+
+        Args:
+            filepath (str): Le chemin vers le fichier de données.
+            export_dir (str): Le répertoire d'exportation des rapports.
+            sequential_ids (bool): Si True, les chess_id des nouveaux joueurs sont attribués dans l'ordre.
+        """
+        self.file_path = Path(filepath)
+        self.export_dir = export_dir
+        self.repository = TournamentRepository(self.file_path, lazy=True, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                                               sequential_ids=sequential_ids)
+        self._user_manager = None
+        self._tournament_manager = None
+        self._report_manager = None
+
+    # Les gestionnaires ne sont créés qu'à leur premier usage : une sous-commande qui parcourt les tournois
+    # un par un (export-matches) ou qui ne porte que sur les joueurs ne charge pas tous les tournois.
+    @property
+    def user_manager(self):
+        if self._user_manager is None:
+            self._user_manager = UserManager(self.file_path, self.repository.get_player_store())
+        return self._user_manager
+
+    @property
+    def tournament_manager(self):
+        if self._tournament_manager is None:
+            self._tournament_manager = TournamentManager(self.file_path, self.repository)
+        return self._tournament_manager
+
+    @property
+    def report_manager(self):
+        if self._report_manager is None:
+            self._report_manager = ReportManager(self.tournament_manager, self.user_manager, self.export_dir)
+        return self._report_manager
+
+    def run(self, args):
+        """
+        Exécute la sous-commande demandée.
+
+        Args:
+            args (argparse.Namespace): Les arguments de la ligne de commande.
+
+        Returns:
+            int: Le code de retour du programme (0 en cas de succès, 1 en cas d'erreur).
+        """
+        commands = {
+            "create": lambda: self.create_tournaments(args.file),
+            "import-players": lambda: self.import_players(args.file),
+            "search": lambda: self.search_players(args.query, args.limit),
+            "pair": lambda: self.pair_next_round(args.tournament, args.quiet),
+            "results": lambda: self.record_results(args.file),
+            "report": lambda: self.print_report(args.kind, args.tournament),
+            "export": lambda: self.export_report(args.kind, args.tournament, args.format),
+            "export-all": lambda: self.export_all(args.format, args.workers, args.force),
+            "export-matches": lambda: self.export_matches(args.format, args.name),
+            "reset": lambda: self.reset(args.tournament, args.all),
+        }
+        try:
+            try:
+                commands[args.command]()
+            finally:
+                # Les modifications en attente d'écriture sont écrites même si la commande échoue.
+                self.repository.store.close()
+        except (KeyError, ValueError, OSError) as error:
+            print(f"Erreur : {error}", file=sys.stderr)
+            return 1
+        return 0
+
+    def create_tournaments(self, path):
+        """
+        Crée un ou plusieurs tournois décrits dans un fichier JSON.
+
+        Le fichier contient un tournoi, une liste de tournois ou un objet {"tournaments": [...]}. Les
+        joueurs déjà inscrits peuvent être désignés par leur seul chess_id ; un chess_id est attribué
+        aux nouveaux joueurs qui n'en ont pas. Tous les tournois du fichier sont validés avant d'être
+        ajoutés : si l'un d'eux est invalide, aucun n'est créé.
+
+        Args:
+            path (str): Le chemin du fichier JSON.
+        """
+        data = codec.load(path)
+        if isinstance(data, dict):
+            data = data.get("tournaments", [data])
+
+        ids = self.user_manager.store.ids
+        for tournament_data in data:
+            # Un joueur inscrit peut être désigné par son seul chess_id.
+            players_data = [{"chess_id": p_data} if isinstance(p_data, str) else p_data
+                            for p_data in tournament_data.get("players", [])]
+            tournament_data["players"] = players_data
+            ids.update(p_data["chess_id"] for p_data in players_data if p_data.get("chess_id"))
+            missing = [p_data for p_data in players_data if not p_data.get("chess_id")]
+            for p_data, chess_id in zip(missing, ids.allocate(len(missing))):
+                p_data["chess_id"] = chess_id
+        self.tournament_manager.add_tournaments(data)
+
+    def import_players(self, path):
+        """
+        Importe une liste de joueurs (CSV ou TSV) et affiche le débit obtenu.
+
+        Args:
+            path (str): Le chemin de la liste des joueurs.
+        """
+        start = time.perf_counter()
+        summary = self.user_manager.import_players(read_player_rows(path))
+        self.tournament_manager.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{summary['rows']} lignes lues en {elapsed:.3f} s ({summary['rows'] / elapsed if elapsed else 0:.0f} "
+              f"lignes/s) : {summary['added']} joueurs ajoutés, {summary['updated']} mis à jour, "
+              f"{summary['unchanged']} inchangés, {summary['duplicates']} doublons, "
+              f"{len(summary['rejected'])} lignes rejetées.")
+        for message in summary["rejected"][:20]:
+            print(f"  {message}")
+        if len(summary["rejected"]) > 20:
+            print(f"  ... et {len(summary['rejected']) - 20} autres lignes rejetées.")
+
+    def search_players(self, query, limit=10):
+        """
+        Recherche des joueurs inscrits par nom partiel ou approximatif, ou par début de chess_id.
+
+        Args:
+            query (str): La recherche.
+            limit (int): Le nombre maximal de joueurs affichés.
+        """
+        players = self.user_manager.search(query, limit)
+        if not players:
+            print("Aucun joueur ne correspond à cette recherche.")
+        for player in players:
+            print(f"{player.chess_id}  {player.first_name} {player.last_name} (né le {player.birth_date})")
+
+    def pair_next_round(self, tournament_name, quiet=False):
+        """
+        Apparie le prochain tour d'un tournoi et affiche ses matchs.
+
+        Args:
+            tournament_name (str): Le nom du tournoi.
+            quiet (bool): Si True, seul le résumé de l'appariement est affiché.
+        """
+        tournament = self.tournament_manager.get_tournament_details(tournament_name)
+        start = time.perf_counter()
+        round = self.tournament_manager.start_round(tournament)
+        elapsed = time.perf_counter() - start
+        print(f"{tournament.name} - {round.name} : {len(round.matches)} matchs en {elapsed:.3f} s.")
+        if quiet:
+            return
+        for match in round.matches:
+            white, black = match.players
+            print(f"Match {match.id} : {white.first_name} {white.last_name} ({white.chess_id}) - "
+                  f"{black.first_name} {black.last_name} ({black.chess_id})")
+        if round.bye is not None:
+            print(f"Exempt : {round.bye.first_name} {round.bye.last_name} ({round.bye.chess_id})")
+
+    def record_results(self, path):
+        """
+        Applique un lot de résultats (CSV ou JSON) et affiche le débit obtenu.
+
+        Args:
+            path (str): Le chemin du fichier de résultats.
+        """
+        rows = read_result_rows(path)
+        start = time.perf_counter()
+        summary = self.tournament_manager.apply_results(rows)
+        elapsed = time.perf_counter() - start
+        print(f"{summary['applied']} résultats appliqués en {elapsed:.3f} s "
+              f"({summary['applied'] / elapsed if elapsed else 0:.0f} résultats/s).")
+        for round_name in summary["completed_rounds"]:
+            print(f"Tour terminé : {round_name}")
+
+    def print_report(self, kind, tournament_name=None):
+        """
+        Affiche un rapport sans mise en forme pour le terminal.
+
+        Args:
+            kind (str): Le type de rapport.
+            tournament_name (str): Le nom du tournoi, pour les rapports portant sur un tournoi.
+        """
+        _, chunks = self.report_manager.get_report(kind, tournament_name)
+        TerminalSink(styled=False).write(chunks)
+
+    def export_report(self, kind, tournament_name=None, export_format="txt"):
+        """
+        Exporte un rapport au format texte, HTML ou les deux.
+
+        Args:
+            kind (str): Le type de rapport.
+            tournament_name (str): Le nom du tournoi, pour les rapports portant sur un tournoi.
+            export_format (str): "txt", "html" ou "both".
+        """
+        self.report_manager.export(kind, tournament_name, EXPORT_FORMATS[export_format])
+
+    def export_all(self, export_format="both", workers=None, force=False):
+        """
+        Exporte les rapports de tous les tournois en parallèle et affiche le débit obtenu.
+
+        Args:
+            export_format (str): "txt", "html" ou "both".
+            workers (int): Le nombre de processus. Par défaut, le nombre de processeurs.
+            force (bool): Si True, les rapports des tournois inchangés sont aussi régénérés.
+        """
+        summary = self.report_manager.export_all(EXPORT_FORMATS[export_format], workers, force)
+        elapsed = summary["elapsed"]
+        print(f"{summary['files']} fichiers exportés pour {summary['tournaments']} tournois en {elapsed:.2f} s "
+              f"({summary['files'] / elapsed if elapsed else 0:.0f} fichiers/s).")
+        if summary["skipped"]:
+            print(f"{summary['skipped']} tournois inchangés depuis la dernière exportation ont été ignorés "
+                  f"(--force pour les régénérer).")
+
+    def export_matches(self, export_format="csv", filename="matches"):
+        """
+        Exporte les résultats de tous les matchs de tous les tournois, lus un tournoi à la fois.
+
+        Args:
+            export_format (str): "csv", "jsonl" ou "parquet".
+            filename (str): Le nom du fichier, sans extension, dans le répertoire d'exportation.
+        """
+        export_manager = ExportManager(self.export_dir)
+        summary = export_manager.export_matches(self.repository.iter_tournaments(), export_format, filename)
+        elapsed = summary["elapsed"]
+        print(f"{summary['matches']} matchs exportés dans {summary['path']} en {elapsed:.2f} s "
+              f"({summary['matches'] / elapsed if elapsed else 0:.0f} matchs/s).")
+
+    def reset(self, tournament_name=None, all_tournaments=False):
+        """
+        Réinitialise un tournoi, ou tous les tournois.
+
+        Args:
+            tournament_name (str): Le nom du tournoi à réinitialiser.
+            all_tournaments (bool): Si True, tous les tournois sont réinitialisés.
+
+        Raises:
+            ValueError: Si ni un nom de tournoi ni all_tournaments n'est donné.
+        """
+        if all_tournaments:
+            self.tournament_manager.reset_all_tournaments()
+            return
+        if tournament_name is None:
+            raise ValueError("Give a tournament name or --all.")
+        self.tournament_manager.reset_tournament(tournament_name)
+        print(f"Tournoi {tournament_name} réinitialisé avec succès.")
+
+
+def build_parser(default_data_file):
+    """
+    Construit l'analyseur de la ligne de commande.
+
+    Args:
+        default_data_file (str): Le fichier de données utilisé par défaut.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur, avec une sous-commande par opération.
+    """
+    parser = argparse.ArgumentParser(description="Logiciel de tournoi d'échecs.")
+    parser.add_argument("--data", default=default_data_file, help="Fichier de données des tournois.")
+    parser.add_argument("--output-dir", default="src/rapports", help="Répertoire d'exportation des rapports.")
+    parser.add_argument("--sequential-ids", action="store_true",
+                        help="Attribuer les chess_id des nouveaux joueurs dans l'ordre (AA00000, AA00001...).")
+    subparsers = parser.add_subparsers(dest="command")
+
+    create_parser = subparsers.add_parser("create", help="Créer un ou plusieurs tournois depuis un fichier JSON.")
+    create_parser.add_argument("file", help="Fichier JSON décrivant le ou les tournois.")
+
+    import_parser = subparsers.add_parser("import-players", help="Importer une liste de joueurs (CSV ou TSV).")
+    import_parser.add_argument("file", help="Fichier CSV ou TSV (nom, prénom, naissance, chess_id facultatif).")
+
+    search_parser = subparsers.add_parser("search", help="Rechercher un joueur inscrit par nom ou chess_id.")
+    search_parser.add_argument("query", help="Nom, prénom ou chess_id, même partiel ou approximatif.")
+    search_parser.add_argument("--limit", type=int, default=10, help="Nombre maximal de joueurs affichés.")
+
+    pair_parser = subparsers.add_parser("pair", help="Apparier le prochain tour d'un tournoi.")
+    pair_parser.add_argument("tournament", help="Nom du tournoi.")
+    pair_parser.add_argument("--quiet", action="store_true", help="N'afficher que le résumé.")
+
+    results_parser = subparsers.add_parser("results", help="Appliquer un lot de résultats (CSV ou JSON).")
+    results_parser.add_argument("file", help="Fichier CSV (tournament,round,match,result) ou JSON.")
+
+    report_parser = subparsers.add_parser("report", help="Afficher un rapport.")
+    report_parser.add_argument("kind", choices=sorted(REPORTS), help="Type de rapport.")
+    report_parser.add_argument("tournament", nargs="?", help="Nom du tournoi.")
+
+    export_parser = subparsers.add_parser("export", help="Exporter un rapport.")
+    export_parser.add_argument("kind", choices=sorted(REPORTS), help="Type de rapport.")
+    export_parser.add_argument("tournament", nargs="?", help="Nom du tournoi.")
+    export_parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="txt", help="Format du rapport.")
+
+    export_all_parser = subparsers.add_parser("export-all", help="Exporter tous les rapports de tous les tournois.")
+    export_all_parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="both",
+                                   help="Format des rapports.")
+    export_all_parser.add_argument("--workers", type=int, help="Nombre de processus (par défaut, un par processeur).")
+    export_all_parser.add_argument("--force", action="store_true",
+                                   help="Régénérer aussi les rapports des tournois inchangés.")
+
+    matches_parser = subparsers.add_parser("export-matches", help="Exporter les résultats de tous les matchs.")
+    matches_parser.add_argument("--format", choices=sorted(MATCH_SINKS), default="csv",
+                                help="Format du fichier : CSV, JSON Lines ou Parquet (avec pyarrow).")
+    matches_parser.add_argument("--name", default="matches", help="Nom du fichier, sans extension.")
+
+    reset_parser = subparsers.add_parser("reset", help="Réinitialiser un tournoi, ou tous les tournois.")
+    reset_parser.add_argument("tournament", nargs="?", help="Nom du tournoi.")
+    reset_parser.add_argument("--all", action="store_true", help="Réinitialiser tous les tournois.")
+    return parser
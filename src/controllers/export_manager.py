@@ -2,12 +2,26 @@
 Module pour la gestion de l'exportation des rapports.
 
 Ce module contient la classe ExportManager qui permet d'exporter des rapports
-au format texte et HTML.
+au format texte et HTML, à partir des morceaux de texte produits par report_view, ainsi que
+d'exporter en parallèle tous les rapports de tous les tournois. Un manifeste conserve l'empreinte des
+données de chaque tournoi exporté, si bien qu'une nouvelle exportation ne régénère que les rapports des
+tournois modifiés.
 """
 
-import sys
-from io import StringIO
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from controllers.match_export import MATCH_SINKS, iter_match_rows
+from models.tournament import Tournament
+from storage import codec
+from views.report_sinks import HtmlSink, TextSink
+from views.report_view import REPORT_VERSION
+
+SINKS = {"txt": TextSink, "html": HtmlSink}
+MANIFEST_NAME = "export_manifest.json"
 
 
 class ExportManager:
@@ -25,63 +39,162 @@ class ExportManager:
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(exist_ok=True)  # Crée le répertoire d'exportation s'il n'existe pas
 
-    def export_report(self, filename, display_function, data):
+    def export_report(self, filename, chunks):
         """
         Exporte un rapport au format texte.
 
         Args:
             filename (str): Le nom du fichier de rapport.
-            display_function (function): La fonction utilisée pour générer le contenu du rapport.
-            data (any): Les données à passer à la fonction de génération de rapport.
+            chunks (list): Les morceaux de texte du rapport, produits par une fonction render_* de report_view.
         """
         report_path = self.export_dir / filename
-        with report_path.open('w', encoding='utf-8') as file:
-            # Redirige la sortie standard vers le fichier pour capturer le rapport
-            original_stdout = sys.stdout
-            sys.stdout = file
-            display_function(data, styled=False)  # Désactiver le style pour les rapports texte
-            sys.stdout = original_stdout
+        _write_report(report_path, chunks, "txt")
         print(f"Rapport sauvegardé sous {report_path}")
 
-    def export_report_html(self, filename, display_function, data):
+    def export_report_html(self, filename, chunks):
         """
         Exporte un rapport au format HTML.
 
         Args:
             filename (str): Le nom du fichier de rapport.
-            display_function (function): La fonction utilisée pour générer le contenu du rapport.
-            data (any): Les données à passer à la fonction de génération de rapport.
+            chunks (list): Les morceaux de texte du rapport, produits par une fonction render_* de report_view.
         """
         report_path = self.export_dir / filename
+        _write_report(report_path, chunks, "html")
+        print(f"Rapport HTML sauvegardé sous {report_path}")
 
-        # Capture la sortie de la fonction de génération de rapport
-        captured_output = StringIO()
-        original_stdout = sys.stdout
-        sys.stdout = captured_output
-        display_function(data, styled=False)  # Désactiver le style pour les rapports HTML
-        sys.stdout = original_stdout
-        report_content = captured_output.getvalue()
-
-        # Crée un rapport HTML formaté en utilisant un template
-        html_content = f"""
-        <html>
-        <head>
-            <title>Rapport</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333; }}
-                pre {{ background-color: #f4f4f4; padding: 10px; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <h1>Rapport</h1>
-            <pre>{report_content}</pre>
-        </body>
-        </html>
+    def export_all(self, tournaments, reports, formats=("txt", "html"), workers=None, force=False):
         """
+        Exporte les rapports de tous les tournois, un tournoi par tâche d'un groupe de processus.
 
-        # Écrit le contenu HTML dans le fichier
-        with report_path.open('w', encoding='utf-8') as file:
-            file.write(html_content)
+        Chaque tournoi est envoyé aux processus sous la forme de son document JSON déjà encodé, et non
+        de ses objets : seul ce document est copié d'un processus à l'autre, et chaque processus
+        reconstruit le tournoi, met en forme ses rapports et écrit ses fichiers.
 
-        print(f"Rapport HTML sauvegardé sous {report_path}")
+        L'empreinte (SHA-256) de ce document et la version de la mise en forme (REPORT_VERSION) sont
+        enregistrées dans le manifeste du répertoire d'exportation. Un tournoi dont l'empreinte, la
+        version et les fichiers attendus sont inchangés n'est pas réexporté. Le manifeste ne garde que les
+        tournois exportés : un tournoi renommé ou supprimé en disparaît.
+
+        Args:
+            tournaments (list): Les tournois à exporter.
+            reports (list): Des couples (nom de base du fichier, fonction render_* de report_view) ; le
+                nom du tournoi est ajouté au nom de base.
+            formats (iterable): Les formats à produire : "txt" et/ou "html".
+            workers (int): Le nombre de processus. Par défaut, le nombre de processeurs ; avec 1, les
+                rapports sont exportés dans le processus courant.
+            force (bool): Si True, tous les rapports sont régénérés, même inchangés.
+
+        Returns:
+            dict: Le nombre de tournois ("tournaments"), de fichiers écrits ("files"), de tournois inchangés
+            non réexportés ("skipped") et la durée totale en secondes ("elapsed").
+
+        Raises:
+            ValueError: Si un format est inconnu.
+        """
+        formats = tuple(formats)
+        unknown = [export_format for export_format in formats if export_format not in SINKS]
+        if unknown:
+            raise ValueError(f"Unknown export format '{unknown[0]}'.")
+        start = time.perf_counter()
+        manifest = {} if force else self._read_manifest()
+        entries = {}
+        payloads = []
+        for tournament in tournaments:
+            payload = codec.dumps(tournament.as_dict())
+            entry = {
+                "fingerprint": hashlib.sha256(payload).hexdigest(),
+                "files": [f"{filename}_{tournament.name}.{export_format}"
+                          for filename, _ in reports for export_format in formats],
+            }
+            entries[tournament.name] = entry
+            if not self._is_current(manifest.get(tournament.name), entry):
+                payloads.append(payload)
+
+        tasks = (payloads, repeat(tuple(reports)), repeat(self.export_dir), repeat(formats))
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(payloads) < 2:
+            files = sum(map(_export_tournament, *tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                files = sum(executor.map(_export_tournament, *tasks))
+        # Le manifeste ne décrit que les tournois de cet export : les entrées des tournois renommés ou
+        # supprimés depuis sont retirées.
+        if payloads or manifest != entries:
+            self._write_manifest(entries)
+        return {"tournaments": len(entries), "files": files, "skipped": len(entries) - len(payloads),
+                "elapsed": time.perf_counter() - start}
+
+    def export_matches(self, tournaments, export_format="csv", filename="matches"):
+        """
+        Exporte les résultats de tous les matchs, une ligne par match, au fur et à mesure du parcours.
+
+        Les tournois sont lus un par un (voir TournamentRepository.iter_tournaments) et chaque match est
+        écrit dès qu'il est lu : la mémoire utilisée ne dépend pas du nombre de matchs exportés.
+
+        Args:
+            tournaments (iterable): Les tournois à exporter.
+            export_format (str): "csv", "jsonl" ou "parquet" (si pyarrow est installé).
+            filename (str): Le nom du fichier, sans extension.
+
+        Returns:
+            dict: Le chemin du fichier écrit ("path"), le nombre de matchs exportés ("matches") et la durée
+            en secondes ("elapsed").
+
+        Raises:
+            ValueError: Si le format est inconnu ou indisponible.
+        """
+        if export_format not in MATCH_SINKS:
+            raise ValueError(f"Unknown export format '{export_format}'.")
+        sink_class = MATCH_SINKS[export_format]
+        report_path = self.export_dir / f"{filename}.{sink_class.extension}"
+        start = time.perf_counter()
+        try:
+            if sink_class.binary:
+                with report_path.open("wb") as file:
+                    count = sink_class(file).write(iter_match_rows(tournaments))
+            else:
+                with report_path.open("w", encoding="utf-8", newline="") as file:
+                    count = sink_class(file).write(iter_match_rows(tournaments))
+        except Exception:
+            # Un fichier incomplet n'est pas laissé dans le répertoire d'exportation.
+            report_path.unlink(missing_ok=True)
+            raise
+        return {"path": report_path, "matches": count, "elapsed": time.perf_counter() - start}
+
+    def _is_current(self, recorded, entry):
+        if recorded is None or recorded["fingerprint"] != entry["fingerprint"]:
+            return False
+        return set(entry["files"]) <= set(recorded["files"]) and all(
+            (self.export_dir / name).exists() for name in entry["files"])
+
+    def _read_manifest(self):
+        # Un manifeste absent, illisible ou d'une autre version de la mise en forme est ignoré : tous les
+        # rapports sont alors régénérés.
+        try:
+            manifest = codec.load(self.export_dir / MANIFEST_NAME)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != REPORT_VERSION:
+            return {}
+        return manifest.get("tournaments", {})
+
+    def _write_manifest(self, entries):
+        manifest_path = self.export_dir / MANIFEST_NAME
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        temp_path.write_bytes(codec.dumps({"version": REPORT_VERSION, "tournaments": entries}))
+        os.replace(temp_path, manifest_path)
+
+
+def _export_tournament(payload, reports, export_dir, formats):
+    tournament = Tournament.from_dict(codec.loads(payload))
+    for filename, render_function in reports:
+        chunks = render_function(tournament)
+        for export_format in formats:
+            _write_report(export_dir / f"{filename}_{tournament.name}.{export_format}", chunks, export_format)
+    return len(reports) * len(formats)
+
+
+def _write_report(report_path, chunks, export_format):
+    with report_path.open('w', encoding='utf-8') as file:
+        SINKS[export_format](file).write(chunks)
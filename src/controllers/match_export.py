@@ -0,0 +1,172 @@
+"""
+Module pour l'exportation des résultats des matchs dans des formats lisibles par les outils d'analyse.
+
+Ce module contient la fonction iter_match_rows, qui parcourt les tours et les matchs des tournois et
+produit une ligne par match, et les écrivains qui écrivent ces lignes au fur et à mesure : CsvMatchSink
+(CSV), JsonLinesMatchSink (un objet JSON par ligne) et ParquetMatchSink (format en colonnes Parquet,
+disponible si pyarrow est installé). Aucun écrivain ne conserve plus d'un lot de lignes en mémoire.
+"""
+
+import csv
+from storage import codec
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    pyarrow = None
+
+MATCH_COLUMNS = (
+    "tournament", "round", "match", "white_id", "white_first_name", "white_last_name", "black_id",
+    "black_first_name", "black_last_name", "white_score", "black_score", "start_time", "end_time",
+)
+PARQUET_BATCH_SIZE = 16_384
+# Type Parquet des colonnes qui ne sont pas des chaînes.
+PARQUET_TYPES = {"match": "int64", "white_score": "float64", "black_score": "float64"}
+
+
+def iter_match_rows(tournaments):
+    """
+    Parcourt les matchs de tous les tours des tournois, une ligne par match.
+
+    Args:
+        tournaments (iterable): Les tournois, par exemple TournamentRepository.iter_tournaments().
+
+    Yields:
+        tuple: Les valeurs d'un match, dans l'ordre de MATCH_COLUMNS. Les heures de début et de fin du
+        tour sont au format ISO 8601, ou None si le tour n'a pas commencé ou n'est pas terminé.
+    """
+    for tournament in tournaments:
+        for round in tournament.rounds:
+            start_time = round.start_time.isoformat() if round.start_time else None
+            end_time = round.end_time.isoformat() if round.end_time else None
+            for match in round.matches:
+                white, black = match.players
+                yield (tournament.name, round.name, match.id, white.chess_id, white.first_name, white.last_name,
+                       black.chess_id, black.first_name, black.last_name, match.score[0], match.score[1],
+                       start_time, end_time)
+
+
+class CsvMatchSink:
+    """
+    Écrit les matchs dans un fichier CSV, avec une ligne d'en-tête.
+    """
+    extension = "csv"
+    binary = False
+
+    def __init__(self, file):
+        """
+        Initialise le CsvMatchSink.
+
+        Args:
+            file (TextIO): Le fichier, ouvert en écriture en mode texte avec newline="".
+        """
+        self.writer = csv.writer(file)
+
+    def write(self, rows):
+        """
+        Écrit les lignes au fur et à mesure de leur lecture.
+
+        Args:
+            rows (iterable): Les lignes, dans l'ordre de MATCH_COLUMNS.
+
+        Returns:
+            int: Le nombre de lignes écrites.
+        """
+        self.writer.writerow(MATCH_COLUMNS)
+        count = 0
+        for row in rows:
+            self.writer.writerow(row)
+            count += 1
+        return count
+
+
+class JsonLinesMatchSink:
+    """
+    Écrit les matchs au format JSON Lines : un objet JSON par ligne, avec les clés de MATCH_COLUMNS.
+    """
+    extension = "jsonl"
+    binary = True
+
+    def __init__(self, file):
+        """
+        Initialise le JsonLinesMatchSink.
+
+        Args:
+            file (BinaryIO): Le fichier, ouvert en écriture en mode binaire.
+        """
+        self.file = file
+
+    def write(self, rows):
+        """
+        Écrit les lignes au fur et à mesure de leur lecture.
+
+        Args:
+            rows (iterable): Les lignes, dans l'ordre de MATCH_COLUMNS.
+
+        Returns:
+            int: Le nombre de lignes écrites.
+        """
+        count = 0
+        for row in rows:
+            self.file.write(codec.dumps(dict(zip(MATCH_COLUMNS, row))) + b"\n")
+            count += 1
+        return count
+
+
+class ParquetMatchSink:
+    """
+    Écrit les matchs au format Parquet, par groupes de lignes de PARQUET_BATCH_SIZE matchs.
+    """
+    extension = "parquet"
+    binary = True
+
+    def __init__(self, file, batch_size=PARQUET_BATCH_SIZE):
+        """
+        Initialise le ParquetMatchSink.
+
+        Args:
+            file (BinaryIO): Le fichier, ouvert en écriture en mode binaire.
+            batch_size (int): Le nombre de matchs conservés en mémoire avant d'écrire un groupe de lignes.
+
+        Raises:
+            ValueError: Si pyarrow n'est pas installé.
+        """
+        if pyarrow is None:
+            raise ValueError("The parquet format requires pyarrow (pip install pyarrow).")
+        self.file = file
+        self.batch_size = batch_size
+        self.schema = pyarrow.schema([(name, getattr(pyarrow, PARQUET_TYPES.get(name, "string"))())
+                                      for name in MATCH_COLUMNS])
+
+    def write(self, rows):
+        """
+        Écrit les lignes par lots, sans construire la table complète.
+
+        Args:
+            rows (iterable): Les lignes, dans l'ordre de MATCH_COLUMNS.
+
+        Returns:
+            int: Le nombre de lignes écrites.
+        """
+        count = 0
+        with pyarrow.parquet.ParquetWriter(self.file, self.schema) as writer:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == self.batch_size:
+                    writer.write_table(self._table(batch))
+                    count += len(batch)
+                    batch = []
+            if batch or not count:
+                writer.write_table(self._table(batch))
+                count += len(batch)
+        return count
+
+    def _table(self, batch):
+        columns = list(zip(*batch)) if batch else [()] * len(MATCH_COLUMNS)
+        return pyarrow.Table.from_arrays([pyarrow.array(column, type=field.type)
+                                          for column, field in zip(columns, self.schema)], schema=self.schema)
+
+
+MATCH_SINKS = {"csv": CsvMatchSink, "jsonl": JsonLinesMatchSink, "parquet": ParquetMatchSink}
@@ -0,0 +1,89 @@
+"""
+Module pour la lecture des listes de joueurs.
+
+Ce module contient la fonction read_player_rows qui lit, ligne par ligne, une liste de joueurs
+exportée d'une liste de classement (fichier CSV ou TSV, à la manière des listes FIDE) afin de
+l'importer avec UserManager.import_players, ainsi que la fonction parse_birth_date.
+"""
+
+import csv
+import datetime
+from pathlib import Path
+
+# Noms de colonnes reconnus (en minuscules, espaces et tirets remplacés par "_") et champ correspondant.
+PLAYER_COLUMNS = {
+    "chess_id": "chess_id", "id": "chess_id", "identifiant": "chess_id",
+    "first_name": "first_name", "firstname": "first_name", "prenom": "first_name", "prénom": "first_name",
+    "last_name": "last_name", "lastname": "last_name", "surname": "last_name", "nom": "last_name",
+    "name": "name",
+    "birth_date": "birth_date", "birthdate": "birth_date", "birthday": "birth_date", "b_day": "birth_date",
+    "bday": "birth_date", "date_de_naissance": "birth_date", "naissance": "birth_date",
+}
+
+
+def read_player_rows(path):
+    """
+    Lit une liste de joueurs sans la charger entièrement en mémoire.
+
+    Le séparateur (tabulation, point-virgule ou virgule) est déduit de l'en-tête. Les colonnes sont
+    reconnues d'après PLAYER_COLUMNS ; une colonne "Name" au format FIDE ("Nom, Prénom") remplace les
+    colonnes du prénom et du nom. Les autres colonnes (numéro FIDE, classement, fédération) sont
+    ignorées : le numéro FIDE n'a pas le format d'un chess_id.
+
+    Args:
+        path (str): Le chemin du fichier CSV ou TSV.
+
+    Yields:
+        tuple: Le numéro de ligne dans le fichier et un dictionnaire avec les clés "first_name",
+        "last_name", "birth_date" et "chess_id" (chaînes, éventuellement vides).
+
+    Raises:
+        ValueError: Si une colonne obligatoire est absente.
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8-sig", newline="") as file:
+        header = file.readline()
+        delimiter = max(("\t", ";", ","), key=header.count)
+        columns = [PLAYER_COLUMNS.get(_normalize(name)) for name in next(csv.reader([header], delimiter=delimiter))]
+        has_names = "name" in columns or {"first_name", "last_name"} <= set(columns)
+        if not has_names or "birth_date" not in columns:
+            raise ValueError(f"Missing columns in {path}: a name (or first and last name) and a birth date "
+                             f"are required")
+
+        positions = {field: columns.index(field) for field in set(columns) if field is not None}
+        for line, values in enumerate(csv.reader(file, delimiter=delimiter), start=2):
+            if not values:
+                continue
+            row = {field: values[index].strip() if index < len(values) else "" for field, index in positions.items()}
+            if "name" in row:
+                last_name, _, first_name = row.pop("name").partition(",")
+                row["last_name"], row["first_name"] = last_name.strip(), first_name.strip()
+            row.setdefault("chess_id", "")
+            yield line, row
+
+
+def parse_birth_date(text):
+    """
+    Convertit une date de naissance en objet date.
+
+    Les formats acceptés sont AAAA-MM-JJ, JJ/MM/AAAA et l'année seule (les listes FIDE ne donnent que
+    l'année de naissance), qui est alors ramenée au 1er janvier.
+
+    Args:
+        text (str): La date de naissance.
+
+    Returns:
+        datetime.date: La date de naissance.
+
+    Raises:
+        ValueError: Si la date n'est pas reconnue.
+    """
+    if len(text) == 10 and text[4] == "-":
+        return datetime.date.fromisoformat(text)
+    if len(text) == 4 and text.isdigit():
+        return datetime.date(int(text), 1, 1)
+    return datetime.datetime.strptime(text, "%d/%m/%Y").date()
+
+
+def _normalize(name):
+    return name.strip().lower().replace(" ", "_").replace("-", "_")
@@ -5,16 +5,24 @@ Ce module contient la classe ReportManager qui permet de gérer et d'exporter
 des rapports pour les tournois et les joueurs.
 """
 
-import json
 from views.report_view import (
-    display_all_tournaments,
-    display_tournament_details,
-    display_all_players_alphabetically,
-    display_tournament_players_alphabetically,
-    display_tournament_rounds_and_matches
+    render_all_tournaments,
+    render_tournament_details,
+    render_all_players_alphabetically,
+    render_tournament_players_alphabetically,
+    render_tournament_rounds_and_matches
 )
+from views.report_sinks import TerminalSink
 from controllers.export_manager import ExportManager
 
+REPORTS = {
+    "players": ("all_players", render_all_players_alphabetically, "players"),
+    "tournaments": ("all_tournaments", render_all_tournaments, "tournaments"),
+    "details": ("tournament_details", render_tournament_details, "tournament"),
+    "tournament-players": ("tournament_players", render_tournament_players_alphabetically, "tournament"),
+    "rounds": ("tournament_rounds", render_tournament_rounds_and_matches, "tournament"),
+}
+
 
 class ReportManager:
     """
@@ -24,60 +32,49 @@ class ReportManager:
     pour les tournois et les joueurs.
     """
 
-    def __init__(self, tournament_manager, user_manager):
+    def __init__(self, tournament_manager, user_manager, export_dir='src/rapports'):
         """
         Initialise le ReportManager.
 
         Args:
             tournament_manager (TournamentManager): Le gestionnaire de tournois.
             user_manager (UserManager): Le gestionnaire des utilisateurs.
+            export_dir (str): Le répertoire d'exportation des rapports. Par défaut 'src/rapports'.
         """
         self.tournament_manager = tournament_manager
         self.user_manager = user_manager
-        self.export_manager = ExportManager()
+        self.export_manager = ExportManager(export_dir)
         self.load_data()
 
     def load_data(self):
         """
-        Charge les données des tournois et des joueurs depuis le fichier JSON.
-        """
-        if self.tournament_manager.filepath.exists():
-            with self.tournament_manager.filepath.open('r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.tournament_manager.load_tournaments(data.get('tournaments', []))
-                players = []
-                for tournament in self.tournament_manager.tournaments:
-                    players.extend(tournament.players)
-                self.user_manager.load_players(players)
-        else:
+        Vérifie que des données existent. Les joueurs sont lus dans le registre partagé par le dépôt,
+        sans relire le fichier ni construire les joueurs et les tours des tournois.
+        """
+        if not self.tournament_manager.repository.exists():
             print("Starting with an empty dataset.")
 
     def save_data(self):
         """
-        Sauvegarde les données des tournois et des joueurs dans le fichier JSON.
+        Sauvegarde les données des tournois et le registre partagé des joueurs dans l'instantané.
         """
-        data = {
-            "tournaments": self.tournament_manager.get_tournaments_data(),
-            "players": [player.as_dict() for player in self.user_manager.get_all_players()]
-        }
-        with self.tournament_manager.filepath.open('w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        self.tournament_manager.save_tournaments()
 
     def list_all_tournaments(self):
         """
         Affiche la liste de tous les tournois et propose d'exporter le rapport.
         """
-        tournaments = self.tournament_manager.get_all_tournaments()
-        display_all_tournaments(tournaments, styled=True)
-        self.ask_to_export_report("all_tournaments", display_all_tournaments, tournaments)
+        chunks = render_all_tournaments(self.tournament_manager.get_all_tournaments())
+        TerminalSink().write(chunks)
+        self.ask_to_export_report("all_tournaments", chunks)
 
     def list_all_players(self):
         """
         Affiche la liste de tous les joueurs par ordre alphabétique et propose d'exporter le rapport.
         """
-        players = self.user_manager.get_all_players()
-        display_all_players_alphabetically(players, styled=True)
-        self.ask_to_export_report("all_players", display_all_players_alphabetically, players)
+        chunks = render_all_players_alphabetically(self.user_manager.get_sorted_players())
+        TerminalSink().write(chunks)
+        self.ask_to_export_report("all_players", chunks)
 
     def show_tournament_details(self, tournament_name):
         """
@@ -87,8 +84,9 @@ class ReportManager:
             tournament_name (str): Le nom du tournoi.
         """
         tournament = self.tournament_manager.get_tournament_details(tournament_name)
-        display_tournament_details(tournament, styled=True)
-        self.ask_to_export_report(f"tournament_details_{tournament_name}", display_tournament_details, tournament)
+        chunks = render_tournament_details(tournament)
+        TerminalSink().write(chunks)
+        self.ask_to_export_report(f"tournament_details_{tournament_name}", chunks)
 
     def get_tournament_names(self):
         """
@@ -107,9 +105,9 @@ class ReportManager:
             tournament_name (str): Le nom du tournoi.
         """
         tournament = self.tournament_manager.get_tournament_details(tournament_name)
-        display_tournament_players_alphabetically(tournament, styled=True)
-        self.ask_to_export_report(f"tournament_players_{tournament_name}",
-                                  display_tournament_players_alphabetically, tournament)
+        chunks = render_tournament_players_alphabetically(tournament)
+        TerminalSink().write(chunks)
+        self.ask_to_export_report(f"tournament_players_{tournament_name}", chunks)
 
     def show_tournament_rounds_and_matches(self, tournament_name):
         """
@@ -119,26 +117,92 @@ class ReportManager:
             tournament_name (str): Le nom du tournoi.
         """
         tournament = self.tournament_manager.get_tournament_details(tournament_name)
-        display_tournament_rounds_and_matches(tournament, styled=True)
-        self.ask_to_export_report(f"tournament_rounds_{tournament_name}",
-                                  display_tournament_rounds_and_matches, tournament)
+        chunks = render_tournament_rounds_and_matches(tournament)
+        TerminalSink().write(chunks)
+        self.ask_to_export_report(f"tournament_rounds_{tournament_name}", chunks)
+
+    def get_report(self, kind, tournament_name=None):
+        """
+        Retourne de quoi produire un rapport sans passer par les menus.
+
+        Args:
+            kind (str): Le type de rapport : "players", "tournaments", "details", "tournament-players"
+                ou "rounds".
+            tournament_name (str): Le nom du tournoi, pour les rapports portant sur un tournoi.
+
+        Returns:
+            tuple: Le nom de base du fichier et les morceaux de texte du rapport (voir report_view).
+
+        Raises:
+            ValueError: Si le type de rapport est inconnu ou si le tournoi est absent ou introuvable.
+        """
+        if kind not in REPORTS:
+            raise ValueError(f"Unknown report '{kind}'.")
+        filename, render_function, source = REPORTS[kind]
+        if source == "players":
+            return filename, render_function(self.user_manager.get_sorted_players())
+        if source == "tournaments":
+            return filename, render_function(self.tournament_manager.get_all_tournaments())
+        if not tournament_name:
+            raise ValueError(f"Report '{kind}' requires a tournament name.")
+        tournament = self.tournament_manager.get_tournament_details(tournament_name)
+        return f"{filename}_{tournament_name}", render_function(tournament)
 
-    def ask_to_export_report(self, filename, display_function, data):
+    def export(self, kind, tournament_name=None, formats=("txt",)):
+        """
+        Exporte un rapport sans interaction, dans un ou plusieurs formats.
+
+        Args:
+            kind (str): Le type de rapport (voir get_report).
+            tournament_name (str): Le nom du tournoi, pour les rapports portant sur un tournoi.
+            formats (iterable): Les formats à produire : "txt" et/ou "html".
+        """
+        filename, chunks = self.get_report(kind, tournament_name)
+        for export_format in formats:
+            if export_format == "txt":
+                self.export_manager.export_report(filename + ".txt", chunks)
+            elif export_format == "html":
+                self.export_manager.export_report_html(filename + ".html", chunks)
+            else:
+                raise ValueError(f"Unknown export format '{export_format}'.")
+
+    def export_all(self, formats=("txt", "html"), workers=None, force=False):
+        """
+        Exporte les rapports de détails, de joueurs et de tours et matchs de tous les tournois.
+
+        Seuls les rapports des tournois modifiés depuis la dernière exportation sont régénérés, sauf si
+        force est True.
+
+        Args:
+            formats (iterable): Les formats à produire : "txt" et/ou "html".
+            workers (int): Le nombre de processus (voir ExportManager.export_all).
+            force (bool): Si True, tous les rapports sont régénérés.
+
+        Returns:
+            dict: Le résumé de l'exportation (voir ExportManager.export_all).
+        """
+        reports = [(filename, render_function) for filename, render_function, source in REPORTS.values()
+                   if source == "tournament"]
+        return self.export_manager.export_all(self.tournament_manager.get_all_tournaments(), reports, formats,
+                                              workers, force)
+
+    def ask_to_export_report(self, filename, chunks):
         """
         Demande à l'utilisateur s'il souhaite exporter le rapport et dans quel format.
 
+        Le rapport déjà mis en forme pour l'affichage est exporté tel quel, sans être produit une seconde fois.
+
         Args:
             filename (str): Le nom de base du fichier de rapport.
-            display_function (function): La fonction utilisée pour générer le contenu du rapport.
-            data (any): Les données à passer à la fonction de génération de rapport.
+            chunks (list): Les morceaux de texte du rapport.
         """
         choice = input("Souhaitez-vous imprimer ce rapport ? (Oui/Non) : ")
         if choice.lower() == 'oui':
             format_choice = input("Choisissez le format : 1. Texte brut, 2. HTML, 3. Les deux : ")
             if format_choice == '1':
-                self.export_manager.export_report(filename + ".txt", display_function, data)
+                self.export_manager.export_report(filename + ".txt", chunks)
             elif format_choice == '2':
-                self.export_manager.export_report_html(filename + ".html", display_function, data)
+                self.export_manager.export_report_html(filename + ".html", chunks)
             elif format_choice == '3':
-                self.export_manager.export_report(filename + ".txt", display_function, data)
-                self.export_manager.export_report_html(filename + ".html", display_function, data)
+                self.export_manager.export_report(filename + ".txt", chunks)
+                self.export_manager.export_report_html(filename + ".html", chunks)
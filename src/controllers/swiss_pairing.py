@@ -0,0 +1,141 @@
+"""
+Module pour l'appariement des joueurs selon le système suisse.
+
+Ce module contient la classe SwissPairing qui apparie les joueurs d'un tournoi par score,
+sans revanche, en équilibrant les couleurs et en attribuant une exemption (bye) lorsque le
+nombre de joueurs est impair.
+"""
+
+import random
+
+
+class SwissPairing:
+    """
+    Moteur d'appariement au système suisse.
+
+    Les joueurs sont classés par score décroissant (l'ordre au sein d'un même score est tiré au
+    sort), puis chaque joueur non apparié est associé au joueur le plus proche au classement qu'il
+    n'a pas encore rencontré. Si aucun appariement sans revanche n'est possible, le moteur revient
+    sur ses choix précédents ; au-delà d'un budget de retours arrière, les revanches sont autorisées.
+
+    Attributes:
+        rng (random.Random): Le générateur aléatoire utilisé pour départager les joueurs à égalité.
+        max_steps (int): Le nombre maximal de retours arrière avant d'autoriser les revanches.
+    """
+
+    def __init__(self, rng=None, max_steps=100000):
+        """
+        Initialise le moteur d'appariement.
+
+        Args:
+            rng (random.Random): Le générateur aléatoire. Par défaut, le générateur du module random.
+            max_steps (int): Le nombre maximal de retours arrière avant d'autoriser les revanches.
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.max_steps = max_steps
+
+    def pair(self, tournament):
+        """
+        Calcule les appariements du prochain tour d'un tournoi.
+
+        Args:
+            tournament (Tournament): Le tournoi, dont les tours déjà joués servent d'historique.
+
+        Returns:
+            tuple: La liste des paires (blancs, noirs) d'objets Player et le joueur exempté (ou None).
+        """
+        opponents, colour_balance, last_colour, byes = self._history(tournament)
+
+        order = list(tournament.players)
+        self.rng.shuffle(order)
+        order.sort(key=lambda player: -player.score)
+
+        bye = None
+        if len(order) % 2:
+            bye = next((p for p in reversed(order) if p.chess_id not in byes), order[-1])
+            order.remove(bye)
+
+        ids = [player.chess_id for player in order]
+        pairs = self._pair_without_rematch(ids, opponents)
+        if pairs is None:
+            pairs = self._pair_without_rematch(ids, {chess_id: set() for chess_id in ids})
+
+        result = []
+        for i, j in pairs:
+            result.append(self._assign_colours(order[i], order[j], colour_balance, last_colour))
+        return result, bye
+
+    def _history(self, tournament):
+        """
+        Précalcule les adversaires déjà rencontrés, l'équilibre des couleurs et les exemptions.
+        """
+        opponents = {player.chess_id: set() for player in tournament.players}
+        colour_balance = dict.fromkeys(opponents, 0)
+        last_colour = {}
+        byes = set()
+        for round in tournament.rounds:
+            if round.bye is not None:
+                byes.add(round.bye.chess_id)
+            for match in round.matches:
+                white, black = match.players[0].chess_id, match.players[1].chess_id
+                opponents.setdefault(white, set()).add(black)
+                opponents.setdefault(black, set()).add(white)
+                colour_balance[white] = colour_balance.get(white, 0) + 1
+                colour_balance[black] = colour_balance.get(black, 0) - 1
+                last_colour[white] = 1
+                last_colour[black] = -1
+        return opponents, colour_balance, last_colour, byes
+
+    def _pair_without_rematch(self, ids, opponents):
+        """
+        Apparie les joueurs classés par retour arrière itératif.
+
+        Args:
+            ids (list): Les chess_id des joueurs, dans l'ordre du classement.
+            opponents (dict): Les adversaires déjà rencontrés par chaque joueur.
+
+        Returns:
+            list: Les paires d'indices (i, j) dans ids, ou None si le budget est épuisé.
+        """
+        count = len(ids)
+        paired = [False] * count
+        stack = []
+        steps = 0
+        i, j = 0, 1
+
+        while i < count:
+            played = opponents.get(ids[i], ())
+            while j < count and (paired[j] or ids[j] in played):
+                j += 1
+
+            if j < count:
+                paired[i] = paired[j] = True
+                stack.append((i, j))
+                while i < count and paired[i]:
+                    i += 1
+                j = i + 1
+                continue
+
+            steps += 1
+            if not stack or steps > self.max_steps:
+                return None
+            i, previous = stack.pop()
+            paired[i] = paired[previous] = False
+            j = previous + 1
+
+        return stack
+
+    def _assign_colours(self, first, second, colour_balance, last_colour):
+        """
+        Donne les blancs au joueur qui a le moins joué avec les blancs.
+
+        Returns:
+            tuple: La paire (blancs, noirs).
+        """
+        first_balance = colour_balance.get(first.chess_id, 0)
+        second_balance = colour_balance.get(second.chess_id, 0)
+        if first_balance != second_balance:
+            return (first, second) if first_balance < second_balance else (second, first)
+        if last_colour.get(first.chess_id, 0) > last_colour.get(second.chess_id, 0):
+            return second, first
+        return first, second
@@ -1,9 +1,13 @@
-import json
+from collections import ChainMap
 from pathlib import Path
-from models.tournament import Tournament
+from models.tournament import Tournament, NOT_STARTED, PAUSED, FINISHED
 from models.round import Round
-from models.match import Match
+from models.match import Match, make_score, NOT_PLAYED, WHITE_WINS, BLACK_WINS, DRAW
 from views.tournament_view import display_tournament_details, display_round_details, display_final_scores
+from storage.tournament_repository import TournamentRepository
+from controllers.swiss_pairing import SwissPairing
+
+RESULTS = {WHITE_WINS, BLACK_WINS, DRAW}
 
 
 class TournamentManager:
@@ -12,46 +16,202 @@ class TournamentManager:
 
     Attributes:
         filepath (Path): Le chemin vers le fichier JSON contenant les tournois.
+        repository (TournamentRepository): Le dépôt partagé des tournois.
+        store (BaseStore): Le stockage des tournois (journal JSON ou base SQLite).
+        pairing (SwissPairing): Le moteur d'appariement des tours.
         tournaments (list): La liste des tournois.
+
+    Les tournois sont indexés par nom (sans tenir compte de la casse) et par état d'avancement ;
+    ces index sont tenus à jour lors du chargement, de l'ajout, de la fin d'un tour et des
+    réinitialisations.
     """
 
-    def __init__(self, filepath):
+    def __init__(self, filepath, repository=None):
         """
         Initialise la classe TournamentManager.
 
         Args:
             filepath (str): Le chemin vers le fichier JSON contenant les tournois.
+            repository (TournamentRepository): Le dépôt partagé des tournois. S'il n'est pas fourni, un
+                dépôt est créé pour le fichier indiqué.
         """
         self.filepath = Path(filepath)
+        self.repository = repository if repository is not None else TournamentRepository(self.filepath)
+        self.store = self.repository.store
+        self.pairing = SwissPairing()
         self.tournaments = []
+        self._by_name = {}
+        self._by_status = {NOT_STARTED: {}, PAUSED: {}, FINISHED: {}}
         self.load_tournaments_from_file()
 
     def load_tournaments_from_file(self):
         """
-        Charge les tournois à partir du fichier JSON spécifié.
+        Charge les tournois à partir du dépôt partagé, qui ne lit le fichier qu'une seule fois.
         """
-        if self.filepath.exists():
-            with self.filepath.open("r", encoding="utf-8") as file:
-                data = json.load(file)
-                self.load_tournaments(data.get('tournaments', []))
+        if self.repository.exists():
+            self.tournaments = self.repository.get_tournaments()
+            self.rebuild_indexes()
         else:
             print("No file found, starting with an empty list of tournaments.")
 
-    def load_tournaments(self, tournaments_data):
+    def rebuild_indexes(self):
+        """
+        Reconstruit les index par nom et par état à partir de la liste des tournois.
+        """
+        self._by_name = {}
+        self._by_status = {NOT_STARTED: {}, PAUSED: {}, FINISHED: {}}
+        for tournament in self.tournaments:
+            self._index_tournament(tournament)
+
+    def _index_tournament(self, tournament):
+        key = tournament.name.lower()
+        previous = self._by_name.get(key)
+        if previous is not None:
+            self._by_status[previous.get_status()].pop(key, None)
+        self._by_name[key] = tournament
+        self._by_status[tournament.get_status()][key] = tournament
+
+    def update_status_index(self, tournament):
+        """
+        Replace un tournoi dans l'index par état après une modification de son tour en cours.
+
+        Args:
+            tournament (Tournament): Le tournoi modifié.
+        """
+        key = tournament.name.lower()
+        for tournaments in self._by_status.values():
+            tournaments.pop(key, None)
+        self._by_status[tournament.get_status()][key] = tournament
+
+    def load_tournaments(self, tournaments_data, players_data=None):
         """
         Charge les tournois à partir d'une liste de dictionnaires.
 
         Args:
             tournaments_data (list): La liste des dictionnaires représentant les tournois.
+            players_data (dict | list): Le registre des joueurs, indexé par chess_id. Une liste de
+                joueurs (ancien format) est également acceptée.
         """
-        self.tournaments = [Tournament.from_dict(t_data) for t_data in tournaments_data]
+        self.tournaments = self.repository.build_tournaments(tournaments_data, players_data)
+        self.rebuild_indexes()
 
     def save_tournaments(self):
         """
-        Sauvegarde les tournois dans le fichier JSON spécifié.
+        Sauvegarde tous les tournois dans l'instantané JSON et vide le journal d'événements.
+
+        Les joueurs sont enregistrés une seule fois dans un registre indexé par chess_id, auquel les
+        tournois, les tours et les matchs font référence. Le registre partagé des joueurs y est repris en
+        entier, avec les joueurs qui ne participent à aucun tournoi.
+        """
+        registry = {}
+        tournaments = [t.as_dict(registry) for t in self.tournaments]
+        registry.update(self.repository.get_player_store().records)
+        self.store.compact({"players": registry, "tournaments": tournaments})
+
+    def record_event(self, event):
+        """
+        Enregistre un événement dans le journal et compacte le journal s'il est trop long.
+
+        Args:
+            event (dict): L'événement à enregistrer.
+        """
+        self.store.append(event)
+        if self.store.needs_compaction():
+            self.save_tournaments()
+
+    def flush(self):
+        """
+        Écrit immédiatement les modifications en attente d'écriture (fin de tour, pause, sortie).
+        """
+        self.store.flush()
+
+    def record_match_result(self, tournament, round, match):
+        """
+        Enregistre le résultat d'un match dans le journal.
+
+        Args:
+            tournament (Tournament): Le tournoi en cours.
+            round (Round): Le tour contenant le match.
+            match (Match): Le match dont le score vient d'être saisi.
+        """
+        tournament.record_result(match)
+        self.record_event(self._match_result_event(tournament, round, match))
+
+    def _match_result_event(self, tournament, round, match):
+        return {
+            "type": "match_result",
+            "tournament": tournament.name,
+            "round": round.name,
+            "match": match.id,
+            "score": list(match.score),
+            "scores": {player.chess_id: player.score for player in match.players}
+        }
+
+    def apply_results(self, rows):
+        """
+        Applique un lot de résultats de matchs sans interaction, avec une seule écriture.
+
+        Toutes les lignes sont validées avant d'appliquer quoi que ce soit : le tournoi et le tour doivent
+        exister, le tour ne doit pas être terminé, le match doit appartenir au tour et ne pas avoir déjà
+        de résultat. Les tours complétés par le lot sont clôturés. Les modifications sont enregistrées
+        dans un seul événement du stockage.
+
+        Args:
+            rows (iterable): Des dictionnaires avec les clés "tournament", "round", "match" et "result".
+                Le résultat est "1-0", "0-1" ou "1/2-1/2" (ou un couple de scores).
+
+        Returns:
+            dict: Le nombre de résultats appliqués ("applied") et les tours clôturés ("completed_rounds").
+
+        Raises:
+            ValueError: Si au moins une ligne est invalide ; aucun résultat n'est alors appliqué.
         """
-        with self.filepath.open("w", encoding="utf-8") as file:
-            json.dump({"tournaments": [t.as_dict() for t in self.tournaments]}, file, indent=4, ensure_ascii=False)
+        rounds = {}
+        planned = []
+        seen = set()
+        errors = []
+        for line, row in enumerate(rows, start=1):
+            try:
+                tournament = self.get_tournament_details(str(row["tournament"]))
+                key = (tournament.name.lower(), str(row["round"]))
+                if key not in rounds:
+                    round = next((r for r in tournament.rounds if r.name == key[1]), None)
+                    if round is None:
+                        raise ValueError(f"round '{key[1]}' not found")
+                    if round.end_time is not None:
+                        raise ValueError(f"round '{key[1]}' is already finished")
+                    rounds[key] = (tournament, round, {match.id: match for match in round.matches})
+                tournament, round, matches = rounds[key]
+                match = matches.get(int(row["match"]))
+                if match is None:
+                    raise ValueError(f"match {row['match']} not found in '{round.name}'")
+                if match.score != NOT_PLAYED or (key, match.id) in seen:
+                    raise ValueError(f"match {match.id} of '{round.name}' already has a result")
+                seen.add((key, match.id))
+                planned.append((tournament, round, match, parse_result(row["result"])))
+            except (KeyError, TypeError, ValueError) as error:
+                errors.append(f"line {line}: {error}")
+
+        if errors:
+            raise ValueError("Invalid results, nothing was applied:\n" + "\n".join(errors))
+
+        events = []
+        for tournament, round, match, score in planned:
+            match.score = score
+            match.update_player_scores()
+            tournament.record_result(match)
+            events.append(self._match_result_event(tournament, round, match))
+
+        completed_rounds = []
+        for tournament, round, _ in rounds.values():
+            if round.is_completed() and tournament.rounds and tournament.rounds[-1] is round:
+                events.append(self._close_round(tournament, round))
+                completed_rounds.append(f"{tournament.name} - {round.name}")
+
+        if events:
+            self.record_event({"type": "batch", "events": events})
+            self.flush()
+        return {"applied": len(planned), "completed_rounds": completed_rounds}
 
     def get_tournament_details(self, tournament_name):
         """
@@ -66,7 +226,7 @@ class TournamentManager:
         Raises:
             ValueError: Si aucun tournoi avec le nom spécifié n'est trouvé.
         """
-        tournament = next((t for t in self.tournaments if t.name.lower() == tournament_name.lower()), None)
+        tournament = self._by_name.get(tournament_name.lower())
         if not tournament:
             raise ValueError("No tournament found with the name specified.")
         return tournament
@@ -78,7 +238,19 @@ class TournamentManager:
         Returns:
             list: La liste des noms de tous les tournois.
         """
-        return [tournament.name for tournament in self.tournaments]
+        return [tournament.name for tournament in self._by_name.values()]
+
+    def get_tournaments_by_status(self, status):
+        """
+        Récupère les tournois dans un état d'avancement donné.
+
+        Args:
+            status (str): NOT_STARTED, PAUSED ou FINISHED.
+
+        Returns:
+            list: La liste des tournois dans cet état.
+        """
+        return list(self._by_status[status].values())
 
     def run_tournament(self, tournament_name, is_resumed=False):
         """
@@ -96,7 +268,6 @@ class TournamentManager:
             is_resumed = False
 
         display_final_scores(tournament)
-        self.save_tournaments()
 
         self.prompt_restart_tournament(tournament_name)
 
@@ -112,6 +283,7 @@ class TournamentManager:
             self.reset_tournament(tournament_name)
             self.run_tournament(tournament_name, is_resumed=False)
         else:
+            self.flush()
             print("Merci d'avoir utilisé le logiciel de tournoi d'échecs !")
 
     def run_round(self, tournament, is_resumed):
@@ -122,46 +294,91 @@ class TournamentManager:
             tournament (Tournament): Le tournoi en cours.
             is_resumed (bool): Indique si le tour est repris.
         """
-        current_round_index = tournament.current_round
-        round_name = f"Round {current_round_index + 1}"
-        round = next((r for r in tournament.rounds if r.name == round_name), None)
-
-        if not round:
-            round = Round(name=round_name)
-            self.generate_matches(tournament, round)
-            round.start_round(resume=is_resumed)
-            tournament.add_round(round)
+        round = self.start_round(tournament, is_resumed)
+        round_name = round.name
 
         current_match = round.get_current_match()
         while current_match:
             display_round_details(round, self, current_match=current_match)
+            self.record_match_result(tournament, round, current_match)
             current_match = round.get_current_match()
-            self.save_tournaments()
 
         if not round.is_completed():
             print(f"Round {round_name} is not completed, current_round remains {tournament.current_round}")
             return
 
         if not round.end_time:
-            round.end_round()
-            tournament.current_round += 1
-        self.save_tournaments()
+            self.record_event(self._close_round(tournament, round))
+            self.flush()
+
+    def start_round(self, tournament, is_resumed=False):
+        """
+        Démarre le prochain tour d'un tournoi, ou retourne le tour en cours s'il a déjà été apparié.
+
+        Un nouveau tour est apparié selon le système suisse et enregistré dans le journal.
+
+        Args:
+            tournament (Tournament): Le tournoi en cours.
+            is_resumed (bool): Indique si le tour est repris.
+
+        Returns:
+            Round: Le tour en cours.
+
+        Raises:
+            ValueError: Si tous les tours du tournoi ont déjà été joués.
+        """
+        if tournament.current_round >= tournament.number_of_rounds:
+            raise ValueError(f"Tournament '{tournament.name}' is already finished.")
+
+        round_name = f"Round {tournament.current_round + 1}"
+        round = next((r for r in tournament.rounds if r.name == round_name), None)
+        if round is not None:
+            return round
+
+        round = Round(name=round_name)
+        self.generate_matches(tournament, round)
+        round.start_round(resume=is_resumed)
+        tournament.add_round(round)
+        self.record_event({
+            "type": "round_start",
+            "tournament": tournament.name,
+            "round": round.as_dict(),
+            "scores": {round.bye.chess_id: round.bye.score} if round.bye else {}
+        })
+        return round
+
+    def _close_round(self, tournament, round):
+        """
+        Termine un tour, passe au tour suivant et retourne l'événement correspondant.
+        """
+        round.end_round()
+        tournament.current_round += 1
+        self.update_status_index(tournament)
+        return {
+            "type": "round_end",
+            "tournament": tournament.name,
+            "round": round.name,
+            "end_time": round.end_time,
+            "current_round": tournament.current_round
+        }
 
     def generate_matches(self, tournament, round):
         """
-        Génère les matchs pour un tour spécifique d'un tournoi.
+        Génère les matchs pour un tour spécifique d'un tournoi selon le système suisse.
+
+        Si le nombre de joueurs est impair, le joueur exempté reçoit un point.
 
         Args:
             tournament (Tournament): Le tournoi en cours.
             round (Round): Le tour en cours.
         """
-        from random import shuffle
-        shuffle(tournament.players)
-        match_id = 1
-        for i in range(0, len(tournament.players), 2):
-            match = Match(id=match_id, players=(tournament.players[i], tournament.players[i + 1]))
-            round.add_match(match)
-            match_id += 1
+        pairs, bye = self.pairing.pair(tournament)
+        for match_id, players in enumerate(pairs, start=1):
+            round.add_match(Match(id=match_id, players=players))
+        if bye is not None:
+            round.bye = bye
+            bye.score += 1
+            tournament.record_bye(bye)
 
     def get_paused_tournaments(self):
         """
@@ -170,7 +387,7 @@ class TournamentManager:
         Returns:
             list: La liste des noms des tournois en pause.
         """
-        return [t.name for t in self.tournaments if t.current_round > 0 and t.current_round < t.number_of_rounds]
+        return [tournament.name for tournament in self._by_status[PAUSED].values()]
 
     def reset_all_tournaments(self):
         """
@@ -181,7 +398,9 @@ class TournamentManager:
             tournament.rounds = []
             for player in tournament.players:
                 player.score = 0.0
-        self.save_tournaments()
+            tournament.reset_standings()
+        self.rebuild_indexes()
+        self.record_event({"type": "reset_all"})
         print("Tous les tournois ont été réinitialisés avec succès.")
 
     def reset_tournament(self, tournament_name):
@@ -196,7 +415,9 @@ class TournamentManager:
         tournament.rounds = []
         for player in tournament.players:
             player.score = 0.0
-        self.save_tournaments()
+        tournament.reset_standings()
+        self.update_status_index(tournament)
+        self.record_event({"type": "reset", "tournament": tournament.name})
 
     def get_all_tournaments(self):
         """
@@ -209,12 +430,95 @@ class TournamentManager:
 
     def add_tournament(self, tournament_data):
         """
-        Ajoute un nouveau tournoi à la liste des tournois et sauvegarde les tournois.
+        Ajoute un nouveau tournoi à la liste des tournois et l'enregistre dans le journal.
+
+        Les joueurs du tournoi sont soit des joueurs complets, soit des joueurs déjà inscrits au registre,
+        désignés par leur seul chess_id. Le tournoi enregistré ne fait référence aux joueurs que par
+        leur chess_id ; seuls les joueurs nouveaux ou modifiés sont ajoutés au registre.
 
         Args:
             tournament_data (dict): Les données du tournoi à ajouter.
+
+        Raises:
+            ValueError: Si un tournoi du même nom (sans tenir compte de la casse) existe déjà, si le tournoi
+                a moins de deux joueurs, si un joueur y figure deux fois ou si un chess_id est inconnu du
+                registre.
+        """
+        self.add_tournaments([tournament_data])
+
+    def add_tournaments(self, tournaments_data):
+        """
+        Ajoute plusieurs tournois, tous ou aucun, et les enregistre dans un seul événement du journal.
+
+        Tous les tournois sont validés et construits avant qu'aucun ne soit ajouté. Un joueur décrit en
+        entier dans l'un des tournois peut être désigné par son seul chess_id dans les autres.
+
+        Args:
+            tournaments_data (list): Les données des tournois à ajouter (voir add_tournament).
+
+        Raises:
+            KeyError: Si une information obligatoire d'un tournoi manque ; aucun tournoi n'est alors ajouté.
+            ValueError: Si un tournoi est invalide (voir add_tournament) ou si deux tournois portent le même
+                nom ; aucun tournoi n'est alors ajouté.
         """
-        tournament = Tournament.from_dict(tournament_data)
-        self.tournaments.append(tournament)
-        self.save_tournaments()
-        print(f"Tournament '{tournament.name}' has been added successfully.")
+        player_store = self.repository.get_player_store()
+        declared = {p_data["chess_id"]: p_data for tournament_data in tournaments_data
+                    for p_data in tournament_data["players"] if "first_name" in p_data}
+        registry = ChainMap(declared, player_store.records)
+        names = set()
+        tournaments = []
+        for tournament_data in tournaments_data:
+            name = str(tournament_data["name"])
+            if name.lower() in self._by_name or name.lower() in names:
+                raise ValueError(f"Tournament '{name}' already exists")
+            names.add(name.lower())
+            chess_ids = [p_data["chess_id"] for p_data in tournament_data["players"]]
+            if len(chess_ids) < 2:
+                raise ValueError(f"Tournament '{name}': a tournament needs at least 2 players")
+            if len(set(chess_ids)) != len(chess_ids):
+                raise ValueError(f"Tournament '{name}': a player cannot be registered twice in the same tournament")
+            unknown = [chess_id for chess_id in chess_ids if chess_id not in registry]
+            if unknown:
+                raise ValueError(f"Tournament '{name}': unknown players: {', '.join(unknown)}")
+            tournaments.append(Tournament.from_dict(tournament_data, registry))
+
+        events = []
+        for tournament in tournaments:
+            self.tournaments.append(tournament)
+            self._index_tournament(tournament)
+            t_registry = {}
+            t_data = tournament.as_dict(t_registry)
+            changed = player_store.changed(t_registry.values())
+            player_store.register(changed)
+            events += [{"type": "upsert_player", "player": p_data} for p_data in changed]
+            events.append({"type": "add_tournament", "tournament": t_data})
+        if events:
+            self.record_event(events[0] if len(events) == 1 else {"type": "batch", "events": events})
+        for tournament in tournaments:
+            print(f"Tournament '{tournament.name}' has been added successfully.")
+
+
+def parse_result(result):
+    """
+    Convertit un résultat de match en couple de scores.
+
+    Args:
+        result (str | list): "1-0", "0-1", "1/2-1/2" (ou "0.5-0.5", "½-½"), ou un couple de scores.
+
+    Returns:
+        tuple: Le score (blancs, noirs).
+
+    Raises:
+        ValueError: Si le résultat n'est pas reconnu.
+    """
+    if isinstance(result, (list, tuple)):
+        score = make_score(result)
+    else:
+        text = str(result).strip().replace("½", "0.5").replace("1/2", "0.5")
+        parts = text.split("-")
+        if len(parts) != 2:
+            raise ValueError(f"unknown result '{result}'")
+        score = make_score(parts)
+    if score not in RESULTS:
+        raise ValueError(f"unknown result '{result}'")
+    return score
@@ -5,11 +5,16 @@ Ce module contient la classe UserManager qui permet de gérer les joueurs,
 y compris leur chargement, sauvegarde, ajout et mise à jour.
 """
 
-import json
-import random
-import string
 from pathlib import Path
-from models.player import Player
+from models.player import Player, SORT_KEY
+from controllers.player_import import parse_birth_date
+from storage.chess_ids import CHESS_ID_PATTERN
+from storage.tournament_repository import TournamentRepository
+from views.player_view import find_invalid_names
+
+IMPORT_BATCH_SIZE = 10_000
+# Marque, lors d'une importation, un joueur nouveau dont le chess_id n'est pas encore attribué.
+_NEW_PLAYER = object()
 
 
 class UserManager:
@@ -17,39 +22,130 @@ class UserManager:
     Classe responsable de la gestion des joueurs.
 
     Cette classe gère le chargement, la sauvegarde, l'ajout et la mise à jour
-    des joueurs.
+    des joueurs. Les joueurs sont indexés par chess_id et enregistrés dans le registre
+    partagé avec les tournois ; seuls les joueurs ajoutés ou modifiés sont écrits.
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, store=None):
         """
         Initialise le UserManager.
 
         Args:
-            file_path (str): Chemin vers le fichier de sauvegarde des joueurs.
+            file_path (str): Chemin vers le fichier de données des tournois, qui contient le registre des joueurs.
+            store (PlayerStore): Le registre partagé des joueurs (voir TournamentRepository.get_player_store).
+                S'il n'est pas fourni, le registre est lu dans le fichier indiqué.
         """
         self.file_path = Path(file_path)
-        self.players = []
+        self.store = store if store is not None else TournamentRepository(self.file_path).get_player_store()
+        self._players = None
+        self._version = None
+        self._sorted_players = None
+
+    @property
+    def players(self):
+        """
+        Liste des joueurs, construits à partir du registre lors du premier accès.
+
+        Returns:
+            list: Liste des objets Player.
+        """
+        return list(self._index().values())
+
+    @players.setter
+    def players(self, players):
+        self._players = {player.chess_id: player for player in players}
+        self._sorted_players = None
+        self.store.register(player.as_dict(with_score=False) for player in players)
+        self._version = self.store.version
+
+    def _index(self):
+        if self._players is None or self._version != self.store.version:
+            # Des joueurs ont été ajoutés ou modifiés dans le registre par ailleurs (nouveau tournoi,
+            # importation) : seuls eux sont reconstruits.
+            players = self._players or {}
+            self._players = {chess_id: _current_player(players.get(chess_id), p_data)
+                             for chess_id, p_data in self.store.records.items()}
+            self._version = self.store.version
+            self._sorted_players = None
+        return self._players
 
     def load_players(self, players_data):
         """
         Charge les joueurs à partir des données fournies.
 
+        Les joueurs ne sont construits qu'au premier accès à la liste des joueurs.
+
         Args:
             players_data (list): Liste des données des joueurs.
         """
-        self.players = [data if isinstance(data, Player) else Player.from_dict(data) for data in players_data]
+        self.store.register(players_data)
+        self._players = None
+        self._sorted_players = None
+
+    def save_players(self, players=None):
+        """
+        Enregistre des joueurs dans le registre partagé.
+
+        Args:
+            players (list): Les joueurs à enregistrer. Par défaut, tous les joueurs.
+        """
+        players = self.players if players is None else players
+        current = self._players is not None and self._version == self.store.version
+        self.store.upsert([player.as_dict(with_score=False) for player in players])
+        if current:
+            # Seuls ces joueurs ont changé dans le registre : l'index est tenu à jour sans être reconstruit.
+            for player in players:
+                self._players[player.chess_id] = player
+            self._version = self.store.version
+        self._sorted_players = None
+
+    def get_player(self, chess_id):
+        """
+        Retourne un joueur d'après son identifiant.
 
-    def save_players(self):
+        Args:
+            chess_id (str): L'identifiant du joueur.
+
+        Returns:
+            Player: Le joueur, ou None s'il est inconnu.
+        """
+        if self._players is not None:
+            return self._index().get(chess_id)
+        # Tant que la liste des joueurs n'est pas construite, seul le joueur demandé l'est.
+        p_data = self.store.get(chess_id)
+        return Player.from_dict(p_data) if p_data is not None else None
+
+    def find_players(self, query):
+        """
+        Recherche des joueurs inscrits par chess_id ou par nom (voir PlayerStore.find).
+
+        Args:
+            query (str): Le chess_id, le nom de famille, "prénom nom" ou "nom prénom".
+
+        Returns:
+            list: Les joueurs trouvés.
+        """
+        return [self.get_player(p_data["chess_id"]) for p_data in self.store.find(query)]
+
+    def search(self, query, limit=10):
         """
-        Sauvegarde les joueurs dans un fichier JSON.
+        Recherche des joueurs à partir d'un nom partiel ou approximatif, ou d'un début de chess_id.
+
+        Args:
+            query (str): La recherche, par exemple "dup", "jean dup" ou "dupond".
+            limit (int): Le nombre maximal de joueurs retournés.
+
+        Returns:
+            list: Les joueurs trouvés, les meilleures correspondances en premier.
         """
-        with self.file_path.open('w', encoding='utf-8') as file:
-            json.dump([player.as_dict() for player in self.players], file, indent=4, ensure_ascii=False)
+        return [self.get_player(p_data["chess_id"]) for p_data in self.store.search(query, limit)]
 
     def add_player(self, player_data):
         """
         Ajoute un nouveau joueur et le sauvegarde.
 
+        Un joueur ayant le même chess_id qu'un joueur existant le remplace.
+
         Args:
             player_data (dict): Les données du nouveau joueur.
 
@@ -57,8 +153,7 @@ class UserManager:
             str: Message de confirmation de l'ajout du joueur.
         """
         new_player = Player(**player_data)
-        self.players.append(new_player)
-        self.save_players()
+        self.save_players([new_player])
         return "Player added successfully!"
 
     def update_player(self, player_id, updated_data):
@@ -67,17 +162,115 @@ class UserManager:
 
         Args:
             player_id (str): ID du joueur à mettre à jour.
-            updated_data (dict): Nouvelles données du joueur.
+            updated_data (dict): Nouvelles données du joueur (first_name, last_name, birth_date).
 
         Returns:
             str: Message de confirmation de la mise à jour ou message d'erreur si le joueur n'est pas trouvé.
+
+        Raises:
+            ValueError: Si un champ ne peut pas être modifié.
+        """
+        player = self.get_player(player_id)
+        if player is None:
+            return "Player ID not found."
+        unknown = set(updated_data) - {"first_name", "last_name", "birth_date"}
+        if unknown:
+            raise ValueError(f"Cannot update player fields: {', '.join(sorted(unknown))}")
+        for name, value in updated_data.items():
+            setattr(player, name, value)
+        self.save_players([player])
+        return f"Player {player_id} updated successfully!"
+
+    def import_players(self, rows, batch_size=IMPORT_BATCH_SIZE):
+        """
+        Importe une liste de joueurs, avec une seule écriture.
+
+        Les lignes sont validées par lots : les noms avec les règles de validate_name, les dates avec
+        parse_birth_date et les chess_id avec leur format. Les lignes invalides sont écartées et signalées.
+        Les doublons sont écartés d'après le chess_id, ou d'après le nom et la date de naissance pour les
+        lignes sans chess_id. Une ligne sans chess_id reprend celui du joueur existant de même nom et de
+        même date de naissance, ou en reçoit un nouveau. Un joueur existant n'est réécrit que si ses
+        informations ont changé.
+
+        Args:
+            rows (iterable): Des couples (numéro de ligne, dictionnaire) tels que ceux de read_player_rows.
+            batch_size (int): Le nombre de lignes validées ensemble.
+
+        Returns:
+            dict: Le nombre de lignes lues ("rows"), de joueurs ajoutés ("added"), mis à jour ("updated"),
+            inchangés ("unchanged"), de doublons ("duplicates") et la liste des lignes rejetées ("rejected").
         """
-        for player in self.players:
-            if player.chess_id == player_id:
-                player.update(**updated_data)
-                self.save_players()
-                return f"Player {player_id} updated successfully!"
-        return "Player ID not found."
+        summary = {"rows": 0, "added": 0, "updated": 0, "unchanged": 0, "duplicates": 0, "rejected": []}
+        accepted = {}
+        without_id = []
+        batch = []
+        for item in rows:
+            batch.append(item)
+            if len(batch) == batch_size:
+                self._validate_batch(batch, accepted, without_id, summary)
+                batch = []
+        self._validate_batch(batch, accepted, without_id, summary)
+
+        if without_id:
+            known = {_natural_key(p_data): chess_id for chess_id, p_data in self.store.records.items()}
+            known.update((_natural_key(p_data), chess_id) for chess_id, p_data in accepted.items())
+            new_players = []
+            for p_data in without_id:
+                key = _natural_key(p_data)
+                chess_id = known.get(key)
+                if chess_id is None:
+                    new_players.append(p_data)
+                    known[key] = _NEW_PLAYER
+                elif chess_id is _NEW_PLAYER or chess_id in accepted:
+                    summary["duplicates"] += 1
+                else:
+                    p_data["chess_id"] = chess_id
+                    accepted[chess_id] = p_data
+            for p_data, chess_id in zip(new_players, self.store.ids.allocate(len(new_players))):
+                p_data["chess_id"] = chess_id
+                accepted[chess_id] = p_data
+
+        changed = []
+        for chess_id, p_data in accepted.items():
+            existing = self.store.get(chess_id)
+            if existing is None:
+                summary["added"] += 1
+            elif _natural_key(existing) == _natural_key(p_data):
+                summary["unchanged"] += 1
+                continue
+            else:
+                summary["updated"] += 1
+            changed.append(p_data)
+        self.store.upsert(changed)
+        return summary
+
+    def _validate_batch(self, batch, accepted, without_id, summary):
+        summary["rows"] += len(batch)
+        invalid = {}
+        for field in ("first_name", "last_name"):
+            for index in find_invalid_names([row[field] for _, row in batch]):
+                invalid.setdefault(index, f"invalid {field} '{batch[index][1][field]}'")
+        for index, (line, row) in enumerate(batch):
+            reason = invalid.get(index)
+            chess_id = row["chess_id"]
+            if reason is None and chess_id and not CHESS_ID_PATTERN.fullmatch(chess_id):
+                reason = f"invalid chess_id '{chess_id}'"
+            if reason is None:
+                try:
+                    birth_date = parse_birth_date(row["birth_date"])
+                except ValueError:
+                    reason = f"invalid birth date '{row['birth_date']}'"
+            if reason is not None:
+                summary["rejected"].append(f"line {line}: {reason}")
+                continue
+            p_data = {"first_name": row["first_name"], "last_name": row["last_name"],
+                      "birth_date": birth_date, "chess_id": chess_id}
+            if not chess_id:
+                without_id.append(p_data)
+            elif chess_id in accepted:
+                summary["duplicates"] += 1
+            else:
+                accepted[chess_id] = p_data
 
     def get_all_players(self):
         """
@@ -88,15 +281,56 @@ class UserManager:
         """
         return self.players
 
+    def get_sorted_players(self):
+        """
+        Retourne tous les joueurs par ordre alphabétique (voir Player.sort_key).
+
+        La liste triée est construite au premier appel puis conservée jusqu'à l'ajout ou la modification
+        d'un joueur ; elle ne doit pas être modifiée.
+
+        Returns:
+            list: Les joueurs, triés par prénom puis par nom.
+        """
+        players = self._index()
+        if self._sorted_players is None:
+            self._sorted_players = sorted(players.values(), key=SORT_KEY)
+        return self._sorted_players
+
     def generate_unique_chess_id(self):
         """
         Génère un ID unique pour un joueur d'échecs.
 
+        L'ID est réservé dès sa génération : deux appels successifs ne retournent jamais le même ID,
+        même si le premier joueur n'est pas encore enregistré.
+
         Returns:
             str: ID unique généré.
         """
-        existing_ids = {player.chess_id for player in self.players}
-        while True:
-            new_id = ''.join(random.choices(string.ascii_uppercase, k=2)) + ''.join(random.choices(string.digits, k=5))
-            if new_id not in existing_ids:
-                return new_id
+        return self.store.ids.allocate()[0]
+
+    def allocate_chess_ids(self, count):
+        """
+        Génère d'un coup des ID uniques pour de nombreux joueurs (importation d'une fédération).
+
+        Args:
+            count (int): Le nombre d'ID à générer.
+
+        Returns:
+            list: Les ID générés.
+
+        Raises:
+            ValueError: S'il ne reste pas assez d'ID libres.
+        """
+        return self.store.ids.allocate(count)
+
+
+def _current_player(player, p_data):
+    if player is not None and (player.first_name, player.last_name, str(player.birth_date)) == (
+            p_data["first_name"], p_data["last_name"], str(p_data["birth_date"])):
+        return player
+    return Player.from_dict(p_data)
+
+
+def _natural_key(p_data):
+    birth_date = p_data["birth_date"]
+    return (p_data["last_name"].lower(), p_data["first_name"].lower(), str(birth_date))
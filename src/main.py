@@ -2,20 +2,36 @@
 Point d'entrée principal de l'application de gestion de tournoi d'échecs.
 
 Ce fichier initialise et démarre le contrôleur de l'application qui gère l'ensemble du flux de travail.
+Il propose aussi des sous-commandes non interactives, par exemple :
+
+    python src/main.py create tournoi.json
+    python src/main.py pair "Nom du tournoi"
+    python src/main.py results resultats.csv
+    python src/main.py export rounds "Nom du tournoi" --format both
 """
 
+import sys
 from controllers.application_controller import ApplicationController
+from controllers.cli_controller import CommandLineController, build_parser
+
+DEFAULT_DATA_FILE = 'src/data/tournaments.json'
 
 
 def main():
     """
     Fonction principale de l'application.
 
-    Cette fonction initialise le contrôleur de l'application avec le chemin du fichier de données des tournois
-    et démarre l'application.
+    Avec une sous-commande, celle-ci est exécutée sans interaction. Sinon, cette fonction initialise le
+    contrôleur de l'application avec le chemin du fichier de données des tournois et démarre l'application
+    interactive.
     """
+    args = build_parser(DEFAULT_DATA_FILE).parse_args()
+
+    if args.command is not None:
+        sys.exit(CommandLineController(args.data, args.output_dir, args.sequential_ids).run(args))
+
     # Initialiser le contrôleur de l'application avec le chemin vers le fichier JSON des tournois
-    app_controller = ApplicationController('src/data/tournaments.json')
+    app_controller = ApplicationController(args.data)
     # Démarrer l'application
     app_controller.start()
 
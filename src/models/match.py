@@ -1,8 +1,47 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from .player import Player
 
+NOT_PLAYED = (0.0, 0.0)
+WHITE_WINS = (1.0, 0.0)
+BLACK_WINS = (0.0, 1.0)
+DRAW = (0.5, 0.5)
+# Les scores possibles sont partagés par tous les matchs : un score lu dans un fichier ou saisi ne crée
+# ni tuple ni flottant par match.
+SCORES = {score: score for score in (NOT_PLAYED, WHITE_WINS, BLACK_WINS, DRAW)}
+# Les victoires s'affichent en points entiers, comme avant le passage des scores en flottants.
+DISPLAYED_SCORES = {WHITE_WINS: (1, 0), BLACK_WINS: (0, 1)}
 
-@dataclass
+
+def make_score(values):
+    """
+    Convertit un score en couple de flottants, partagé avec les autres matchs s'il s'agit d'un score usuel.
+
+    Args:
+        values (iterable): Les points des deux joueurs, par exemple [1, 0] ou ("0.5", "0.5").
+
+    Returns:
+        tuple: Le score du match.
+    """
+    score = tuple(float(value) for value in values)
+    if len(score) != 2:
+        raise ValueError(f"A match score has two values, got {len(score)}")
+    return SCORES.get(score, score)
+
+
+def displayed_score(score):
+    """
+    Retourne un score tel qu'il est affiché dans les rapports et dans le terminal.
+
+    Args:
+        score (tuple): Le score du match.
+
+    Returns:
+        tuple: Le score, avec des points entiers pour une victoire ((1, 0) plutôt que (1.0, 0.0)).
+    """
+    return DISPLAYED_SCORES.get(score, score)
+
+
+@dataclass(slots=True)
 class Match:
     """
     Représente un match dans un tour d'un tournoi d'échecs.
@@ -10,11 +49,11 @@ class Match:
     Attributes:
         id (int): Identifiant unique pour chaque match.
         players (tuple): Les deux joueurs du match.
-        score (tuple): Le score du match (par défaut (0.0, 0.0)).
+        score (tuple): Le score du match, un couple de flottants (par défaut NOT_PLAYED).
     """
     id: int  # Identifiant unique pour chaque match
     players: tuple
-    score: tuple = field(default_factory=lambda: (0.0, 0.0))
+    score: tuple = NOT_PLAYED
 
     def update_player_scores(self):
         """
@@ -24,32 +63,46 @@ class Match:
         self.players[1].score += self.score[1]
 
     def __str__(self):
-        return f"Match {self.id}: {self.players[0]} vs {self.players[1]}, Score: {self.score}"
+        return f"Match {self.id}: {self.players[0]} vs {self.players[1]}, Score: {displayed_score(self.score)}"
 
     def as_dict(self):
         """
         Convertit l'objet Match en dictionnaire.
 
+        Les joueurs sont référencés par leur chess_id ; leurs informations sont conservées une seule fois
+        dans la liste des joueurs du tournoi.
+
         Returns:
             dict: Le dictionnaire représentant le match.
         """
         return {
             "id": self.id,
-            "players": [player.as_dict() for player in self.players],
+            "players": [player.chess_id for player in self.players],
             "score": self.score
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, players=None):
         """
         Crée un objet Match à partir d'un dictionnaire.
 
+        Les joueurs référencés par leur chess_id sont résolus dans la table des joueurs fournie, afin que
+        le match partage les mêmes objets Player que le tournoi. L'ancien format, où chaque match
+        embarque une copie complète des joueurs, reste accepté.
+
         Args:
             data (dict): Le dictionnaire contenant les données du match.
+            players (dict): La table des joueurs du tournoi, indexée par chess_id.
 
         Returns:
             Match: L'objet Match créé.
         """
-        players = tuple(Player.from_dict(p_data) for p_data in data["players"])
-        score = tuple(data["score"])
-        return cls(id=data["id"], players=players, score=score)
+        players = players if players is not None else {}
+        resolved = []
+        for p_data in data["players"]:
+            if isinstance(p_data, dict):
+                player = players.get(p_data["chess_id"]) or Player.from_dict(p_data)
+            else:
+                player = players[p_data]
+            resolved.append(player)
+        return cls(id=data["id"], players=tuple(resolved), score=make_score(data["score"]))
@@ -3,14 +3,39 @@ Module pour la gestion des joueurs d'échecs.
 
 Ce module contient la classe Player qui représente un joueur d'échecs avec ses
 informations personnelles et son score. La classe permet de convertir un joueur
-en dictionnaire et de créer un joueur à partir d'un dictionnaire.
+en dictionnaire et de créer un joueur à partir d'un dictionnaire. La fonction collation_key donne la
+clé de tri alphabétique d'un nom, sans distinction de casse ni d'accents.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 import datetime
+import unicodedata
 
 
-@dataclass
+def collation_key(text):
+    """
+    Retourne la clé de tri alphabétique d'un texte, sans distinction de casse ni d'accents.
+
+    C'est la seule normalisation des noms de l'application : le tri des joueurs, la recherche exacte du
+    registre (PlayerStore.find) et la recherche approchée (PlayerSearchIndex) l'utilisent toutes.
+
+    Args:
+        text (str): Le texte, par exemple un prénom ou un nom.
+
+    Returns:
+        str: Le texte en minuscules et sans accents ("Émile" devient "emile").
+    """
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+SORT_KEY = attrgetter("sort_key")
+
+
+@dataclass(slots=True)
 class Player:
     """
     Classe représentant un joueur d'échecs.
@@ -27,6 +52,25 @@ class Player:
     birth_date: datetime.date
     chess_id: str
     score: float = 0.0
+    _sort_key: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def sort_key(self):
+        """
+        Clé de tri alphabétique du joueur (prénom puis nom, sans distinction de casse ni d'accents).
+
+        La clé est calculée au premier accès puis conservée ; elle est recalculée si le prénom ou le nom
+        a été modifié depuis.
+
+        Returns:
+            tuple: La clé de tri ; les noms d'origine départagent les noms qui ne diffèrent que par la casse
+            ou les accents.
+        """
+        key = self._sort_key
+        if key is None or key[2] is not self.first_name or key[3] is not self.last_name:
+            key = (collation_key(self.first_name), collation_key(self.last_name), self.first_name, self.last_name)
+            self._sort_key = key
+        return key
 
     def __str__(self):
         """
@@ -37,20 +81,27 @@ class Player:
         """
         return f"{self.first_name} {self.last_name}, Score: {self.score}"
 
-    def as_dict(self):
+    def as_dict(self, with_score=True):
         """
         Convertit le joueur en un dictionnaire.
 
+        Args:
+            with_score (bool): Indique si le score doit être inclus. Le registre des joueurs ne conserve
+                que les informations personnelles, le score appartenant à chaque tournoi.
+
         Returns:
-            dict: Dictionnaire représentant le joueur avec ses informations personnelles et son score.
+            dict: Dictionnaire représentant le joueur avec ses informations personnelles et son score. La date
+            de naissance reste un objet date, encodé par le module codec lors de l'enregistrement.
         """
-        return {
+        data = {
             "first_name": self.first_name,
             "last_name": self.last_name,
-            "birth_date": self.birth_date.isoformat(),
-            "chess_id": self.chess_id,
-            "score": self.score
+            "birth_date": self.birth_date,
+            "chess_id": self.chess_id
         }
+        if with_score:
+            data["score"] = self.score
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -63,7 +114,9 @@ class Player:
         Returns:
             Player: Instance de Player créée à partir des données fournies.
         """
-        birth_date = datetime.datetime.strptime(data["birth_date"], "%Y-%m-%d").date()
+        birth_date = data["birth_date"]
+        if not isinstance(birth_date, datetime.date):
+            birth_date = datetime.datetime.strptime(birth_date, "%Y-%m-%d").date()
         return cls(
             first_name=data["first_name"],
             last_name=data["last_name"],
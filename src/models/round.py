@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List
 import datetime
-from .match import Match
+from .match import Match, NOT_PLAYED
+from .player import Player
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     """
     Représente un tour dans un tournoi d'échecs.
@@ -14,11 +15,13 @@ class Round:
         matches (List[Match]): La liste des matchs du tour.
         start_time (datetime.datetime): L'heure de début du tour.
         end_time (datetime.datetime): L'heure de fin du tour.
+        bye (Player): Le joueur exempté lors de ce tour (nombre de joueurs impair), ou None.
     """
     name: str
     matches: List[Match] = field(default_factory=list)
     start_time: datetime.datetime = None
     end_time: datetime.datetime = None
+    bye: Player = None
 
     def start_round(self, resume=False):
         """
@@ -53,7 +56,7 @@ class Round:
             Match: Le premier match non complété ou None si tous les matchs sont terminés.
         """
         for match in self.matches:
-            if match.score == (0.0, 0.0):
+            if match.score == NOT_PLAYED:
                 return match
         return None
 
@@ -73,7 +76,7 @@ class Round:
         Returns:
             bool: True si tous les matchs sont complétés, False sinon.
         """
-        return all(match.score != (0.0, 0.0) for match in self.matches)
+        return all(match.score != NOT_PLAYED for match in self.matches)
 
     def __str__(self):
         round_details = f"{self.name} - Start: {self.start_time}, End: {self.end_time}\n"
@@ -89,27 +92,41 @@ class Round:
         Convertit l'objet Round en dictionnaire.
 
         Returns:
-            dict: Le dictionnaire représentant le tour.
+            dict: Le dictionnaire représentant le tour. Les heures de début et de fin restent des objets
+            datetime, encodés par le module codec lors de l'enregistrement.
         """
         return {
             "name": self.name,
             "matches": [match.as_dict() for match in self.matches],
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "bye": self.bye.chess_id if self.bye else None
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, players=None):
         """
         Crée un objet Round à partir d'un dictionnaire.
 
         Args:
             data (dict): Le dictionnaire contenant les données du tour.
+            players (dict): La table des joueurs du tournoi, indexée par chess_id, utilisée pour résoudre
+                les joueurs des matchs.
 
         Returns:
             Round: L'objet Round créé.
         """
-        matches = [Match.from_dict(match_data) for match_data in data.get("matches", [])]
-        start_time = datetime.datetime.fromisoformat(data["start_time"]) if data["start_time"] else None
-        end_time = datetime.datetime.fromisoformat(data["end_time"]) if data["end_time"] else None
-        return cls(name=data["name"], matches=matches, start_time=start_time, end_time=end_time)
+        matches = [Match.from_dict(match_data, players) for match_data in data.get("matches", [])]
+        start_time = _parse_datetime(data["start_time"])
+        end_time = _parse_datetime(data["end_time"])
+        bye = None
+        if data.get("bye"):
+            players = players if players is not None else {}
+            bye = players.get(data["bye"])
+        return cls(name=data["name"], matches=matches, start_time=start_time, end_time=end_time, bye=bye)
+
+
+def _parse_datetime(value):
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value) if value else None
+    return value
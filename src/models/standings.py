@@ -0,0 +1,335 @@
+"""
+Module pour le classement incrémental d'un tournoi.
+
+Ce module contient la classe Standings qui tient à jour, résultat après résultat, les points,
+le Buchholz, le Sonneborn-Berger et les confrontations directes des joueurs d'un tournoi. Le
+classement est conservé dans un arbre ordonné (treap) qui permet d'obtenir les k premiers et le
+rang d'un joueur sans retrier la liste des joueurs.
+"""
+
+import random
+
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split(node, key):
+    """
+    Sépare un arbre en deux : les clés strictement inférieures à key et les autres.
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _erase(node, key):
+    if node is None:
+        return None
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _erase(node.left, key)
+    else:
+        node.right = _erase(node.right, key)
+    _update(node)
+    return node
+
+
+class OrderedKeys:
+    """
+    Ensemble ordonné de clés (treap) avec rang et sélection en O(log n).
+    """
+
+    def __init__(self):
+        self._root = None
+        self._random = random.Random(0)
+
+    def __len__(self):
+        return _size(self._root)
+
+    def add(self, key):
+        """
+        Ajoute une clé à l'ensemble.
+
+        Args:
+            key (tuple): La clé à ajouter.
+        """
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, self._random.random())), right)
+
+    def remove(self, key):
+        """
+        Retire une clé de l'ensemble.
+
+        Args:
+            key (tuple): La clé à retirer.
+        """
+        self._root = _erase(self._root, key)
+
+    def rank(self, key):
+        """
+        Retourne le nombre de clés strictement inférieures à key.
+
+        Args:
+            key (tuple): La clé recherchée.
+
+        Returns:
+            int: Le rang de la clé (à partir de 0).
+        """
+        rank = 0
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                rank += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def first(self, k):
+        """
+        Retourne les k plus petites clés, dans l'ordre, par un parcours infixe interrompu.
+
+        Args:
+            k (int): Le nombre de clés à retourner.
+
+        Returns:
+            list: Les k premières clés.
+        """
+        keys = []
+        stack = []
+        node = self._root
+        while (stack or node is not None) and len(keys) < k:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys
+
+
+class Standings:
+    """
+    Classement incrémental d'un tournoi.
+
+    Pour chaque joueur (identifié par son chess_id) sont tenus à jour :
+    les points, le Buchholz (somme des points des adversaires rencontrés), le Sonneborn-Berger
+    (somme des points des adversaires pondérés par le résultat obtenu contre eux) et les points
+    marqués en confrontation directe. L'ordre du classement est : points, Buchholz,
+    Sonneborn-Berger, puis chess_id.
+
+    Attributes:
+        points (dict): Les points de chaque joueur.
+        buchholz (dict): Le Buchholz de chaque joueur.
+        sonneborn_berger (dict): Le Sonneborn-Berger de chaque joueur.
+    """
+
+    def __init__(self):
+        """
+        Initialise un classement vide.
+        """
+        self.points = {}
+        self.buchholz = {}
+        self.sonneborn_berger = {}
+        self._games = {}
+        self._head_to_head = {}
+        self._keys = {}
+        self._order = OrderedKeys()
+
+    def add_player(self, chess_id, points=0.0):
+        """
+        Ajoute un joueur au classement.
+
+        Args:
+            chess_id (str): L'identifiant du joueur.
+            points (float): Les points de départ du joueur.
+        """
+        if chess_id in self._keys:
+            return
+        self.points[chess_id] = points
+        self.buchholz[chess_id] = 0.0
+        self.sonneborn_berger[chess_id] = 0.0
+        self._games[chess_id] = []
+        self._reposition(chess_id)
+
+    def record_result(self, white_id, black_id, white_score, black_score):
+        """
+        Enregistre le résultat d'une partie et met à jour les joueurs concernés.
+
+        Seuls les deux joueurs et leurs adversaires précédents changent de place dans le classement.
+
+        Args:
+            white_id (str): L'identifiant du joueur ayant les blancs.
+            black_id (str): L'identifiant du joueur ayant les noirs.
+            white_score (float): Les points marqués par les blancs.
+            black_score (float): Les points marqués par les noirs.
+        """
+        for chess_id in (white_id, black_id):
+            self.add_player(chess_id)
+
+        self.buchholz[white_id] += self.points[black_id]
+        self.sonneborn_berger[white_id] += self.points[black_id] * white_score
+        self.buchholz[black_id] += self.points[white_id]
+        self.sonneborn_berger[black_id] += self.points[white_id] * black_score
+        self._games[white_id].append((black_id, white_score, black_score))
+        self._games[black_id].append((white_id, black_score, white_score))
+        self._head_to_head[(white_id, black_id)] = self._head_to_head.get((white_id, black_id), 0.0) + white_score
+        self._head_to_head[(black_id, white_id)] = self._head_to_head.get((black_id, white_id), 0.0) + black_score
+
+        affected = {white_id, black_id}
+        affected.update(self._add_points(white_id, white_score))
+        affected.update(self._add_points(black_id, black_score))
+        for chess_id in affected:
+            self._reposition(chess_id)
+
+    def record_bye(self, chess_id, points=1.0):
+        """
+        Enregistre l'exemption d'un joueur.
+
+        Args:
+            chess_id (str): L'identifiant du joueur exempté.
+            points (float): Les points accordés pour l'exemption.
+        """
+        self.add_player(chess_id)
+        affected = {chess_id}
+        affected.update(self._add_points(chess_id, points))
+        for affected_id in affected:
+            self._reposition(affected_id)
+
+    def _add_points(self, chess_id, points):
+        """
+        Ajoute des points à un joueur et répercute la hausse sur les départages de ses adversaires.
+
+        Returns:
+            list: Les identifiants des adversaires dont les départages ont changé.
+        """
+        self.points[chess_id] += points
+        opponents = []
+        for opponent_id, _, opponent_score in self._games[chess_id]:
+            self.buchholz[opponent_id] += points
+            self.sonneborn_berger[opponent_id] += points * opponent_score
+            opponents.append(opponent_id)
+        return opponents
+
+    def _key(self, chess_id):
+        return (-self.points[chess_id], -self.buchholz[chess_id], -self.sonneborn_berger[chess_id], chess_id)
+
+    def _reposition(self, chess_id):
+        old_key = self._keys.get(chess_id)
+        new_key = self._key(chess_id)
+        if old_key == new_key:
+            return
+        if old_key is not None:
+            self._order.remove(old_key)
+        self._order.add(new_key)
+        self._keys[chess_id] = new_key
+
+    def top(self, k):
+        """
+        Retourne les k premiers du classement.
+
+        Args:
+            k (int): Le nombre de joueurs à retourner.
+
+        Returns:
+            list: Des tuples (chess_id, points, buchholz, sonneborn_berger), du premier au k-ième.
+        """
+        return [(key[3], -key[0], -key[1], -key[2]) for key in self._order.first(k)]
+
+    def rank(self, chess_id):
+        """
+        Retourne le rang d'un joueur dans le classement.
+
+        Args:
+            chess_id (str): L'identifiant du joueur.
+
+        Returns:
+            int: Le rang du joueur, à partir de 1.
+        """
+        return self._order.rank(self._keys[chess_id]) + 1
+
+    def head_to_head(self, chess_id, opponent_id):
+        """
+        Retourne les points marqués par un joueur contre un adversaire donné.
+
+        Args:
+            chess_id (str): L'identifiant du joueur.
+            opponent_id (str): L'identifiant de l'adversaire.
+
+        Returns:
+            float: Les points marqués en confrontation directe.
+        """
+        return self._head_to_head.get((chess_id, opponent_id), 0.0)
+
+    def as_rows(self):
+        """
+        Retourne le classement complet.
+
+        Returns:
+            list: Des tuples (chess_id, points, buchholz, sonneborn_berger), dans l'ordre du classement.
+        """
+        return self.top(len(self._order))
+
+    @classmethod
+    def from_rounds(cls, players, rounds):
+        """
+        Reconstruit un classement à partir de l'historique des tours.
+
+        Les matchs non joués (score (0, 0)) sont ignorés ; un joueur exempté reçoit un point.
+
+        Args:
+            players (list): Les joueurs du tournoi.
+            rounds (list): Les tours du tournoi.
+
+        Returns:
+            Standings: Le classement reconstruit.
+        """
+        standings = cls()
+        for player in players:
+            standings.add_player(player.chess_id)
+        for round in rounds:
+            if round.bye is not None:
+                standings.record_bye(round.bye.chess_id)
+            for match in round.matches:
+                if tuple(match.score) != (0.0, 0.0):
+                    standings.record_result(match.players[0].chess_id, match.players[1].chess_id, *match.score)
+        return standings
@@ -2,10 +2,15 @@ from dataclasses import dataclass, field
 from typing import List
 import datetime
 from .round import Round
-from .player import Player
+from .player import Player, SORT_KEY
+from .standings import Standings
 
+NOT_STARTED = "not_started"
+PAUSED = "paused"
+FINISHED = "finished"
 
-@dataclass
+
+@dataclass(slots=True, init=False)
 class Tournament:
     """
     Représente un tournoi d'échecs.
@@ -20,6 +25,10 @@ class Tournament:
         rounds (List[Round]): La liste des tours du tournoi.
         players (List[Player]): La liste des joueurs du tournoi.
         current_round (int): Le tour en cours.
+
+    Un tournoi chargé en mode paresseux (voir from_dict) conserve son dictionnaire brut et ne construit
+    ses joueurs et ses tours qu'au premier accès à l'attribut players ou rounds. Les listes sont rangées
+    dans _players et _rounds, qui valent None tant qu'elles ne sont pas construites.
     """
     name: str
     location: str
@@ -27,9 +36,102 @@ class Tournament:
     end_date: datetime.date
     description: str
     number_of_rounds: int
-    rounds: List[Round] = field(default_factory=list)
-    players: List[Player] = field(default_factory=list)
-    current_round: int = 0
+    current_round: int
+    _rounds: List[Round] = field(repr=False)
+    _players: List[Player] = field(repr=False)
+    _raw: dict = field(repr=False, compare=False)
+    _registry: dict = field(repr=False, compare=False)
+    _standings: Standings = field(repr=False, compare=False)
+    _sorted_players: List[Player] = field(repr=False, compare=False)
+
+    def __init__(self, name, location, start_date, end_date, description, number_of_rounds, rounds=None,
+                 players=None, current_round=0):
+        """
+        Initialise le Tournament.
+
+        Args:
+            name (str): Le nom du tournoi.
+            location (str): Le lieu du tournoi.
+            start_date (datetime.date): La date de début du tournoi.
+            end_date (datetime.date): La date de fin du tournoi.
+            description (str): La description du tournoi.
+            number_of_rounds (int): Le nombre de tours dans le tournoi.
+            rounds (List[Round]): La liste des tours du tournoi. Par défaut, une liste vide.
+            players (List[Player]): La liste des joueurs du tournoi. Par défaut, une liste vide.
+            current_round (int): Le tour en cours.
+        """
+        self.name = name
+        self.location = location
+        self.start_date = start_date
+        self.end_date = end_date
+        self.description = description
+        self.number_of_rounds = number_of_rounds
+        self.current_round = current_round
+        self._rounds = rounds if rounds is not None else []
+        self._players = players if players is not None else []
+        self._raw = None
+        self._registry = None
+        self._standings = None
+        self._sorted_players = None
+
+    @property
+    def players(self):
+        """
+        Liste des joueurs du tournoi, construite au premier accès pour un tournoi paresseux.
+
+        Returns:
+            List[Player]: Les joueurs du tournoi.
+        """
+        if self._players is None:
+            self.hydrate()
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        self._players = players
+        self._sorted_players = None
+
+    @property
+    def rounds(self):
+        """
+        Liste des tours du tournoi, construite au premier accès pour un tournoi paresseux.
+
+        Returns:
+            List[Round]: Les tours du tournoi.
+        """
+        if self._rounds is None:
+            self.hydrate()
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, rounds):
+        self._rounds = rounds
+
+    def is_hydrated(self):
+        """
+        Vérifie si les joueurs et les tours du tournoi ont été construits.
+
+        Returns:
+            bool: True si le tournoi est entièrement construit, False s'il est encore paresseux.
+        """
+        return self._raw is None
+
+    def hydrate(self):
+        """
+        Construit les joueurs et les tours d'un tournoi paresseux à partir de son dictionnaire brut.
+
+        Un attribut déjà remplacé (par exemple rounds lors d'une réinitialisation) n'est pas reconstruit.
+        """
+        data = self._raw
+        if data is None:
+            return
+        if self._players is None:
+            self._players = _build_players(data, self._registry)
+        if self._rounds is None:
+            interned = {player.chess_id: player for player in self._players}
+            self._rounds = [Round.from_dict(r_data, interned) for r_data in data.get("rounds", [])]
+        self._raw = None
+        self._registry = None
 
     def add_player(self, player: Player):
         """
@@ -39,6 +141,21 @@ class Tournament:
             player (Player): Le joueur à ajouter.
         """
         self.players.append(player)
+        self._sorted_players = None
+
+    def get_sorted_players(self):
+        """
+        Retourne les joueurs du tournoi par ordre alphabétique (voir Player.sort_key).
+
+        La liste triée est construite au premier appel puis conservée jusqu'à l'ajout d'un joueur ;
+        elle ne doit pas être modifiée.
+
+        Returns:
+            list: Les joueurs du tournoi, triés par prénom puis par nom.
+        """
+        if self._sorted_players is None or len(self._sorted_players) != len(self.players):
+            self._sorted_players = sorted(self.players, key=SORT_KEY)
+        return self._sorted_players
 
     def add_round(self, round: Round):
         """
@@ -55,6 +172,67 @@ class Tournament:
         else:
             raise ValueError("Cannot add more rounds than specified")
 
+    def get_status(self):
+        """
+        Retourne l'état d'avancement du tournoi, déduit du tour en cours.
+
+        Returns:
+            str: NOT_STARTED si aucun tour n'est terminé, FINISHED si tous les tours sont terminés,
+            PAUSED sinon.
+        """
+        if self.current_round <= 0:
+            return NOT_STARTED
+        if self.current_round >= self.number_of_rounds:
+            return FINISHED
+        return PAUSED
+
+    def get_standings(self):
+        """
+        Retourne le classement du tournoi, reconstruit à partir des tours lors du premier appel puis
+        tenu à jour à chaque résultat.
+
+        Returns:
+            Standings: Le classement du tournoi.
+        """
+        if self._standings is None:
+            self._standings = Standings.from_rounds(self.players, self.rounds)
+        return self._standings
+
+    def record_result(self, match):
+        """
+        Répercute le résultat d'un match sur le classement, s'il a déjà été construit.
+
+        Args:
+            match (Match): Le match dont le score vient d'être saisi.
+        """
+        if self._standings is not None:
+            self._standings.record_result(match.players[0].chess_id, match.players[1].chess_id, *match.score)
+
+    def record_bye(self, player):
+        """
+        Répercute l'exemption d'un joueur sur le classement, s'il a déjà été construit.
+
+        Args:
+            player (Player): Le joueur exempté.
+        """
+        if self._standings is not None:
+            self._standings.record_bye(player.chess_id)
+
+    def reset_standings(self):
+        """
+        Oublie le classement, qui sera reconstruit à partir des tours lors du prochain accès.
+        """
+        self._standings = None
+
+    def verify_standings(self):
+        """
+        Vérifie que le classement incrémental est identique au classement reconstruit à partir des tours.
+
+        Returns:
+            bool: True si les deux classements sont identiques, False sinon.
+        """
+        return self.get_standings().as_rows() == Standings.from_rounds(self.players, self.rounds).as_rows()
+
     def get_current_round(self):
         """
         Retourne le tour en cours ou un nouveau tour si tous les tours sont terminés.
@@ -97,48 +275,119 @@ class Tournament:
             f"Rounds:\n    {rounds_str}"
         )
 
-    def as_dict(self):
+    def as_dict(self, registry=None):
         """
         Convertit l'objet Tournament en dictionnaire.
 
+        Si un registre est fourni, les informations personnelles des joueurs y sont enregistrées une seule
+        fois par chess_id et le tournoi ne conserve que leur chess_id et leur score. Sans registre, le
+        dictionnaire est autonome et contient les joueurs complets. Les dates restent des objets date,
+        encodés par le module codec lors de l'enregistrement.
+
+        Args:
+            registry (dict): Le registre des joueurs, indexé par chess_id, à compléter.
+
         Returns:
             dict: Le dictionnaire représentant le tournoi.
         """
+        if self._players is None:
+            players = _raw_players_as_dict(self._raw, self._registry, registry)
+        elif registry is None:
+            players = [player.as_dict() for player in self.players]
+        else:
+            players = []
+            for player in self.players:
+                registry[player.chess_id] = player.as_dict(with_score=False)
+                players.append({"chess_id": player.chess_id, "score": player.score})
+        if self._rounds is None:
+            rounds = [_raw_round_as_dict(r_data) for r_data in self._raw.get("rounds", [])]
+        else:
+            rounds = [round.as_dict() for round in self.rounds]
         return {
             "name": self.name,
             "location": self.location,
-            "start_date": self.start_date.isoformat(),
-            "end_date": self.end_date.isoformat(),
+            "start_date": self.start_date,
+            "end_date": self.end_date,
             "description": self.description,
             "number_of_rounds": self.number_of_rounds,
             "current_round": self.current_round,
-            "players": [player.as_dict() for player in self.players],
-            "rounds": [round.as_dict() for round in self.rounds]
+            "players": players,
+            "rounds": rounds
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, registry=None, lazy=False):
         """
         Crée un objet Tournament à partir d'un dictionnaire.
 
+        Les joueurs du tournoi peuvent être complets ou ne contenir que leur chess_id et leur score,
+        auquel cas leurs informations sont lues dans le registre. Les joueurs des tours et des matchs
+        sont ensuite résolus par chess_id dans une table d'internement, si bien que chaque joueur
+        n'existe qu'en un seul exemplaire dans le tournoi.
+
         Args:
             data (dict): Le dictionnaire contenant les données du tournoi.
+            registry (dict): Le registre des joueurs, indexé par chess_id.
+            lazy (bool): Si True, seules les informations générales sont lues ; les joueurs et les tours
+                sont construits au premier accès.
 
         Returns:
             Tournament: L'objet Tournament créé.
         """
-        start_date = datetime.datetime.strptime(data["start_date"], "%Y-%m-%d").date()
-        end_date = datetime.datetime.strptime(data["end_date"], "%Y-%m-%d").date()
-        players = [Player.from_dict(p_data) for p_data in data["players"]]
-        rounds = [Round.from_dict(r_data) for r_data in data.get("rounds", [])]
-        return cls(
+        start_date = _parse_date(data["start_date"])
+        end_date = _parse_date(data["end_date"])
+        registry = registry if registry is not None else {}
+        tournament = cls(
             name=data["name"],
             location=data["location"],
             start_date=start_date,
             end_date=end_date,
             description=data["description"],
             number_of_rounds=data["number_of_rounds"],
-            current_round=data.get("current_round", 0),
-            players=players,
-            rounds=rounds
+            current_round=data.get("current_round", 0)
         )
+        tournament._players = None
+        tournament._rounds = None
+        tournament._raw = data
+        tournament._registry = registry
+        if not lazy:
+            tournament.hydrate()
+        return tournament
+
+
+def _parse_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _build_players(data, registry):
+    players = []
+    for p_data in data["players"]:
+        if "first_name" not in p_data:
+            p_data = {**registry[p_data["chess_id"]], "score": p_data.get("score", 0.0)}
+        players.append(Player.from_dict(p_data))
+    return players
+
+
+def _raw_players_as_dict(data, source_registry, registry):
+    players = []
+    for p_data in data["players"]:
+        if "first_name" in p_data:
+            identity = {key: value for key, value in p_data.items() if key != "score"}
+        else:
+            identity = source_registry[p_data["chess_id"]]
+        if registry is None:
+            players.append({**identity, "score": p_data.get("score", 0.0)})
+        else:
+            registry[p_data["chess_id"]] = identity
+            players.append({"chess_id": p_data["chess_id"], "score": p_data.get("score", 0.0)})
+    return players
+
+
+def _raw_round_as_dict(data):
+    matches = [
+        {**m_data, "players": [p if isinstance(p, str) else p["chess_id"] for p in m_data["players"]]}
+        for m_data in data.get("matches", [])
+    ]
+    return {**data, "matches": matches}
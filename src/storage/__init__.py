@@ -0,0 +1 @@
+"""Define the storage backends."""
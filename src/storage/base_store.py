@@ -0,0 +1,89 @@
+"""
+Module définissant l'interface commune des stockages de tournois.
+
+Ce module contient la classe BaseStore dont héritent les différents stockages (journal JSON,
+SQLite). Le dépôt des tournois et le TournamentManager ne dépendent que de cette interface.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class BaseStore(ABC):
+    """
+    Interface commune des stockages de tournois.
+
+    Les données échangées ont la forme du fichier tournaments.json : {"players": {...}, "tournaments": [...]}.
+    Les modifications sont transmises sous forme d'événements (add_tournament, round_start, match_result,
+    round_end, reset, reset_all, upsert_player).
+    """
+
+    @abstractmethod
+    def exists(self):
+        """
+        Vérifie si des données ont déjà été enregistrées.
+
+        Returns:
+            bool: True si des données existent, False sinon.
+        """
+
+    @abstractmethod
+    def load(self):
+        """
+        Charge toutes les données des tournois.
+
+        Returns:
+            dict: Les données des tournois, sous la forme {"players": {...}, "tournaments": [...]}.
+        """
+
+    def stream(self):
+        """
+        Parcourt les données des tournois un tournoi à la fois.
+
+        Par défaut, toutes les données sont chargées puis parcourues ; un stockage peut redéfinir cette
+        méthode pour ne jamais construire la liste complète des tournois.
+
+        Yields:
+            tuple: ("players", registre des joueurs) puis ("tournament", dictionnaire d'un tournoi) pour
+            chaque tournoi, dans l'ordre.
+        """
+        data = self.load()
+        yield "players", data.get("players")
+        for t_data in data.get("tournaments", []):
+            yield "tournament", t_data
+
+    @abstractmethod
+    def append(self, event):
+        """
+        Enregistre un événement de modification.
+
+        Args:
+            event (dict): L'événement à enregistrer.
+        """
+
+    def needs_compaction(self):
+        """
+        Vérifie si le stockage doit être compacté par une sauvegarde complète.
+
+        Returns:
+            bool: True si une sauvegarde complète est nécessaire, False sinon.
+        """
+        return False
+
+    @abstractmethod
+    def compact(self, data):
+        """
+        Remplace toutes les données enregistrées par les données fournies.
+
+        Args:
+            data (dict): Les données complètes des tournois.
+        """
+
+    def flush(self):
+        """
+        Écrit immédiatement les modifications en attente, pour les stockages qui en diffèrent l'écriture.
+        """
+
+    def close(self):
+        """
+        Libère les ressources du stockage après avoir écrit les modifications en attente.
+        """
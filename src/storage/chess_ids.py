@@ -0,0 +1,127 @@
+"""
+Module pour l'attribution des identifiants des joueurs.
+
+Ce module contient la classe ChessIdAllocator qui attribue des chess_id uniques (deux lettres
+majuscules suivies de cinq chiffres, par exemple "AB12345"). Les identifiants déjà pris sont tenus
+dans un ensemble mis à jour au chargement et à chaque ajout de joueur, si bien qu'une attribution ne
+parcourt jamais la liste des joueurs. En mode aléatoire, une collision est résolue en prenant
+l'identifiant libre suivant ; le nombre de tentatives est donc borné même quand l'espace se remplit.
+"""
+
+import random
+import re
+
+ID_SPACE = 26 * 26 * 100_000
+CHESS_ID_PATTERN = re.compile(r"[A-Z]{2}\d{5}")
+_RANDOM_DRAWS = 8
+
+
+def format_chess_id(number):
+    """
+    Convertit un numéro (de 0 à ID_SPACE - 1) en chess_id.
+
+    Args:
+        number (int): Le numéro de l'identifiant.
+
+    Returns:
+        str: Le chess_id correspondant ("AA00000" pour 0, "ZZ99999" pour ID_SPACE - 1).
+    """
+    letters, digits = divmod(number, 100_000)
+    first, second = divmod(letters, 26)
+    return f"{chr(65 + first)}{chr(65 + second)}{digits:05d}"
+
+
+class ChessIdAllocator:
+    """
+    Distributeur de chess_id uniques.
+
+    Attributes:
+        sequential (bool): Si True, les identifiants sont attribués dans l'ordre ("AA00000",
+            "AA00001", ...), en sautant ceux déjà pris ; l'attribution est alors déterministe.
+    """
+
+    def __init__(self, used_ids=(), sequential=False, seed=None):
+        """
+        Initialise le ChessIdAllocator.
+
+        Args:
+            used_ids (iterable): Les identifiants déjà pris.
+            sequential (bool): Si True, les identifiants sont attribués dans l'ordre.
+            seed (int): La graine du tirage aléatoire, pour reproduire une attribution.
+        """
+        self.sequential = sequential
+        self._used = set()
+        self._taken = 0
+        self._cursor = 0
+        self._random = random.Random(seed)
+        self.update(used_ids)
+
+    def __contains__(self, chess_id):
+        return chess_id in self._used
+
+    def __len__(self):
+        return len(self._used)
+
+    def add(self, chess_id):
+        """
+        Marque un identifiant comme pris.
+
+        Args:
+            chess_id (str): L'identifiant.
+        """
+        if chess_id not in self._used:
+            self._used.add(chess_id)
+            if CHESS_ID_PATTERN.fullmatch(chess_id):
+                self._taken += 1
+
+    def update(self, chess_ids):
+        """
+        Marque plusieurs identifiants comme pris.
+
+        Args:
+            chess_ids (iterable): Les identifiants.
+        """
+        for chess_id in chess_ids:
+            self.add(chess_id)
+
+    def allocate(self, count=1):
+        """
+        Attribue des identifiants libres et les marque comme pris.
+
+        Args:
+            count (int): Le nombre d'identifiants à attribuer.
+
+        Returns:
+            list: Les identifiants attribués, dans l'ordre d'attribution.
+
+        Raises:
+            ValueError: Si l'espace des identifiants ne contient plus assez d'identifiants libres.
+        """
+        if self._taken + count > ID_SPACE:
+            raise ValueError(f"Only {ID_SPACE - self._taken} chess ids left, {count} requested")
+        allocated = []
+        for _ in range(count):
+            chess_id = self._next_sequential() if self.sequential else self._next_random()
+            self.add(chess_id)
+            allocated.append(chess_id)
+        return allocated
+
+    def _next_sequential(self):
+        while True:
+            chess_id = format_chess_id(self._cursor)
+            self._cursor = (self._cursor + 1) % ID_SPACE
+            if chess_id not in self._used:
+                return chess_id
+
+    def _next_random(self):
+        for _ in range(_RANDOM_DRAWS):
+            chess_id = format_chess_id(self._random.randrange(ID_SPACE))
+            if chess_id not in self._used:
+                return chess_id
+        # L'espace est presque plein : l'identifiant libre qui suit le dernier tirage est pris.
+        number = self._random.randrange(ID_SPACE)
+        while True:
+            chess_id = format_chess_id(number)
+            if chess_id not in self._used:
+                return chess_id
+            number = (number + 1) % ID_SPACE
@@ -0,0 +1,177 @@
+"""
+Module d'encodage et de décodage JSON des données enregistrées.
+
+Ce module utilise orjson lorsqu'il est installé et le module json de la bibliothèque standard sinon.
+La sortie est compacte par défaut ; l'indentation (option pretty) n'est destinée qu'à la lecture
+humaine lors du débogage. Les dates et les dates-heures sont encodées directement au format ISO 8601,
+si bien que les modèles n'ont pas à les convertir en chaînes avant l'enregistrement.
+
+La fonction iter_items lit un document sans le construire entièrement en mémoire : le fichier est lu
+par morceaux et les éléments d'un tableau de premier niveau (les tournois) sont décodés un par un.
+"""
+
+import datetime
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data, pretty=False):
+    """
+    Encode des données en JSON.
+
+    Args:
+        data (any): Les données à encoder (dictionnaires, listes, chaînes, nombres, dates).
+        pretty (bool): Si True, la sortie est indentée pour être lue par un humain.
+
+    Returns:
+        bytes: Le document JSON encodé en UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, default=_default, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw):
+    """
+    Décode un document JSON.
+
+    Args:
+        raw (bytes | str): Le document JSON.
+
+    Returns:
+        any: Les données décodées.
+
+    Raises:
+        JSONDecodeError: Si le document n'est pas du JSON valide.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load(path):
+    """
+    Lit et décode un fichier JSON.
+
+    Args:
+        path (Path): Le chemin du fichier.
+
+    Returns:
+        any: Les données décodées.
+    """
+    with open(path, "rb") as file:
+        return loads(file.read())
+
+
+def iter_items(path, key, chunk_size=1 << 16):
+    """
+    Parcourt un fichier JSON contenant un objet, sans construire le document entier en mémoire.
+
+    Chaque clé de premier niveau est retournée avec sa valeur, sauf la clé indiquée dont le tableau est
+    parcouru élément par élément : chacun de ses éléments est retourné séparément, dès qu'il est décodé.
+
+    Args:
+        path (Path): Le chemin du fichier.
+        key (str): La clé du tableau à parcourir élément par élément (par exemple "tournaments").
+        chunk_size (int): La taille des morceaux lus dans le fichier.
+
+    Yields:
+        tuple: Des couples (clé, valeur), dans l'ordre du fichier.
+
+    Raises:
+        JSONDecodeError: Si le document n'est pas du JSON valide.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        reader = _ChunkReader(file, chunk_size)
+        yield from _iter_items(reader, key)
+
+
+def _iter_items(reader, key):
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    yield key, reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.expect(",")
+            reader.expect("]")
+        else:
+            yield name, reader.value()
+        if reader.peek() != ",":
+            break
+        reader.expect(",")
+    reader.expect("}")
+
+
+class _ChunkReader:
+    """
+    Lecteur de texte JSON par morceaux, qui décode une valeur à la fois avec json.JSONDecoder.raw_decode.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size):
+        data = self.file.read(size)
+        if not data:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill(self.chunk_size)
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+                # Un nombre en fin de tampon peut être tronqué : il faut lire la suite pour conclure.
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill(size)
+            size *= 2
@@ -0,0 +1,326 @@
+"""
+Module pour le stockage journalisé des tournois.
+
+Ce module contient la classe JournalStore qui conserve les tournois sous la forme d'un
+instantané JSON complété par un journal d'événements en ajout seul (un événement JSON par
+ligne). Chaque événement est synchronisé sur disque dès son écriture, si bien que le coût
+d'une sauvegarde dépend de la taille du changement et non de la taille de l'historique.
+Le journal est périodiquement compacté dans l'instantané.
+"""
+
+import os
+from pathlib import Path
+from storage import codec
+from storage.base_store import BaseStore
+
+
+class JournalStore(BaseStore):
+    """
+    Stockage des tournois par instantané et journal d'événements.
+
+    Les événements sont rejoués sur les dictionnaires de l'instantané lors du chargement ; les
+    événements upsert_player le sont sur le registre des joueurs.
+    Leur application est idempotente : rejouer un journal déjà compacté ne modifie pas les données.
+    Un événement add_tournament portant le nom d'un tournoi existant est ignoré : un tournoi n'est
+    jamais remplacé.
+
+    Attributes:
+        snapshot_path (Path): Le chemin vers l'instantané JSON des tournois.
+        journal_path (Path): Le chemin vers le journal d'événements.
+        compact_every (int): Le nombre d'événements au-delà duquel le journal doit être compacté.
+        pretty (bool): Si True, l'instantané est indenté pour être lu par un humain (débogage).
+        pending_events (int): Le nombre d'événements présents dans le journal.
+    """
+
+    def __init__(self, snapshot_path, compact_every=500, pretty=False):
+        """
+        Initialise le JournalStore.
+
+        Args:
+            snapshot_path (str): Le chemin vers l'instantané JSON des tournois.
+            compact_every (int): Le nombre d'événements au-delà duquel le journal doit être compacté.
+            pretty (bool): Si True, l'instantané est indenté pour être lu par un humain (débogage).
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_suffix(".journal")
+        self.compact_every = compact_every
+        self.pretty = pretty
+        self.pending_events = 0
+
+    def exists(self):
+        """
+        Vérifie si des données ont déjà été enregistrées.
+
+        Returns:
+            bool: True si l'instantané ou le journal existe, False sinon.
+        """
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def load(self):
+        """
+        Charge l'instantané puis rejoue le journal par-dessus.
+
+        Returns:
+            dict: Les données des tournois, sous la forme {"tournaments": [...]}.
+        """
+        data = {"tournaments": []}
+        if self.snapshot_path.exists():
+            data = codec.load(self.snapshot_path)
+        tournaments = data.setdefault("tournaments", [])
+
+        events = self.read_events()
+        player_events = [event for event in _flatten(events) if event.get("type") == "upsert_player"]
+        if player_events:
+            data["players"] = _replay_players(data.get("players"), player_events)
+        replay_events(tournaments, events)
+        self.pending_events = len(events)
+        return data
+
+    def stream(self):
+        """
+        Parcourt l'instantané un tournoi à la fois, journal compris, sans charger le document entier.
+
+        Chaque tournoi de l'instantané est décodé, mis à jour avec les événements du journal qui le
+        concernent, puis transmis ; les tournois ajoutés par le journal suivent ceux de l'instantané.
+
+        Yields:
+            tuple: ("players", registre des joueurs) ou ("tournament", dictionnaire d'un tournoi).
+        """
+        events = self.read_events()
+        self.pending_events = len(events)
+        by_name, global_events = _index_events(events)
+        player_events = [event for event in _flatten(events) if event.get("type") == "upsert_player"]
+
+        seen = set()
+        if self.snapshot_path.exists():
+            for key, value in codec.iter_items(self.snapshot_path, "tournaments"):
+                if key == "players":
+                    yield "players", _replay_players(value, player_events)
+                    player_events = []
+                elif key == "tournaments":
+                    name = value["name"].lower()
+                    seen.add(name)
+                    yield "tournament", _replay_one([value], by_name.get(name, []), global_events)
+
+        added = {}
+        for name, tournament_events in by_name.items():
+            if name not in seen:
+                positions = [position for position, event in tournament_events
+                             if event.get("type") == "add_tournament"]
+                if positions:
+                    added[name] = positions[0]
+        for name in sorted(added, key=added.get):
+            yield "tournament", _replay_one([], by_name[name], global_events)
+        if player_events:
+            yield "players", _replay_players(None, player_events)
+
+    def read_events(self):
+        """
+        Lit les événements du journal.
+
+        Une dernière ligne incomplète (écriture interrompue par un arrêt brutal) est retirée du
+        journal pour que les prochains ajouts repartent d'une ligne propre.
+
+        Returns:
+            list: La liste des événements du journal.
+        """
+        if not self.journal_path.exists():
+            return []
+
+        raw = self.journal_path.read_bytes()
+        end = raw.rfind(b"\n") + 1
+        if end < len(raw):
+            with self.journal_path.open("r+b") as file:
+                file.truncate(end)
+
+        events = []
+        for line in raw[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                events.append(codec.loads(line))
+            except codec.JSONDecodeError:
+                continue
+        return events
+
+    def append(self, event):
+        """
+        Ajoute un événement à la fin du journal et le synchronise sur disque.
+
+        Args:
+            event (dict): L'événement à enregistrer.
+        """
+        line = codec.dumps(event) + b"\n"
+        with self.journal_path.open("ab") as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+        self.pending_events += 1
+
+    def needs_compaction(self):
+        """
+        Vérifie si le journal a atteint le seuil de compaction.
+
+        Returns:
+            bool: True si le journal doit être compacté, False sinon.
+        """
+        return self.pending_events >= self.compact_every
+
+    def compact(self, data):
+        """
+        Écrit un nouvel instantané complet puis vide le journal.
+
+        L'instantané est d'abord écrit dans un fichier temporaire puis remplace l'ancien de
+        manière atomique ; un arrêt pendant la compaction laisse donc l'ancien instantané et le
+        journal intacts.
+
+        Args:
+            data (dict): Les données complètes des tournois.
+        """
+        temp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with temp_path.open("wb") as file:
+            file.write(codec.dumps(data, pretty=self.pretty))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self.journal_path.unlink(missing_ok=True)
+        self.pending_events = 0
+
+
+def replay_events(tournaments, events):
+    """
+    Applique une liste d'événements du journal sur les dictionnaires des tournois.
+
+    Args:
+        tournaments (list): La liste des dictionnaires représentant les tournois (modifiée en place).
+        events (list): La liste des événements à appliquer, dans l'ordre.
+    """
+    by_name = {t["name"].lower(): t for t in tournaments}
+
+    for event in _flatten(events):
+        event_type = event.get("type")
+
+        if event_type == "reset_all":
+            for tournament in tournaments:
+                _reset(tournament)
+            continue
+
+        if event_type == "upsert_player":
+            continue
+
+        if event_type == "add_tournament":
+            # Comme TournamentManager.add_tournament, un tournoi existant n'est jamais remplacé.
+            tournament = event["tournament"]
+            if tournament["name"].lower() not in by_name:
+                tournaments.append(tournament)
+                by_name[tournament["name"].lower()] = tournament
+            continue
+
+        tournament = by_name.get(event.get("tournament", "").lower())
+        if tournament is None:
+            continue
+
+        if event_type == "reset":
+            _reset(tournament)
+        elif event_type == "round_start":
+            rounds = tournament.setdefault("rounds", [])
+            round_data = event["round"]
+            index = next((i for i, r in enumerate(rounds) if r["name"] == round_data["name"]), None)
+            if index is None:
+                rounds.append(round_data)
+            else:
+                rounds[index] = round_data
+            _apply_scores(tournament, [], event.get("scores", {}))
+        elif event_type == "match_result":
+            _apply_match_result(tournament, event)
+        elif event_type == "round_end":
+            round_data = _find_round(tournament, event["round"])
+            if round_data is not None:
+                round_data["end_time"] = event["end_time"]
+            tournament["current_round"] = event["current_round"]
+
+
+def _index_events(events):
+    """
+    Regroupe les événements par tournoi en conservant leur rang dans le journal.
+
+    Returns:
+        tuple: Les événements de chaque tournoi (indexés par nom en minuscules, dans l'ordre du premier
+        événement) et les événements globaux (reset_all), sous forme de couples (rang, événement).
+    """
+    by_name = {}
+    global_events = []
+    for position, event in enumerate(_flatten(events)):
+        if event.get("type") == "reset_all":
+            global_events.append((position, event))
+            continue
+        if event.get("type") == "upsert_player":
+            continue
+        tournament = event.get("tournament")
+        name = tournament["name"] if isinstance(tournament, dict) else tournament or ""
+        by_name.setdefault(name.lower(), []).append((position, event))
+    return by_name, global_events
+
+
+def _replay_one(tournaments, tournament_events, global_events):
+    """
+    Rejoue sur un seul tournoi ses événements et les événements globaux, dans l'ordre du journal.
+
+    Returns:
+        dict: Le tournoi mis à jour, ou None s'il n'existe pas à la fin du journal.
+    """
+    events = sorted(tournament_events + global_events, key=lambda item: item[0])
+    replay_events(tournaments, [event for _, event in events])
+    return tournaments[0] if tournaments else None
+
+
+def _replay_players(players, player_events):
+    """
+    Applique les ajouts et modifications de joueurs du journal sur le registre des joueurs.
+
+    Returns:
+        dict: Le registre des joueurs mis à jour, indexé par chess_id.
+    """
+    if isinstance(players, list):
+        players = {p_data["chess_id"]: p_data for p_data in players}
+    players = players or {}
+    for event in player_events:
+        players[event["player"]["chess_id"]] = event["player"]
+    return players
+
+
+def _flatten(events):
+    for event in events:
+        if event.get("type") == "batch":
+            yield from _flatten(event["events"])
+        else:
+            yield event
+
+
+def _reset(tournament):
+    tournament["current_round"] = 0
+    tournament["rounds"] = []
+    for player in tournament.get("players", []):
+        player["score"] = 0.0
+
+
+def _find_round(tournament, round_name):
+    return next((r for r in tournament.get("rounds", []) if r["name"] == round_name), None)
+
+
+def _apply_match_result(tournament, event):
+    round_data = _find_round(tournament, event["round"])
+    if round_data is None:
+        return
+    match = next((m for m in round_data.get("matches", []) if m["id"] == event["match"]), None)
+    if match is None:
+        return
+
+    match["score"] = event["score"]
+    _apply_scores(tournament, match.get("players", []), event.get("scores", {}))
+
+
+def _apply_scores(tournament, match_players, scores):
+    for player in tournament.get("players", []) + match_players:
+        if isinstance(player, dict) and player.get("chess_id") in scores:
+            player["score"] = scores[player["chess_id"]]
@@ -0,0 +1,196 @@
+"""
+Module pour le registre des joueurs.
+
+Ce module contient la classe PlayerStore qui tient le registre des joueurs indexé par chess_id. Le
+registre est enregistré dans le même stockage que les tournois (clé "players" de l'instantané JSON,
+table players de SQLite) : chaque ajout ou modification de joueur n'écrit qu'un événement
+"upsert_player", et la compaction du journal réécrit le registre complet avec les tournois.
+"""
+
+from models.player import collation_key
+from storage.chess_ids import ChessIdAllocator
+from storage.search_index import PlayerSearchIndex
+
+
+class PlayerStore:
+    """
+    Registre des joueurs, indexé par chess_id et partagé par les tournois et les rapports.
+
+    Attributes:
+        store (BaseStore): Le stockage des tournois, dans lequel les modifications sont enregistrées.
+        records (dict): Les dictionnaires des joueurs (sans score), indexés par chess_id.
+        ids (ChessIdAllocator): Le distributeur des chess_id, qui connaît tous les identifiants du registre.
+        version (int): Le numéro de version du registre, incrémenté à chaque ajout ou modification d'un
+            joueur ; il permet aux vues construites à partir du registre de savoir qu'elles sont périmées.
+    """
+
+    def __init__(self, store, players_data=(), sequential_ids=False):
+        """
+        Initialise le PlayerStore.
+
+        Args:
+            store (BaseStore): Le stockage des tournois.
+            players_data (iterable): Les dictionnaires des joueurs déjà enregistrés.
+            sequential_ids (bool): Si True, les nouveaux chess_id sont attribués dans l'ordre.
+        """
+        self.store = store
+        self.records = {}
+        self.ids = ChessIdAllocator(sequential=sequential_ids)
+        self.version = 0
+        self._by_name = None
+        self._search_index = None
+        self.register(players_data)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, chess_id):
+        return chess_id in self.records
+
+    def get(self, chess_id):
+        """
+        Retourne le dictionnaire d'un joueur.
+
+        Args:
+            chess_id (str): L'identifiant du joueur.
+
+        Returns:
+            dict: Le dictionnaire du joueur, ou None s'il est inconnu.
+        """
+        return self.records.get(chess_id)
+
+    def values(self):
+        """
+        Retourne les dictionnaires de tous les joueurs, dans l'ordre d'enregistrement.
+
+        Returns:
+            list: La liste des dictionnaires des joueurs.
+        """
+        return list(self.records.values())
+
+    def changed(self, players_data):
+        """
+        Retourne ceux des joueurs fournis qui sont absents du registre ou dont les informations diffèrent.
+
+        Args:
+            players_data (iterable): Les dictionnaires des joueurs.
+
+        Returns:
+            list: Les dictionnaires des joueurs nouveaux ou modifiés.
+        """
+        changed = []
+        for p_data in players_data:
+            existing = self.records.get(p_data["chess_id"])
+            if existing is None or _identity(existing) != _identity(p_data):
+                changed.append(p_data)
+        return changed
+
+    def find(self, query):
+        """
+        Recherche des joueurs par chess_id ou par nom, sans tenir compte de la casse ni des accents.
+
+        Le nom recherché est le nom de famille, "prénom nom" ou "nom prénom". L'index des noms est
+        construit à la première recherche puis tenu à jour à chaque ajout ou modification.
+
+        Args:
+            query (str): Le chess_id ou le nom recherché.
+
+        Returns:
+            list: Les dictionnaires des joueurs trouvés.
+        """
+        query = query.strip()
+        if query.upper() in self.records:
+            return [self.records[query.upper()]]
+        if self._by_name is None:
+            self._by_name = {}
+            for p_data in self.records.values():
+                self._index_name(p_data)
+        return [self.records[chess_id] for chess_id in self._by_name.get(_normalize(query), ())]
+
+    def search(self, query, limit=10):
+        """
+        Recherche des joueurs par début de nom, de prénom ou de chess_id ou, à défaut, par similarité des noms.
+
+        L'index de recherche est construit à la première recherche puis tenu à jour à chaque ajout ou
+        modification (voir PlayerSearchIndex).
+
+        Args:
+            query (str): La recherche.
+            limit (int): Le nombre maximal de joueurs retournés.
+
+        Returns:
+            list: Les dictionnaires des joueurs trouvés, les meilleures correspondances en premier.
+        """
+        if self._search_index is None:
+            self._search_index = PlayerSearchIndex(self.records.values())
+        return self._search_index.search(query, limit)
+
+    def _index_name(self, p_data):
+        for key in _name_keys(p_data):
+            self._by_name.setdefault(key, {})[p_data["chess_id"]] = None
+
+    def _unindex_name(self, p_data):
+        for key in _name_keys(p_data):
+            self._by_name.get(key, {}).pop(p_data["chess_id"], None)
+
+    def _set(self, p_data):
+        chess_id = p_data["chess_id"]
+        if self._by_name is not None:
+            previous = self.records.get(chess_id)
+            if previous is not None:
+                self._unindex_name(previous)
+            self._index_name(p_data)
+        if self._search_index is not None:
+            self._search_index.add(p_data)
+        self.records[chess_id] = p_data
+        self.ids.add(chess_id)
+        self.version += 1
+
+    def register(self, players_data):
+        """
+        Ajoute au registre des joueurs déjà enregistrés par ailleurs (chargement, ajout d'un tournoi),
+        sans rien écrire.
+
+        Args:
+            players_data (iterable): Les dictionnaires des joueurs.
+        """
+        for p_data in players_data:
+            self._set(_without_score(p_data))
+
+    def upsert(self, players_data):
+        """
+        Ajoute ou remplace des joueurs et enregistre la modification.
+
+        Seuls les joueurs fournis sont écrits, en un seul événement, quelle que soit la taille du registre.
+
+        Args:
+            players_data (iterable): Les dictionnaires des joueurs.
+        """
+        events = []
+        for p_data in players_data:
+            p_data = _without_score(p_data)
+            self._set(p_data)
+            events.append({"type": "upsert_player", "player": p_data})
+        if len(events) == 1:
+            self.store.append(events[0])
+        elif events:
+            self.store.append({"type": "batch", "events": events})
+
+
+def _without_score(p_data):
+    if "score" in p_data:
+        return {key: value for key, value in p_data.items() if key != "score"}
+    return p_data
+
+
+def _normalize(text):
+    return " ".join(collation_key(text).split())
+
+
+def _name_keys(p_data):
+    first_name, last_name = _normalize(p_data["first_name"]), _normalize(p_data["last_name"])
+    return {last_name, f"{first_name} {last_name}", f"{last_name} {first_name}"}
+
+
+def _identity(p_data):
+    return p_data["first_name"], p_data["last_name"], str(p_data["birth_date"])
@@ -0,0 +1,207 @@
+"""
+Module pour la recherche des joueurs par nom.
+
+Ce module contient la classe PlayerSearchIndex, un index en mémoire des prénoms, noms et chess_id des
+joueurs. La recherche par préfixe utilise un tableau trié des mots (recherche dichotomique) ; la
+recherche approchée, pour les fautes de frappe, utilise un index des trigrammes des mots connus. L'index est
+tenu à jour à chaque ajout ou modification de joueur, sans être reconstruit.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from models.player import collation_key
+
+# Nombre maximal de positions des trigrammes comptées par recherche approchée : les trigrammes les plus
+# rares sont comptés d'abord, les plus fréquents apportant peu d'information.
+MAX_POSTINGS = 3_000
+MIN_SIMILARITY = 0.3
+# Nombre maximal d'entrées parcourues pour une recherche dont les mots ne sont pas dans l'ordre du nom.
+MAX_SCANNED = 3_000
+
+
+class PlayerSearchIndex:
+    """
+    Index de recherche des joueurs par préfixe et par similarité de trigrammes.
+
+    Le tableau trié contient, pour chaque joueur, chacun des mots de son nom, son nom complet dans les
+    deux ordres ("prénom nom" et "nom prénom") et son chess_id : une recherche de plusieurs mots comme
+    "jean dup" est ainsi elle aussi un simple intervalle du tableau.
+    """
+
+    def __init__(self, players_data=()):
+        """
+        Initialise le PlayerSearchIndex.
+
+        Args:
+            players_data (iterable): Les dictionnaires des joueurs à indexer.
+        """
+        self._numbers = {}
+        self._records = []
+        self._names = []
+        self._keys = []
+        self._vocabulary = []
+        self._word_numbers = {}
+        self._grams = {}
+        for p_data in players_data:
+            number = self._number(p_data)
+            self._keys.extend((key, number) for key in self._search_keys(number))
+            self._index_grams(number)
+        self._keys.sort()
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def add(self, p_data):
+        """
+        Ajoute un joueur à l'index, ou met à jour un joueur déjà indexé.
+
+        Args:
+            p_data (dict): Le dictionnaire du joueur.
+        """
+        number = self._numbers.get(p_data["chess_id"])
+        if number is not None:
+            self._remove(number)
+        number = self._number(p_data)
+        for key in self._search_keys(number):
+            insort(self._keys, (key, number))
+        self._index_grams(number)
+
+    def search(self, query, limit=10):
+        """
+        Recherche les joueurs correspondant à un début de nom, de prénom ou de chess_id ou, si aucun joueur
+        ne correspond, les joueurs dont le nom est proche de la recherche (fautes de frappe).
+
+        Args:
+            query (str): La recherche, par exemple "dup", "jean dup" ou "dupond".
+            limit (int): Le nombre maximal de joueurs retournés.
+
+        Returns:
+            list: Les dictionnaires des joueurs trouvés, les meilleures correspondances en premier.
+        """
+        words = _normalize(query).split()
+        if not words or limit <= 0:
+            return []
+        found = list(self._prefix_matches(" ".join(words), limit))
+        if not found and len(words) > 1:
+            found = list(self._all_words_matches(words, limit))
+        if not found and all(word.isalpha() for word in words):
+            found = self._fuzzy_matches(words, limit)[:limit]
+        return [self._records[number] for number in found]
+
+    def _number(self, p_data):
+        number = self._numbers.get(p_data["chess_id"])
+        if number is None:
+            number = len(self._records)
+            self._numbers[p_data["chess_id"]] = number
+            self._records.append(p_data)
+            self._names.append(None)
+        else:
+            self._records[number] = p_data
+        self._names[number] = _normalize(f"{p_data['first_name']} {p_data['last_name']}").split()
+        return number
+
+    def _search_keys(self, number):
+        words = self._names[number]
+        p_data = self._records[number]
+        first_name = _normalize(p_data["first_name"]).split()
+        last_name = _normalize(p_data["last_name"]).split()
+        keys = set(words)
+        keys.add(" ".join(words))
+        keys.add(" ".join(last_name + first_name))
+        keys.add(p_data["chess_id"].lower())
+        return keys
+
+    def _index_grams(self, number):
+        for name in self._names[number]:
+            if name not in self._word_numbers:
+                self._word_numbers[name] = len(self._vocabulary)
+                for gram in _word_trigrams(name):
+                    self._grams.setdefault(gram, []).append(len(self._vocabulary))
+                self._vocabulary.append(name)
+
+    def _remove(self, number):
+        for key in self._search_keys(number):
+            index = bisect_left(self._keys, (key, number))
+            if index < len(self._keys) and self._keys[index] == (key, number):
+                del self._keys[index]
+
+    def _range(self, prefix):
+        return bisect_left(self._keys, (prefix,)), bisect_left(self._keys, (prefix + "\uffff",))
+
+    def _range_of(self, word):
+        return bisect_left(self._keys, (word,)), bisect_left(self._keys, (word, len(self._records)))
+
+    def _prefix_matches(self, prefix, limit):
+        start, end = self._range(prefix)
+        seen = set()
+        for index in range(start, end):
+            number = self._keys[index][1]
+            if number not in seen:
+                seen.add(number)
+                yield number
+                if len(seen) == limit:
+                    return
+
+    def _all_words_matches(self, words, limit, max_scanned=MAX_SCANNED):
+        # Les mots dans un autre ordre ("dup jean") : le mot dont le préfixe couvre le moins d'entrées
+        # guide le parcours, les autres filtrent.
+        ranges = [(end - start, start, end, word) for word in words for start, end in [self._range(word)]]
+        _, start, end, guide = min(ranges)
+        others = [word for word in words if word != guide]
+        matches = 0
+        for index in range(start, min(end, start + max_scanned)):
+            number = self._keys[index][1]
+            names = self._names[number]
+            if all(any(name.startswith(other) for name in names) for other in others):
+                yield number
+                matches += 1
+                if matches == limit:
+                    return
+
+    def _fuzzy_matches(self, words, limit):
+        # Chaque mot de la recherche est rapproché des mots connus les plus semblables ; un joueur est
+        # noté par la somme, pour chaque mot de la recherche, de la meilleure similarité de ses mots.
+        similar = [self._similar_words(word, limit * 3) for word in words]
+        candidates = set()
+        for similarities in similar:
+            for word in sorted(similarities, key=similarities.get, reverse=True):
+                start, end = self._range_of(word)
+                candidates.update(number for _, number in self._keys[start:min(end, start + limit)])
+                if len(candidates) >= limit * 3:
+                    break
+        scored = []
+        for number in candidates:
+            names = self._names[number]
+            score = sum(max((similarities.get(name, 0.0) for name in names), default=0.0)
+                        for similarities in similar)
+            scored.append((-score, number))
+        scored.sort()
+        return [number for _, number in scored]
+
+    def _similar_words(self, word, count):
+        query_grams = _word_trigrams(word)
+        postings = sorted((self._grams.get(gram, ()) for gram in query_grams), key=len)
+        counts = Counter()
+        total = 0
+        for posting in postings:
+            if total and total + len(posting) > MAX_POSTINGS:
+                break
+            counts.update(posting)
+            total += len(posting)
+        similarities = {}
+        for index, _ in counts.most_common(count):
+            candidate = self._vocabulary[index]
+            grams = _word_trigrams(candidate)
+            similarity = len(query_grams & grams) / len(query_grams | grams)
+            if similarity >= MIN_SIMILARITY:
+                similarities[candidate] = similarity
+        return similarities
+
+
+def _normalize(text):
+    return collation_key(text).replace("-", " ")
+
+
+def _word_trigrams(word):
+    padded = f"  {word} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
@@ -0,0 +1,415 @@
+"""
+Module pour le stockage SQLite des tournois.
+
+Ce module contient la classe SQLiteStore qui enregistre les tournois, les joueurs, les tours et les
+matchs dans une base SQLite locale (module sqlite3 de la bibliothèque standard, sans serveur).
+Chaque événement est appliqué dans une transaction ; un résultat de match se traduit par la mise
+à jour d'une seule ligne de la table des matchs. Les recherches de tournois par nom ou par statut
+ne passent pas par des requêtes SQL : elles sont servies par les index en mémoire du TournamentManager,
+construits au chargement comme pour le journal JSON. Le module fournit aussi l'import et l'export du
+format tournaments.json.
+
+Usage :
+    python src/storage/sqlite_store.py import src/data/tournaments.json src/data/tournaments.db
+    python src/storage/sqlite_store.py export src/data/tournaments.db src/data/tournaments.json
+"""
+
+import argparse
+import datetime
+import sqlite3
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from storage.base_store import BaseStore  # noqa: E402
+from storage.journal_store import JournalStore  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    chess_id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    birth_date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    location TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    number_of_rounds INTEGER NOT NULL,
+    current_round INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tournaments_name_key ON tournaments (name_key);
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    chess_id TEXT NOT NULL REFERENCES players (chess_id),
+    position INTEGER NOT NULL,
+    score REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, chess_id)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_chess_id ON tournament_players (chess_id);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    bye_id TEXT,
+    UNIQUE (tournament_id, name)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    round_id INTEGER NOT NULL REFERENCES rounds (id) ON DELETE CASCADE,
+    match_id INTEGER NOT NULL,
+    player1_id TEXT NOT NULL,
+    player2_id TEXT NOT NULL,
+    score1 REAL NOT NULL DEFAULT 0,
+    score2 REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (round_id, match_id)
+);
+"""
+TOURNAMENT_COLUMNS = "id, name, location, start_date, end_date, description, number_of_rounds, current_round"
+
+
+class SQLiteStore(BaseStore):
+    """
+    Stockage des tournois dans une base SQLite.
+
+    Attributes:
+        path (Path): Le chemin vers le fichier de la base SQLite.
+    """
+
+    def __init__(self, path):
+        """
+        Initialise le SQLiteStore. La base n'est ouverte (et créée) qu'à la première utilisation.
+
+        Args:
+            path (str): Le chemin vers le fichier de la base SQLite.
+        """
+        self.path = Path(path)
+        self._connection = None
+
+    @property
+    def connection(self):
+        """
+        Connexion à la base, ouverte et initialisée au premier accès.
+
+        Returns:
+            sqlite3.Connection: La connexion à la base.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(SCHEMA)
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(rounds)")}
+            if "bye_id" not in columns:
+                self._connection.execute("ALTER TABLE rounds ADD COLUMN bye_id TEXT")
+        return self._connection
+
+    def close(self):
+        """
+        Ferme la connexion à la base.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def exists(self):
+        """
+        Vérifie si la base existe.
+
+        Returns:
+            bool: True si le fichier de la base existe, False sinon.
+        """
+        return self._connection is not None or self.path.exists()
+
+    def load(self):
+        """
+        Charge toutes les données de la base.
+
+        Returns:
+            dict: Les données des tournois, sous la forme {"players": {...}, "tournaments": [...]}.
+        """
+        db = self.connection
+        registry = self._registry(db)
+
+        tournaments = {}
+        for row in db.execute(f"SELECT {TOURNAMENT_COLUMNS} FROM tournaments ORDER BY position"):
+            tournaments[row[0]] = _tournament_data(row)
+
+        for tournament_id, chess_id, score in db.execute(
+                "SELECT tournament_id, chess_id, score FROM tournament_players ORDER BY tournament_id, position"):
+            tournaments[tournament_id]["players"].append({"chess_id": chess_id, "score": score})
+
+        rounds = {}
+        for round_id, tournament_id, name, start_time, end_time, bye_id in db.execute(
+                "SELECT id, tournament_id, name, start_time, end_time, bye_id FROM rounds "
+                "ORDER BY tournament_id, position"):
+            rounds[round_id] = {"name": name, "matches": [], "start_time": start_time, "end_time": end_time,
+                                "bye": bye_id}
+            tournaments[tournament_id]["rounds"].append(rounds[round_id])
+
+        for round_id, match_id, player1_id, player2_id, score1, score2 in db.execute(
+                "SELECT round_id, match_id, player1_id, player2_id, score1, score2 FROM matches "
+                "ORDER BY round_id, match_id"):
+            rounds[round_id]["matches"].append(
+                {"id": match_id, "players": [player1_id, player2_id], "score": [score1, score2]})
+
+        return {"players": registry, "tournaments": list(tournaments.values())}
+
+    def stream(self):
+        """
+        Parcourt les tournois de la base un par un, sans charger tous les tours et tous les matchs.
+
+        Le registre des joueurs est transmis en premier. La table des tournois est ensuite parcourue par
+        un curseur, et les joueurs, les tours et les matchs de chaque tournoi sont lus par des requêtes
+        sur ses seules lignes, grâce aux index des clés primaires.
+
+        Yields:
+            tuple: ("players", registre des joueurs) puis ("tournament", dictionnaire d'un tournoi) pour
+            chaque tournoi, dans l'ordre.
+        """
+        db = self.connection
+        yield "players", self._registry(db)
+        for row in db.execute(f"SELECT {TOURNAMENT_COLUMNS} FROM tournaments ORDER BY position"):
+            t_data = _tournament_data(row)
+            t_data["players"] = [
+                {"chess_id": chess_id, "score": score} for chess_id, score in db.execute(
+                    "SELECT chess_id, score FROM tournament_players WHERE tournament_id = ? ORDER BY position",
+                    (row[0],))
+            ]
+            rounds = {}
+            for round_id, name, start_time, end_time, bye_id in db.execute(
+                    "SELECT id, name, start_time, end_time, bye_id FROM rounds WHERE tournament_id = ? "
+                    "ORDER BY position", (row[0],)):
+                rounds[round_id] = {"name": name, "matches": [], "start_time": start_time, "end_time": end_time,
+                                    "bye": bye_id}
+                t_data["rounds"].append(rounds[round_id])
+            for round_id, match_id, player1_id, player2_id, score1, score2 in db.execute(
+                    "SELECT matches.round_id, match_id, player1_id, player2_id, score1, score2 FROM matches "
+                    "JOIN rounds ON rounds.id = matches.round_id WHERE rounds.tournament_id = ? "
+                    "ORDER BY matches.round_id, match_id", (row[0],)):
+                rounds[round_id]["matches"].append(
+                    {"id": match_id, "players": [player1_id, player2_id], "score": [score1, score2]})
+            yield "tournament", t_data
+
+    def append(self, event):
+        """
+        Applique un événement dans une transaction.
+
+        Args:
+            event (dict): L'événement à appliquer.
+        """
+        with self.connection as db:
+            self._apply(db, event)
+
+    def _apply(self, db, event):
+        event_type = event.get("type")
+        if event_type == "batch":
+            for sub_event in event["events"]:
+                self._apply(db, sub_event)
+        elif event_type == "add_tournament":
+            self._add_tournament(db, event["tournament"])
+        elif event_type == "upsert_player":
+            self.upsert_players([event["player"]], db)
+        elif event_type == "reset_all":
+            db.execute("DELETE FROM rounds")
+            db.execute("UPDATE tournaments SET current_round = 0")
+            db.execute("UPDATE tournament_players SET score = 0")
+        elif event_type == "reset":
+            tournament_id = self._tournament_id(db, event["tournament"])
+            db.execute("DELETE FROM rounds WHERE tournament_id = ?", (tournament_id,))
+            db.execute("UPDATE tournaments SET current_round = 0 WHERE id = ?", (tournament_id,))
+            db.execute("UPDATE tournament_players SET score = 0 WHERE tournament_id = ?", (tournament_id,))
+        elif event_type == "round_start":
+            tournament_id = self._tournament_id(db, event["tournament"])
+            row = db.execute("SELECT position FROM rounds WHERE tournament_id = ? AND name = ?",
+                             (tournament_id, event["round"]["name"])).fetchone()
+            if row:
+                position = row[0]
+                db.execute("DELETE FROM rounds WHERE tournament_id = ? AND name = ?",
+                           (tournament_id, event["round"]["name"]))
+            else:
+                position = db.execute("SELECT COUNT(*) FROM rounds WHERE tournament_id = ?",
+                                      (tournament_id,)).fetchone()[0]
+            self._insert_round(db, tournament_id, position, event["round"])
+            self._update_scores(db, tournament_id, event.get("scores", {}))
+        elif event_type == "match_result":
+            tournament_id = self._tournament_id(db, event["tournament"])
+            db.execute(
+                "UPDATE matches SET score1 = ?, score2 = ? WHERE match_id = ? AND round_id = "
+                "(SELECT id FROM rounds WHERE tournament_id = ? AND name = ?)",
+                (*event["score"], event["match"], tournament_id, event["round"]))
+            self._update_scores(db, tournament_id, event.get("scores", {}))
+        elif event_type == "round_end":
+            tournament_id = self._tournament_id(db, event["tournament"])
+            db.execute("UPDATE rounds SET end_time = ? WHERE tournament_id = ? AND name = ?",
+                       (_iso(event["end_time"]), tournament_id, event["round"]))
+            db.execute("UPDATE tournaments SET current_round = ? WHERE id = ?",
+                       (event["current_round"], tournament_id))
+
+    def compact(self, data):
+        """
+        Remplace tout le contenu de la base par les données fournies, dans une seule transaction.
+
+        Args:
+            data (dict): Les données complètes des tournois.
+        """
+        registry = data.get("players") or {}
+        if isinstance(registry, list):
+            registry = {p_data["chess_id"]: p_data for p_data in registry}
+        with self.connection as db:
+            db.execute("DELETE FROM tournaments")
+            db.execute("DELETE FROM players")
+            self.upsert_players(registry.values(), db)
+            for position, t_data in enumerate(data.get("tournaments", [])):
+                self._insert_tournament(db, position, t_data)
+
+    def upsert_players(self, players_data, db=None):
+        """
+        Insère ou met à jour des joueurs, indexés par chess_id.
+
+        Args:
+            players_data (iterable): Les dictionnaires des joueurs.
+            db (sqlite3.Connection): Une connexion dans une transaction en cours. Par défaut, une
+                transaction est ouverte pour l'opération.
+        """
+        rows = [(p["chess_id"], p["first_name"], p["last_name"], _iso(p["birth_date"])) for p in players_data]
+        sql = ("INSERT INTO players (chess_id, first_name, last_name, birth_date) VALUES (?, ?, ?, ?) "
+               "ON CONFLICT (chess_id) DO UPDATE SET first_name = excluded.first_name, "
+               "last_name = excluded.last_name, birth_date = excluded.birth_date")
+        if db is not None:
+            db.executemany(sql, rows)
+        else:
+            with self.connection as connection:
+                connection.executemany(sql, rows)
+
+    def _registry(self, db):
+        return {
+            row[0]: {"first_name": row[1], "last_name": row[2], "birth_date": row[3], "chess_id": row[0]}
+            for row in db.execute("SELECT chess_id, first_name, last_name, birth_date FROM players")
+        }
+
+    def _tournament_id(self, db, tournament_name):
+        row = db.execute("SELECT id FROM tournaments WHERE name_key = ?", (tournament_name.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def _update_scores(self, db, tournament_id, scores):
+        db.executemany(
+            "UPDATE tournament_players SET score = ? WHERE tournament_id = ? AND chess_id = ?",
+            [(score, tournament_id, chess_id) for chess_id, score in scores.items()])
+
+    def _add_tournament(self, db, t_data):
+        # Comme dans le journal JSON, un tournoi existant n'est jamais remplacé.
+        if self._tournament_id(db, t_data["name"]) is not None:
+            return
+        position = db.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM tournaments").fetchone()[0]
+        self._insert_tournament(db, position, t_data)
+
+    def _insert_tournament(self, db, position, t_data):
+        self.upsert_players([p for p in t_data["players"] if "first_name" in p], db)
+        cursor = db.execute(
+            "INSERT INTO tournaments (position, name, name_key, location, start_date, end_date, description, "
+            "number_of_rounds, current_round) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (position, t_data["name"], t_data["name"].lower(), t_data["location"], _iso(t_data["start_date"]),
+             _iso(t_data["end_date"]), t_data["description"], t_data["number_of_rounds"],
+             t_data.get("current_round", 0)))
+        tournament_id = cursor.lastrowid
+        db.executemany(
+            "INSERT INTO tournament_players (tournament_id, chess_id, position, score) VALUES (?, ?, ?, ?)",
+            [(tournament_id, p["chess_id"], index, p.get("score", 0.0)) for index, p in enumerate(t_data["players"])])
+        for index, r_data in enumerate(t_data.get("rounds", [])):
+            self._insert_round(db, tournament_id, index, r_data)
+
+    def _insert_round(self, db, tournament_id, position, r_data):
+        cursor = db.execute(
+            "INSERT INTO rounds (tournament_id, position, name, start_time, end_time, bye_id) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (tournament_id, position, r_data["name"], _iso(r_data.get("start_time")), _iso(r_data.get("end_time")),
+             r_data.get("bye")))
+        round_id = cursor.lastrowid
+        rows = []
+        for m_data in r_data.get("matches", []):
+            player_ids = [p if isinstance(p, str) else p["chess_id"] for p in m_data["players"]]
+            rows.append((round_id, m_data["id"], *player_ids, *m_data["score"]))
+        db.executemany(
+            "INSERT INTO matches (round_id, match_id, player1_id, player2_id, score1, score2) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+def _iso(value):
+    # Les modèles transmettent leurs dates telles quelles ; elles sont enregistrées au format ISO 8601, sans
+    # adaptateur sqlite3 global qui changerait le comportement des autres connexions du processus.
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _tournament_data(row):
+    return {
+        "name": row[1], "location": row[2], "start_date": row[3], "end_date": row[4],
+        "description": row[5], "number_of_rounds": row[6], "current_round": row[7],
+        "players": [], "rounds": []
+    }
+
+
+def import_json(json_path, db_path):
+    """
+    Importe un fichier tournaments.json (et son journal éventuel) dans une base SQLite.
+
+    Args:
+        json_path (str): Le chemin du fichier JSON des tournois.
+        db_path (str): Le chemin de la base SQLite à remplir.
+
+    Returns:
+        int: Le nombre de tournois importés.
+    """
+    data = JournalStore(json_path).load()
+    store = SQLiteStore(db_path)
+    store.compact(data)
+    store.close()
+    return len(data["tournaments"])
+
+
+def export_json(db_path, json_path, pretty=False):
+    """
+    Exporte le contenu d'une base SQLite au format tournaments.json.
+
+    Args:
+        db_path (str): Le chemin de la base SQLite.
+        json_path (str): Le chemin du fichier JSON à écrire.
+        pretty (bool): Si True, le fichier JSON est indenté pour être lu par un humain.
+
+    Returns:
+        int: Le nombre de tournois exportés.
+    """
+    store = SQLiteStore(db_path)
+    data = store.load()
+    store.close()
+    JournalStore(json_path, pretty=pretty).compact(data)
+    return len(data["tournaments"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import et export entre tournaments.json et SQLite.")
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--pretty", action="store_true", help="Indenter le fichier JSON exporté (débogage).")
+    args = parser.parse_args()
+    if args.action == "import":
+        count = import_json(args.source, args.destination)
+    else:
+        count = export_json(args.source, args.destination, args.pretty)
+    print(f"{count} tournois copiés de {args.source} vers {args.destination}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Module pour le dépôt partagé des tournois.
+
+Ce module contient la classe TournamentRepository qui lit le fichier des tournois une seule fois
+et partage les objets Tournament construits entre les différents gestionnaires de l'application.
+Les tournois sont lus et construits un par un, sans garder le document entier en mémoire ; en mode
+paresseux, chaque tournoi conserve son propre dictionnaire brut jusqu'au premier accès à ses joueurs
+ou à ses tours.
+"""
+
+from pathlib import Path
+from models.tournament import Tournament
+from storage.journal_store import JournalStore
+from storage.player_store import PlayerStore
+from storage.sqlite_store import SQLiteStore
+from storage.write_behind import WriteBehindStore
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def open_store(filepath, flush_interval=None):
+    """
+    Choisit le stockage adapté au fichier de données d'après son extension.
+
+    Args:
+        filepath (Path): Le chemin vers le fichier de données.
+        flush_interval (float): Si fourni, les écritures du journal JSON sont différées et regroupées par un
+            WriteBehindStore, au plus une fois par intervalle (en secondes). Une base SQLite écrit chaque
+            événement dans sa propre transaction et n'est pas enveloppée.
+
+    Returns:
+        BaseStore: Un SQLiteStore pour une base SQLite (.db, .sqlite, .sqlite3), un JournalStore sinon.
+    """
+    if Path(filepath).suffix.lower() in SQLITE_SUFFIXES:
+        return SQLiteStore(filepath)
+    if flush_interval is not None:
+        return WriteBehindStore(JournalStore(filepath), flush_interval)
+    return JournalStore(filepath)
+
+
+class TournamentRepository:
+    """
+    Dépôt des tournois, chargé une seule fois et partagé par les gestionnaires.
+
+    Attributes:
+        filepath (Path): Le chemin vers le fichier de données des tournois.
+        store (BaseStore): Le stockage des tournois (journal JSON ou base SQLite).
+        parse_count (int): Le nombre de lectures complètes du fichier des tournois.
+        build_count (int): Le nombre d'objets Tournament construits à partir des données lues.
+        lazy (bool): Indique si les joueurs et les tours des tournois sont construits à la demande.
+    """
+
+    def __init__(self, filepath, lazy=False, flush_interval=None, sequential_ids=False):
+        """
+        Initialise le TournamentRepository.
+
+        Args:
+            filepath (str): Le chemin vers le fichier de données des tournois (JSON ou base SQLite).
+            lazy (bool): Si True, seules les informations générales des tournois sont construites au
+                chargement ; les joueurs et les tours le sont au premier accès.
+            flush_interval (float): Si fourni, délai maximal (en secondes) des écritures différées du
+                journal JSON (voir open_store).
+            sequential_ids (bool): Si True, les nouveaux chess_id sont attribués dans l'ordre plutôt
+                qu'au hasard (voir ChessIdAllocator).
+        """
+        self.filepath = Path(filepath)
+        self.lazy = lazy
+        self.sequential_ids = sequential_ids
+        self.store = open_store(self.filepath, flush_interval)
+        self.parse_count = 0
+        self.build_count = 0
+        self._data = None
+        self._tournaments = None
+        self._players_data = None
+        self._player_store = None
+
+    def exists(self):
+        """
+        Vérifie si des données de tournois ont déjà été enregistrées.
+
+        Returns:
+            bool: True si des données existent, False sinon.
+        """
+        return self.store.exists()
+
+    def load_data(self):
+        """
+        Retourne les données brutes des tournois, lues au premier appel uniquement.
+
+        Returns:
+            dict: Les données des tournois, sous la forme {"players": {...}, "tournaments": [...]}.
+        """
+        if self._data is None:
+            self._data = self.store.load() if self.store.exists() else {"tournaments": []}
+            self.parse_count += 1
+        return self._data
+
+    def get_tournaments(self):
+        """
+        Retourne la liste partagée des tournois, construite au premier appel uniquement.
+
+        Returns:
+            list: La liste des objets Tournament.
+        """
+        if self._tournaments is None:
+            if self._data is not None:
+                data = self._data
+                self._tournaments = self.build_tournaments(data.get("tournaments", []), data.get("players"))
+            else:
+                self._tournaments = self.stream_tournaments()
+        return self._tournaments
+
+    def stream_tournaments(self):
+        """
+        Lit et construit les tournois un par un, sans conserver leurs dictionnaires.
+
+        Le dictionnaire de chaque tournoi est libéré dès que le tournoi est construit, si bien que le
+        document complet et les objets construits ne sont jamais en mémoire en même temps. En mode
+        paresseux, chaque tournoi ne garde que son propre dictionnaire, jusqu'à sa construction. Les
+        joueurs sont cherchés dans le registre enregistré complété par les joueurs décrits en entier dans
+        les tournois (ancien format), et ces informations sont retenues au passage pour get_players_data.
+
+        Returns:
+            list: La liste des objets Tournament.
+        """
+        tournaments = []
+        if not self.store.exists():
+            self._players_data = {}
+            return tournaments
+
+        players = {}
+        pending = []
+        for key, value in self.store.stream():
+            if key == "players":
+                players.update(_as_registry(value))
+                for position, t_data in pending:
+                    tournaments[position] = Tournament.from_dict(t_data, players, lazy=self.lazy)
+                pending = []
+                continue
+            _add_embedded_players(players, value)
+            if _is_resolved(value, players):
+                tournaments.append(Tournament.from_dict(value, players, lazy=self.lazy))
+            else:
+                # Un joueur n'est pas encore connu : le tournoi attend le registre ou un tournoi qui le décrit.
+                pending.append((len(tournaments), value))
+                tournaments.append(None)
+        for position, t_data in pending:
+            tournaments[position] = Tournament.from_dict(t_data, players, lazy=self.lazy)
+
+        self.parse_count += 1
+        self.build_count += len(tournaments)
+        self._players_data = players
+        return tournaments
+
+    def iter_tournaments(self):
+        """
+        Lit et construit les tournois un par un, sans les conserver.
+
+        Contrairement à stream_tournaments, aucun tournoi n'est retenu par le dépôt : seul le registre des
+        joueurs reste en mémoire pendant le parcours, ce qui permet de traiter une archive de toute taille.
+        Les joueurs sont cherchés dans le registre enregistré complété par les joueurs décrits en entier
+        dans les tournois (ancien format) ; un tournoi qui référence un joueur pas encore lu n'est transmis
+        qu'une fois le registre lu.
+
+        Yields:
+            Tournament: Chaque tournoi, entièrement construit.
+        """
+        if not self.store.exists():
+            return
+        players = {}
+        pending = []
+        for key, value in self.store.stream():
+            if key == "players":
+                players.update(_as_registry(value))
+                for t_data in pending:
+                    yield Tournament.from_dict(t_data, players)
+                pending = []
+                continue
+            _add_embedded_players(players, value)
+            if _is_resolved(value, players):
+                yield Tournament.from_dict(value, players)
+            else:
+                pending.append(value)
+        for t_data in pending:
+            yield Tournament.from_dict(t_data, players)
+
+    def build_tournaments(self, tournaments_data, players_data=None):
+        """
+        Construit des objets Tournament à partir de leurs dictionnaires.
+
+        Args:
+            tournaments_data (list): La liste des dictionnaires représentant les tournois.
+            players_data (dict | list): Le registre des joueurs, indexé par chess_id. Une liste de
+                joueurs (ancien format) est également acceptée. Les joueurs décrits en entier dans les
+                tournois le complètent.
+
+        Returns:
+            list: La liste des objets Tournament construits.
+        """
+        registry = _merged_registry(tournaments_data, players_data)
+        tournaments = [Tournament.from_dict(t_data, registry, lazy=self.lazy) for t_data in tournaments_data]
+        self.build_count += len(tournaments)
+        return tournaments
+
+    def get_players_data(self):
+        """
+        Retourne les dictionnaires de tous les joueurs connus, sans construire d'objet Player.
+
+        Returns:
+            list: La liste des dictionnaires des joueurs, un par chess_id.
+        """
+        if self._players_data is None and self._data is None:
+            # Les joueurs sont retenus au passage lors de la lecture en flux des tournois.
+            self.get_tournaments()
+        if self._players_data is not None:
+            return list(self._players_data.values())
+        data = self.load_data()
+        return list(_merged_registry(data.get("tournaments", []), data.get("players")).values())
+
+    def get_player_store(self):
+        """
+        Retourne le registre partagé des joueurs, construit au premier appel uniquement.
+
+        Returns:
+            PlayerStore: Le registre des joueurs, indexé par chess_id.
+        """
+        if self._player_store is None:
+            players_data = self.get_players_data() if self.exists() else ()
+            self._player_store = PlayerStore(self.store, players_data, self.sequential_ids)
+        return self._player_store
+
+    def reload(self):
+        """
+        Oublie les données en mémoire pour forcer une nouvelle lecture du fichier.
+        """
+        self._data = None
+        self._tournaments = None
+        self._players_data = None
+        self._player_store = None
+
+
+def _as_registry(players_data):
+    if isinstance(players_data, list):
+        return {p_data["chess_id"]: p_data for p_data in players_data}
+    return players_data or {}
+
+
+def _merged_registry(tournaments_data, players_data):
+    players = {}
+    for t_data in tournaments_data:
+        _add_embedded_players(players, t_data)
+    players.update(_as_registry(players_data))
+    return players
+
+
+def _add_embedded_players(players, t_data):
+    # Les joueurs décrits en entier dans un tournoi (ancien format) complètent le registre enregistré,
+    # qui ne contient que les joueurs ajoutés ou modifiés depuis.
+    for p_data in t_data.get("players", []):
+        if "first_name" in p_data and p_data["chess_id"] not in players:
+            players[p_data["chess_id"]] = {key: value for key, value in p_data.items() if key != "score"}
+
+
+def _is_resolved(t_data, players):
+    return all(p_data["chess_id"] in players for p_data in t_data.get("players", []))
@@ -0,0 +1,200 @@
+"""
+Module pour l'écriture différée des tournois.
+
+Ce module contient la classe WriteBehindStore qui enveloppe un stockage : les événements et les
+sauvegardes complètes sont mis en attente en mémoire puis écrits par un fil d'exécution dédié, au
+plus une fois par intervalle. Enregistrer un résultat ne coûte donc plus qu'un ajout à une liste.
+Les écritures du stockage enveloppé restent atomiques (fichier temporaire, fsync puis os.replace pour
+l'instantané, ligne synchronisée pour le journal) : un arrêt brutal peut faire perdre les dernières
+modifications en attente, jamais corrompre le fichier.
+"""
+
+import atexit
+import threading
+from storage.base_store import BaseStore
+
+DEFAULT_FLUSH_INTERVAL = 0.2
+
+
+class WriteBehindStore(BaseStore):
+    """
+    Stockage à écriture différée.
+
+    Les événements reçus entre deux écritures sont regroupés dans un seul événement "batch" ; une
+    sauvegarde complète rend inutiles les événements qui la précèdent. L'écriture est forcée par flush
+    (fin de tour, pause) et par close, appelé automatiquement à la sortie du programme.
+
+    Attributes:
+        store (BaseStore): Le stockage enveloppé, dans lequel les modifications sont écrites.
+        flush_interval (float): Le délai maximal (en secondes) entre une modification et son écriture.
+        compact_every (int): Le nombre d'événements au-delà duquel une sauvegarde complète est demandée.
+        pending_events (int): Le nombre d'événements reçus depuis la dernière sauvegarde complète.
+    """
+
+    def __init__(self, store, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        Initialise le WriteBehindStore et démarre son fil d'écriture.
+
+        Args:
+            store (BaseStore): Le stockage à envelopper.
+            flush_interval (float): Le délai maximal (en secondes) entre une modification et son écriture.
+        """
+        self.store = store
+        self.flush_interval = flush_interval
+        self.compact_every = getattr(store, "compact_every", 500)
+        self.pending_events = 0
+        self._events = []
+        self._snapshot = None
+        self._error = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def exists(self):
+        """
+        Vérifie si des données ont été enregistrées ou sont en attente d'écriture.
+
+        Returns:
+            bool: True si des données existent, False sinon.
+        """
+        with self._condition:
+            if self._events or self._snapshot is not None:
+                return True
+        return self.store.exists()
+
+    def load(self):
+        """
+        Écrit les modifications en attente puis charge les données du stockage enveloppé.
+
+        Returns:
+            dict: Les données des tournois.
+        """
+        self.flush()
+        data = self.store.load()
+        self._sync_pending_events()
+        return data
+
+    def stream(self):
+        """
+        Écrit les modifications en attente puis parcourt les tournois du stockage enveloppé.
+
+        Yields:
+            tuple: ("players", registre des joueurs) ou ("tournament", dictionnaire d'un tournoi).
+        """
+        self.flush()
+        try:
+            yield from self.store.stream()
+        finally:
+            self._sync_pending_events()
+
+    def append(self, event):
+        """
+        Met un événement en attente d'écriture.
+
+        L'événement est conservé même si une écriture précédente a échoué : l'erreur est signalée, et
+        l'écriture de toutes les modifications en attente sera tentée de nouveau.
+
+        Args:
+            event (dict): L'événement à enregistrer.
+
+        Raises:
+            OSError: Si la dernière écriture du fil d'écriture a échoué.
+        """
+        with self._condition:
+            self._events.append(event)
+            self.pending_events += 1
+            self._condition.notify()
+        self._raise_error()
+
+    def needs_compaction(self):
+        """
+        Vérifie si assez d'événements ont été reçus pour justifier une sauvegarde complète.
+
+        Returns:
+            bool: True si une sauvegarde complète est nécessaire, False sinon.
+        """
+        return self.pending_events >= self.compact_every
+
+    def compact(self, data):
+        """
+        Met en attente une sauvegarde complète, qui remplace les événements encore non écrits.
+
+        Args:
+            data (dict): Les données complètes des tournois.
+
+        Raises:
+            OSError: Si la dernière écriture du fil d'écriture a échoué.
+        """
+        with self._condition:
+            self._snapshot = data
+            self._events = []
+            self.pending_events = 0
+            self._condition.notify()
+        self._raise_error()
+
+    def flush(self):
+        """
+        Écrit immédiatement les modifications en attente.
+        """
+        self._raise_error()
+        with self._write_lock:
+            self._write_pending()
+
+    def close(self):
+        """
+        Arrête le fil d'écriture après avoir écrit les modifications en attente.
+        """
+        self._stop.set()
+        with self._condition:
+            self._condition.notify()
+        self._thread.join()
+        atexit.unregister(self.close)
+        self.flush()
+
+    def _sync_pending_events(self):
+        # Les événements déjà présents dans le journal du stockage enveloppé comptent pour la prochaine
+        # compaction : après un redémarrage, un long journal est compacté sans attendre compact_every
+        # nouveaux événements.
+        with self._condition:
+            self.pending_events = max(self.pending_events, getattr(self.store, "pending_events", 0))
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._condition:
+                while not (self._events or self._snapshot is not None or self._stop.is_set()):
+                    self._condition.wait()
+            # Les modifications reçues pendant l'intervalle sont écrites ensemble.
+            self._stop.wait(self.flush_interval)
+            try:
+                with self._write_lock:
+                    self._write_pending()
+            except Exception as error:
+                # L'erreur est signalée au fil principal lors de la prochaine modification.
+                self._error = error
+
+    def _write_pending(self):
+        with self._condition:
+            snapshot, events = self._snapshot, self._events
+            self._snapshot, self._events = None, []
+        try:
+            if snapshot is not None:
+                self.store.compact(snapshot)
+                snapshot = None
+            if events:
+                self.store.append(events[0] if len(events) == 1 else {"type": "batch", "events": events})
+        except BaseException:
+            # Rien n'est perdu : les modifications non écrites sont remises en attente, sauf si une
+            # sauvegarde complète plus récente les a déjà remplacées.
+            with self._condition:
+                if self._snapshot is None:
+                    self._snapshot = snapshot
+                    self._events = events + self._events
+            raise
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
@@ -7,6 +7,12 @@ Ce module contient une fonction pour demander à l'utilisateur de saisir les dé
 import re
 from datetime import datetime
 
+# Même expression et même appel (re.match) que la validation d'origine, pour accepter exactement les mêmes noms.
+NAME_PATTERN = re.compile(r'^[a-zA-Z\s-]+$')
+# Un lot de noms séparés par des caractères nuls est valide d'un seul appel si chaque nom l'est (\s couvre le
+# retour à la ligne final que le $ de NAME_PATTERN tolère).
+_NAMES_PATTERN = re.compile(r'(?:[a-zA-Z\s-]+\x00)*')
+
 
 def validate_name(name):
     """
@@ -18,7 +24,26 @@ def validate_name(name):
     Returns:
         bool: True si le nom est valide, False sinon.
     """
-    return bool(re.match(r'^[a-zA-Z\s-]+$', name))
+    return NAME_PATTERN.match(name) is not None
+
+
+def find_invalid_names(names):
+    """
+    Valide un lot de noms avec les règles de validate_name.
+
+    Le lot entier est vérifié par une seule recherche ; les noms ne sont examinés un par un que si le
+    lot contient au moins un nom invalide.
+
+    Args:
+        names (list): Les noms à valider.
+
+    Returns:
+        list: Les positions des noms invalides dans le lot.
+    """
+    joined = "\x00".join(names) + "\x00"
+    if joined.count("\x00") == len(names) and _NAMES_PATTERN.fullmatch(joined):
+        return []
+    return [index for index, name in enumerate(names) if not validate_name(name)]
 
 
 def get_player_data(player_number):
@@ -57,3 +82,49 @@ def get_player_data(player_number):
             'last_name': last_name,
             'birth_date': birth_date
         }
+
+
+def get_roster_size():
+    """
+    Demande à l'utilisateur le nombre de joueurs du tournoi.
+
+    Returns:
+        int: Le nombre de joueurs, au moins 2.
+    """
+    while True:
+        text = input("Nombre de joueurs (2 ou plus): ").strip()
+        if text.isdigit() and int(text) >= 2:
+            return int(text)
+        print("Le nombre de joueurs doit être un entier supérieur ou égal à 2. Veuillez réessayer.")
+
+
+def get_player_query(player_number):
+    """
+    Demande à l'utilisateur le chess_id ou le nom d'un joueur déjà inscrit.
+
+    Args:
+        player_number (int): Le numéro du joueur dans le tournoi.
+
+    Returns:
+        str: Le chess_id ou le nom saisi, ou une chaîne vide pour saisir un nouveau joueur.
+    """
+    print(f"\n\033[1m\033[4mJoueur {player_number}:\033[0m\n")
+    return input("Chess ID ou nom d'un joueur inscrit (laisser vide pour un nouveau joueur): ").strip()
+
+
+def choose_player(players):
+    """
+    Affiche les joueurs correspondant à une recherche et demande lequel choisir.
+
+    Args:
+        players (list): Les joueurs trouvés.
+
+    Returns:
+        Player: Le joueur choisi, ou None pour revenir à la recherche.
+    """
+    for index, player in enumerate(players, start=1):
+        print(f"{index}. {player.first_name} {player.last_name} ({player.chess_id}, né le {player.birth_date})")
+    selection = input("Entrez le numéro du joueur (laisser vide pour une autre recherche): ").strip()
+    if selection.isdigit() and 1 <= int(selection) <= len(players):
+        return players[int(selection) - 1]
+    return None
@@ -0,0 +1,119 @@
+"""
+Module des écrivains de rapports.
+
+Ce module contient les écrivains qui reçoivent les morceaux de texte d'un rapport déjà mis en forme
+(voir views.report_view) et les écrivent d'un seul appel à writelines : TerminalSink pour le terminal,
+TextSink pour un fichier texte et HtmlSink pour un fichier HTML, dans lequel le texte est échappé.
+"""
+
+import html
+import sys
+
+HTML_HEADER = """<html>
+<head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        pre { background-color: #f4f4f4; padding: 10px; border-radius: 5px; }
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <pre>"""
+HTML_FOOTER = """</pre>
+</body>
+</html>
+"""
+
+
+class Strong(str):
+    """
+    Morceau de texte mis en évidence : en gras dans le terminal, entre balises <strong> en HTML.
+    """
+    __slots__ = ()
+
+
+class TerminalSink:
+    """
+    Écrit les rapports dans le terminal, avec ou sans mise en forme.
+    """
+
+    def __init__(self, stream=None, styled=True):
+        """
+        Initialise le TerminalSink.
+
+        Args:
+            stream (TextIO): Le flux de sortie. Par défaut, la sortie standard au moment de l'écriture.
+            styled (bool): Indique si les morceaux Strong sont affichés en gras.
+        """
+        self.stream = stream
+        self.styled = styled
+
+    def write(self, chunks):
+        """
+        Écrit les morceaux de texte d'un rapport.
+
+        Args:
+            chunks (list): Les morceaux de texte du rapport.
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        if self.styled:
+            chunks = (f"\033[1m{chunk}\033[0m" if type(chunk) is Strong else chunk for chunk in chunks)
+        stream.writelines(chunks)
+
+
+class TextSink:
+    """
+    Écrit les rapports dans un fichier texte, sans mise en forme.
+    """
+
+    def __init__(self, file):
+        """
+        Initialise le TextSink.
+
+        Args:
+            file (TextIO): Le fichier texte, ouvert en écriture.
+        """
+        self.file = file
+
+    def write(self, chunks):
+        """
+        Écrit les morceaux de texte d'un rapport.
+
+        Args:
+            chunks (list): Les morceaux de texte du rapport.
+        """
+        self.file.writelines(chunks)
+
+
+class HtmlSink:
+    """
+    Écrit les rapports dans un fichier HTML ; les noms et les autres textes sont échappés.
+    """
+
+    def __init__(self, file, title="Rapport"):
+        """
+        Initialise le HtmlSink.
+
+        Args:
+            file (TextIO): Le fichier HTML, ouvert en écriture.
+            title (str): Le titre de la page.
+        """
+        self.file = file
+        self.title = title
+
+    def write(self, chunks):
+        """
+        Écrit une page HTML contenant les morceaux de texte d'un rapport.
+
+        Args:
+            chunks (list): Les morceaux de texte du rapport.
+        """
+        self.file.write(HTML_HEADER.replace("{title}", html.escape(self.title)))
+        self.file.writelines(
+            f"<strong>{html.escape(chunk)}</strong>" if type(chunk) is Strong else html.escape(chunk)
+            for chunk in chunks
+        )
+        self.file.write(HTML_FOOTER)
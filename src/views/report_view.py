@@ -1,7 +1,123 @@
 """
 Module de vue pour afficher les rapports des tournois et des joueurs.
+
+Chaque rapport est d'abord mis en forme une seule fois par une fonction render_*, qui retourne la liste
+des morceaux de texte du rapport ; les titres sont des morceaux Strong. Ces morceaux sont ensuite écrits
+tels quels par un des écrivains du module views.report_sinks : le terminal, un fichier texte ou un
+fichier HTML. Les fonctions display_* affichent un rapport dans le terminal.
 """
 
+from models.match import displayed_score
+from models.player import SORT_KEY
+from views.report_sinks import Strong, TerminalSink
+
+# Version de la mise en forme des rapports, à incrémenter à chaque modification des fonctions render_* ou
+# des écrivains de report_sinks : les rapports déjà exportés sont alors tous régénérés.
+REPORT_VERSION = 3
+RULE = "=" * 40 + "\n"
+SEPARATOR = "-" * 40 + "\n"
+
+
+def render_all_players_alphabetically(players):
+    """
+    Met en forme la liste de tous les joueurs par ordre alphabétique.
+
+    Les joueurs sont triés d'après leur clé Player.sort_key ; une liste déjà triée, comme celle de
+    UserManager.get_sorted_players, n'est parcourue qu'une fois.
+
+    Args:
+        players (list): Liste des objets Player.
+
+    Returns:
+        list: Les morceaux de texte du rapport.
+    """
+    chunks = ["\n", RULE, Strong("Liste de tous les joueurs par ordre alphabétique"), "\n", RULE]
+    chunks.extend(_player_lines(sorted(players, key=SORT_KEY)))
+    chunks.append(RULE + "\n")
+    return chunks
+
+
+def render_all_tournaments(tournaments):
+    """
+    Met en forme la liste de tous les tournois.
+
+    Args:
+        tournaments (list): Liste des objets Tournament.
+
+    Returns:
+        list: Les morceaux de texte du rapport.
+    """
+    chunks = ["\n", RULE, Strong("Liste de tous les tournois"), "\n", RULE]
+    for tournament in tournaments:
+        chunks += [Strong(f"- {tournament.name}"), f" - {tournament.location}\n",
+                   f"  Du {tournament.start_date} au {tournament.end_date}\n", SEPARATOR]
+    chunks.append(RULE + "\n")
+    return chunks
+
+
+def render_tournament_details(tournament):
+    """
+    Met en forme les détails d'un tournoi spécifique.
+
+    Args:
+        tournament (Tournament): Un objet Tournament.
+
+    Returns:
+        list: Les morceaux de texte du rapport.
+    """
+    chunks = [
+        "\n", RULE,
+        Strong("Nom du Tournoi:"), f" {tournament.name}\n",
+        Strong("Lieu:"), f" {tournament.location}\n",
+        Strong("Dates:"), f" Du {tournament.start_date} au {tournament.end_date}\n",
+        Strong("Nombre de tours prévus:"), f" {tournament.number_of_rounds}\n",
+        Strong("Description:"), f" {tournament.description}\n",
+        Strong("Liste des joueurs:"), "\n",
+    ]
+    chunks.extend(_player_lines(tournament.get_sorted_players()))
+    chunks.append(RULE + "\n")
+    return chunks
+
+
+def render_tournament_players_alphabetically(tournament):
+    """
+    Met en forme la liste des joueurs d'un tournoi par ordre alphabétique.
+
+    Args:
+        tournament (Tournament): Un objet Tournament.
+
+    Returns:
+        list: Les morceaux de texte du rapport.
+    """
+    chunks = ["\n", RULE, Strong(f"Liste des joueurs du tournoi {tournament.name} par ordre alphabétique"), "\n",
+              RULE]
+    chunks.extend(_player_lines(tournament.get_sorted_players()))
+    chunks.append(RULE + "\n")
+    return chunks
+
+
+def render_tournament_rounds_and_matches(tournament):
+    """
+    Met en forme tous les tours et matchs d'un tournoi.
+
+    Args:
+        tournament (Tournament): Un objet Tournament.
+
+    Returns:
+        list: Les morceaux de texte du rapport.
+    """
+    chunks = ["\n", RULE, Strong(f"Rapport des tours et matchs pour le tournoi: {tournament.name}"), "\n", RULE]
+    for round in tournament.rounds:
+        chunks += ["\n", SEPARATOR, Strong(f"Tour: {round.name}"), "\n", SEPARATOR]
+        for match in round.matches:
+            white, black = match.players
+            chunks.append(f"- {white.first_name} {white.last_name} vs {black.first_name} {black.last_name}"
+                          f" - Score: {displayed_score(match.score)}\n")
+        if round.bye:
+            chunks.append(f"- Exempt: {round.bye.first_name} {round.bye.last_name}\n")
+    chunks.append(RULE + "\n")
+    return chunks
+
 
 def display_all_players_alphabetically(players, styled=True):
     """
@@ -11,14 +127,7 @@ def display_all_players_alphabetically(players, styled=True):
         players (list): Liste des objets Player.
         styled (bool): Indique si le texte doit être stylisé pour le terminal.
     """
-    bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
-
-    print("\n" + "=" * 40)
-    print(f"{bold_start}Liste de tous les joueurs par ordre alphabétique{bold_end}")
-    print("=" * 40)
-    for player in sorted(players, key=lambda x: (x.first_name, x.last_name)):
-        print(f"- {player.first_name} {player.last_name}")
-    print("=" * 40 + "\n")
+    TerminalSink(styled=styled).write(render_all_players_alphabetically(players))
 
 
 def display_all_tournaments(tournaments, styled=True):
@@ -29,16 +138,7 @@ def display_all_tournaments(tournaments, styled=True):
         tournaments (list): Liste des objets Tournament.
         styled (bool): Indique si le texte doit être stylisé pour le terminal.
     """
-    bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
-
-    print("\n" + "=" * 40)
-    print(f"{bold_start}Liste de tous les tournois{bold_end}")
-    print("=" * 40)
-    for tournament in tournaments:
-        print(f"{bold_start}- {tournament.name}{bold_end} - {tournament.location}")
-        print(f"  Du {tournament.start_date} au {tournament.end_date}")
-        print("-" * 40)
-    print("=" * 40 + "\n")
+    TerminalSink(styled=styled).write(render_all_tournaments(tournaments))
 
 
 def display_tournament_details(tournament, styled=True):
@@ -49,18 +149,7 @@ def display_tournament_details(tournament, styled=True):
         tournament (Tournament): Un objet Tournament.
         styled (bool): Indique si le texte doit être stylisé pour le terminal.
     """
-    bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
-
-    print("\n" + "=" * 40)
-    print(f"{bold_start}Nom du Tournoi:{bold_end} {tournament.name}")
-    print(f"{bold_start}Lieu:{bold_end} {tournament.location}")
-    print(f"{bold_start}Dates:{bold_end} Du {tournament.start_date} au {tournament.end_date}")
-    print(f"{bold_start}Nombre de tours prévus:{bold_end} {tournament.number_of_rounds}")
-    print(f"{bold_start}Description:{bold_end} {tournament.description}")
-    print(f"{bold_start}Liste des joueurs:{bold_end}")
-    for player in sorted(tournament.players, key=lambda x: (x.first_name, x.last_name)):
-        print(f"- {player.first_name} {player.last_name}")
-    print("=" * 40 + "\n")
+    TerminalSink(styled=styled).write(render_tournament_details(tournament))
 
 
 def display_tournament_players_alphabetically(tournament, styled=True):
@@ -71,15 +160,7 @@ def display_tournament_players_alphabetically(tournament, styled=True):
         tournament (Tournament): Un objet Tournament.
         styled (bool): Indique si le texte doit être stylisé pour le terminal.
     """
-    bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
-
-    print("\n" + "=" * 40)
-    print(f"{bold_start}Liste des joueurs du tournoi {tournament.name} par ordre alphabétique{bold_end}")
-    print("=" * 40)
-    sorted_players = sorted(tournament.players, key=lambda x: (x.first_name, x.last_name))
-    for player in sorted_players:
-        print(f"- {player.first_name} {player.last_name}")
-    print("=" * 40 + "\n")
+    TerminalSink(styled=styled).write(render_tournament_players_alphabetically(tournament))
 
 
 def display_tournament_rounds_and_matches(tournament, styled=True):
@@ -90,16 +171,8 @@ def display_tournament_rounds_and_matches(tournament, styled=True):
         tournament (Tournament): Un objet Tournament.
         styled (bool): Indique si le texte doit être stylisé pour le terminal.
     """
-    bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
+    TerminalSink(styled=styled).write(render_tournament_rounds_and_matches(tournament))
 
-    print("\n" + "=" * 40)
-    print(f"{bold_start}Rapport des tours et matchs pour le tournoi: {tournament.name}{bold_end}")
-    print("=" * 40)
-    for round in tournament.rounds:
-        print("\n" + "-" * 40)
-        print(f"{bold_start}Tour: {round.name}{bold_end}")
-        print("-" * 40)
-        for match in round.matches:
-            print(f"- {match.players[0].first_name} {match.players[0].last_name} vs {
-                  match.players[1].first_name} {match.players[1].last_name} - Score: {match.score}")
-    print("=" * 40 + "\n")
+
+def _player_lines(players):
+    return [f"- {player.first_name} {player.last_name}\n" for player in players]
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from models.match import NOT_PLAYED, WHITE_WINS, BLACK_WINS, DRAW, displayed_score
 
 """
 Module de vue pour afficher les informations des tournois, des tours et des scores.
@@ -15,7 +16,7 @@ def display_tournament_details(tournament, styled=True):
     print(f"{bold_start}Nombre de tours prévus:{bold_end} {tournament.number_of_rounds}")
     print(f"{bold_start}Description:{bold_end} {tournament.description}")
     print(f"{bold_start}Liste des joueurs:{bold_end}")
-    for player in sorted(tournament.players, key=lambda x: (x.first_name, x.last_name)):
+    for player in tournament.get_sorted_players():
         print(f"- {player.first_name} {player.last_name}")
     print("=" * 40 + "\n")
 
@@ -48,16 +49,17 @@ def display_match_result(match, tournament_manager):
     choice = input("Entrez votre choix (1, 2, 3, ou 4) : ")
 
     if choice == '1':
-        match.score = (0.5, 0.5)
+        match.score = DRAW
         print(f"{yellow_start}Égalité, chaque joueur remporte 0,5 point.{yellow_end}")
     elif choice == '2':
-        match.score = (1, 0)
+        match.score = WHITE_WINS
         print(f"{green_start}{player1.first_name} {player1.last_name} remporte la partie, gagne un point.{green_end}")
     elif choice == '3':
-        match.score = (0, 1)
+        match.score = BLACK_WINS
         print(f"{green_start}{player2.first_name} {player2.last_name} remporte la partie, gagne un point.{green_end}")
     elif choice == '4':
         tournament_manager.save_tournaments()
+        tournament_manager.flush()
         print(f"{red_start}Tournoi mis en pause et sauvegardé. À bientôt!{red_end}")
         exit(0)
     else:
@@ -86,12 +88,15 @@ def display_round_details(round, tournament_manager, current_match=None, styled=
         player2 = match.players[1]
         if match == current_match:
             display_match_result(match, tournament_manager)
-        elif match.score != (0.0, 0.0):
+        elif match.score != NOT_PLAYED:
             print(f"Match: {player1.first_name} {player1.last_name} vs {player2.first_name} {player2.last_name}")
-            print(f"Résultat: {match.score[0]} - {match.score[1]}")
+            white, black = displayed_score(match.score)
+            print(f"Résultat: {white} - {black}")
         else:
             print(f"Match à venir: {player1.first_name} {player1.last_name} vs {
                   player2.first_name} {player2.last_name}")
+    if round.bye:
+        print(f"Exempt: {round.bye.first_name} {round.bye.last_name} (1 point)")
 
     print("-" * 40 + "\n")
 
@@ -100,9 +105,12 @@ def display_final_scores(tournament, styled=True):
     bold_start, bold_end = ("\033[1m", "\033[0m") if styled else ("", "")
     print("\n" + "=" * 40)
     print(f"{bold_start}=== Résultats Finaux ==={bold_end}")
-    final_scores = sorted(tournament.players, key=lambda p: p.score, reverse=True)
-    for player in final_scores:
-        print(f"{player.first_name} {player.last_name}: {player.score} points")
+    players = {player.chess_id: player for player in tournament.players}
+    for rank, (chess_id, points, buchholz, sonneborn_berger) in enumerate(
+            tournament.get_standings().top(len(players)), start=1):
+        player = players[chess_id]
+        print(f"{rank}. {player.first_name} {player.last_name}: {points} points "
+              f"(Buchholz {buchholz}, Sonneborn-Berger {sonneborn_berger})")
     print("=" * 40 + "\n")
 
 
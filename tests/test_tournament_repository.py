@@ -0,0 +1,77 @@
+"""
+Tests de non-régression du dépôt des tournois.
+
+Usage :
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from controllers.tournament_manager import TournamentManager  # noqa: E402
+from storage.tournament_repository import TournamentRepository  # noqa: E402
+
+LEGACY_SNAPSHOT = Path(__file__).resolve().parent.parent / "src" / "data" / "tournaments.json"
+
+
+class LegacySnapshotTest(unittest.TestCase):
+    """
+    Un instantané sans registre "players" (ancien format), suivi d'un tournoi qui référence ses joueurs.
+    """
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.path = self.directory / "tournaments.json"
+        shutil.copy(LEGACY_SNAPSHOT, self.path)
+        repository = TournamentRepository(self.path, lazy=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            TournamentManager(self.path, repository).add_tournament({
+                "name": "Test Odd",
+                "location": "Paris",
+                "start_date": "2026-01-01",
+                "end_date": "2026-01-02",
+                "description": "",
+                "number_of_rounds": 3,
+                "players": [
+                    {"chess_id": "AB12345"},
+                    {"chess_id": "CD67890"},
+                    {"first_name": "Ana", "last_name": "Martin", "birth_date": "2000-01-01", "chess_id": "ZZ00001"}
+                ]
+            })
+        repository.store.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assert_players_resolved(self, tournaments):
+        tournament = next(t for t in tournaments if t.name == "Test Odd")
+        self.assertEqual(sorted(p.chess_id for p in tournament.players), ["AB12345", "CD67890", "ZZ00001"])
+        self.assertEqual({p.first_name for p in tournament.players}, {"John", "Jane", "Ana"})
+
+    def test_reload_streamed(self):
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                self.assert_players_resolved(TournamentRepository(self.path, lazy=lazy).get_tournaments())
+
+    def test_reload_loaded(self):
+        repository = TournamentRepository(self.path)
+        repository.load_data()
+        self.assert_players_resolved(repository.get_tournaments())
+
+    def test_reload_iterated(self):
+        self.assert_players_resolved(TournamentRepository(self.path).iter_tournaments())
+
+    def test_players_data(self):
+        chess_ids = {p_data["chess_id"] for p_data in TournamentRepository(self.path).get_players_data()}
+        self.assertTrue({"AB12345", "CD67890", "ZZ00001"} <= chess_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()